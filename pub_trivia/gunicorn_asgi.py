@@ -0,0 +1,22 @@
+"""
+Gunicorn settings for serving the ASGI application with uvicorn workers.
+
+    gunicorn -c pub_trivia/gunicorn_asgi.py pub_trivia.asgi:application
+
+Each worker runs an event loop, so devices waiting on a poll or an event
+stream don't tie up a worker the way they do with the default sync
+workers. The workers switch on the async poll views and the event stream.
+"""
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn_worker.UvicornWorker"
+# Keep polling phones' connections open between polls
+keepalive = 30
+
+raw_env = [
+    "SESSION_ASYNC_VIEWS=True",
+    "SESSION_EVENT_STREAM_ENABLED=True",
+]
@@ -216,6 +216,15 @@ else:
         }
     }
 
+# Live session event stream (Server-Sent Events)
+# Only enable under an ASGI server: with sync workers every open stream pins a worker.
+SESSION_EVENT_STREAM_ENABLED = os.getenv("SESSION_EVENT_STREAM_ENABLED") == "True"
+
+# Route the polled session endpoints (state, leaderboard, team answers and
+# question details) to their async views. Enable under an ASGI server, where
+# a waiting poll doesn't hold a worker; under WSGI the sync views are faster.
+SESSION_ASYNC_VIEWS = os.getenv("SESSION_ASYNC_VIEWS") == "True"
+
 # Rate limiting configuration
 # Disable rate limiting in DEBUG mode or when running tests
 TESTING = "test" in sys.argv
@@ -223,6 +232,19 @@ RATELIMIT_ENABLE = not DEBUG and not TESTING
 RATELIMIT_USE_CACHE = "default"
 RATELIMIT_VIEW = "quiz.session_api.ratelimit_error"
 
+# Token-bucket limits of live session endpoints, keyed by team/admin token
+# (quiz.rate_limits). Override per endpoint class as
+# {"team_answer": (capacity, tokens refilled per second), ...}.
+SESSION_RATE_LIMITS = {}
+
+# Similarity cut-offs of the scoring UI's point suggestions (quiz.suggestions),
+# e.g. {"accept": 0.8, "reject": 0.3}. Between them the host decides.
+SCORING_SUGGESTION_THRESHOLDS = {}
+
+# Point tiers of Estimation questions (quiz.scoring.EstimationScorer), e.g.
+# {"closest": 3, "within_percent": 5}. Shares are of the question's points.
+ESTIMATION_TIERS = {}
+
 
 # Authentication backends
 AUTHENTICATION_BACKENDS = [
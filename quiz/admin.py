@@ -12,11 +12,13 @@ from .models import (
     QuestionType,
     QuestionRound,
     GameSession,
+    SessionEvent,
     SessionTeam,
     SessionRound,
     TeamAnswer,
     UserProfile,
 )
+from . import heartbeats, session_cache, session_progress, standings
 from .widgets import S3ImageUploadWidget, S3VideoUploadWidget
 
 # ============================================================================
@@ -435,15 +437,21 @@ class SessionTeamInline(admin.TabularInline):
         "score",
         "joined_at",
         "joined_late",
-        "last_seen",
+        "team_last_seen",
     )
-    readonly_fields = ("token", "joined_at", "last_seen")
+    readonly_fields = ("token", "joined_at", "team_last_seen")
     can_delete = False
 
     def has_add_permission(self, request, obj=None):
         # Don't allow adding teams through admin (should use API)
         return False
 
+    def team_last_seen(self, obj):
+        """Display last seen, including heartbeats not flushed to the DB yet"""
+        return heartbeats.team_seen(obj)
+
+    team_last_seen.short_description = "Last seen"
+
 
 class SessionRoundInline(admin.TabularInline):
     """Inline display of rounds within a game session"""
@@ -507,7 +515,7 @@ class GameSessionAdmin(admin.ModelAdmin):
         "created_at",
         "started_at",
         "completed_at",
-        "admin_last_seen",
+        "host_last_seen",
         "display_admin_token",
     )
     fieldsets = (
@@ -550,7 +558,7 @@ class GameSessionAdmin(admin.ModelAdmin):
                     "created_at",
                     "started_at",
                     "completed_at",
-                    "admin_last_seen",
+                    "host_last_seen",
                 ),
                 "classes": ("collapse",),
             },
@@ -568,6 +576,12 @@ class GameSessionAdmin(admin.ModelAdmin):
 
     team_count.short_description = "Teams"
 
+    def host_last_seen(self, obj):
+        """Display host last seen, including heartbeats not flushed to the DB yet"""
+        return heartbeats.admin_seen(obj)
+
+    host_last_seen.short_description = "Admin last seen"
+
     def display_admin_token(self, obj):
         """Display admin token with copy button"""
         if obj.admin_token:
@@ -591,6 +605,10 @@ class GameSessionAdmin(admin.ModelAdmin):
                 session.status = GameSession.Status.COMPLETED
                 session.completed_at = timezone.now()
                 session.save()
+                session.record_event(
+                    SessionEvent.Kind.GAME_COMPLETED, {"status": session.status}
+                )
+                session_cache.forget_session_tokens(session)
                 count += 1
 
         self.message_user(request, f"{count} session(s) marked as completed.")
@@ -598,20 +616,10 @@ class GameSessionAdmin(admin.ModelAdmin):
     end_session.short_description = "End selected sessions"
 
     def recalculate_team_scores(self, request, queryset):
-        """Recalculate all team scores for selected sessions"""
-        from django.db.models import Sum
-
-        count = 0
+        """Rebuild score totals and answer counters for selected sessions from the DB"""
+        count = standings.repair(queryset)
         for session in queryset:
-            for team in session.teams.all():
-                team.score = (
-                    team.answers.filter(points_awarded__isnull=False).aggregate(
-                        total=Sum("points_awarded")
-                    )["total"]
-                    or 0
-                )
-                team.save()
-                count += 1
+            session_progress.rebuild(session)
 
         self.message_user(request, f"Recalculated scores for {count} team(s).")
 
@@ -651,7 +659,7 @@ class SessionTeamAdmin(admin.ModelAdmin):
     )
     list_filter = ("joined_late", "session__game", "session__status")
     search_fields = ("name", "session__code", "session__game__name")
-    readonly_fields = ("token", "joined_at", "last_seen", "display_token")
+    readonly_fields = ("token", "joined_at", "team_last_seen", "display_token")
     fieldsets = (
         (
             "Team Info",
@@ -669,7 +677,7 @@ class SessionTeamAdmin(admin.ModelAdmin):
                 "fields": (
                     "joined_late",
                     "joined_at",
-                    "last_seen",
+                    "team_last_seen",
                 )
             },
         ),
@@ -698,6 +706,12 @@ class SessionTeamAdmin(admin.ModelAdmin):
 
     answer_count.short_description = "Answers"
 
+    def team_last_seen(self, obj):
+        """Display last seen, including heartbeats not flushed to the DB yet"""
+        return heartbeats.team_seen(obj)
+
+    team_last_seen.short_description = "Last seen"
+
     def display_token(self, obj):
         """Display team token with copy button"""
         if obj.token:
@@ -881,8 +895,30 @@ class TeamAnswerAdmin(admin.ModelAdmin):
     answer_preview.short_description = "Answer"
 
 
+class SessionEventAdmin(admin.ModelAdmin):
+    """Read-only view of the per-session event log"""
+
+    list_display = ("session_code", "seq", "kind", "created_at")
+    list_filter = ("kind",)
+    search_fields = ("session__code",)
+    readonly_fields = ("session", "seq", "kind", "payload", "created_at")
+    ordering = ["-session__created_at", "seq"]
+
+    def session_code(self, obj):
+        """Display session code"""
+        return obj.session.code
+
+    session_code.short_description = "Session"
+    session_code.admin_order_field = "session__code"
+
+    def has_add_permission(self, request):
+        # The log is append-only and written by the session lifecycle
+        return False
+
+
 # Register session models
 admin.site.register(GameSession, GameSessionAdmin)
 admin.site.register(SessionTeam, SessionTeamAdmin)
 admin.site.register(SessionRound, SessionRoundAdmin)
 admin.site.register(TeamAnswer, TeamAnswerAdmin)
+admin.site.register(SessionEvent, SessionEventAdmin)
@@ -0,0 +1,89 @@
+"""
+Groups of identical team answers, so the host scores each distinct answer once.
+
+Answers are compared after normalize(): accents stripped, case folded,
+punctuation dropped and whitespace collapsed, so "Beyoncé", "beyonce" and
+" BEYONCE! " land in one cluster. Clusters are formed per question, and per
+part for multi-part questions. admin_get_scoring_data returns them with
+?group=clusters, and admin_score_cluster applies one score to a whole
+cluster.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+
+from .models import TeamAnswer
+
+
+def normalize(text: str | None) -> str:
+    """The form answers are compared in."""
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    kept = []
+    for char in decomposed:
+        category = unicodedata.category(char)
+        if category == "Mn":  # combining accents
+            continue
+        # Punctuation and symbols separate words rather than vanish: "A-ha".
+        kept.append(" " if category[0] in "PS" else char)
+    return " ".join("".join(kept).casefold().split())
+
+
+def member_of(answer: TeamAnswer, key: str) -> bool:
+    return normalize(answer.answer_text) == key
+
+
+def build(
+    answers: list[TeamAnswer], max_points: dict, suggested: dict | None = None
+) -> list[dict]:
+    """Clusters of one question's answers.
+
+    `answers` are the question's TeamAnswer rows; `max_points` maps each
+    answer_part_id (None for whole-question answers) to the points available.
+    Clusters are ordered by part, then largest first. A cluster's
+    points_awarded is set only when every member has the same score.
+    `suggested` maps TeamAnswer ids to suggestions.suggest() entries; all
+    members share one since they share the normalized text.
+    """
+    suggested = suggested or {}
+    groups: dict[tuple, list[TeamAnswer]] = {}
+    for answer in sorted(answers, key=lambda a: a.team_id):
+        key = (answer.answer_part_id, normalize(answer.answer_text))
+        groups.setdefault(key, []).append(answer)
+
+    part_order = {part_id: index for index, part_id in enumerate(max_points)}
+    clusters = []
+    for (part_id, key), members in groups.items():
+        texts: dict[str, int] = {}
+        for answer in members:
+            texts[answer.answer_text] = texts.get(answer.answer_text, 0) + 1
+        points = {answer.points_awarded for answer in members}
+        is_scored = None not in points
+        suggestion = suggested.get(members[0].id, {})
+        clusters.append(
+            {
+                "answer_part_id": part_id,
+                "key": key,
+                # The spelling most teams used, first team on ties
+                "answer_text": max(texts, key=texts.get),
+                "variants": sorted(texts),
+                "team_ids": [answer.team_id for answer in members],
+                "team_answer_ids": [answer.id for answer in members],
+                "count": len(members),
+                "points_awarded": points.pop() if len(points) == 1 else None,
+                "is_scored": is_scored,
+                "max_points": max_points.get(part_id, 0),
+                "suggested_points": suggestion.get("suggested_points"),
+                "suggestion_confidence": suggestion.get("confidence"),
+            }
+        )
+    clusters.sort(
+        key=lambda c: (
+            part_order.get(c["answer_part_id"], len(part_order)),
+            -c["count"],
+            c["key"],
+        )
+    )
+    return clusters
@@ -0,0 +1,224 @@
+"""
+Write-behind buffer for answer autosaves.
+
+play.html autosaves the answer being typed after every pause in typing.
+Those saves (draft=true) now land in the cache as the latest text per
+(team, question) plus a dirty flag. They reach TeamAnswer when a flush
+runs:
+
+  - at most once per FLUSH_INTERVAL per session, triggered by autosaves
+  - periodically from the flush_answer_drafts command, for drafts typed
+    after the last autosave-triggered flush
+  - always at the start of SessionDirector.lock_round
+
+team_get_answers doesn't flush; it overlays the buffered drafts on the
+stored answers. Once the round has left ACTIVE, pending drafts are dropped
+instead of written: lock_round already locked in everything flushed before
+it, and anything typed later came too late.
+
+An explicit submit writes straight to TeamAnswer and discards the draft,
+as does each answer of an answers-batch request. A draft is written with
+the time it was saved and never replaces an answer updated after that, so
+a flush that read a draft just before a submit can't undo the submit. The
+ids of a team's answers-batches are kept here too, claimed with an atomic
+cache.add, so a retried batch is not reapplied, whichever of the team's
+devices sent it.
+
+A dirty flag holds its draft's save time and is cleared only once the
+flush's transaction commits, and only if no newer save came in meanwhile.
+A flush rolled back with lock_round, or cut short by a dying worker,
+leaves its drafts pending. lock_round doesn't rely on the flags at all: it
+writes every buffered draft, and the save-time guard skips the ones
+already written. With Redis as the cache backend, drafts outlive worker
+restarts, and Redis restarts too as long as it persists its data
+(docker-compose.yml runs it with an append-only file); drafts typed since
+the last flush are lost otherwise. The local memory cache is per process
+and only suits development.
+"""
+
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from . import session_content, session_progress
+from .models import GameSession, SessionEvent, SessionRound, TeamAnswer
+
+DRAFT_KEY = "team:{team_id}:question:{question_id}:draft"
+DIRTY_KEY = "team:{team_id}:question:{question_id}:draft_dirty"
+BATCH_KEY = "team:{team_id}:answers_batch:{batch_id}"
+FLUSH_KEY = "session:{code}:draft_flush"
+FLUSH_INTERVAL = 15  # Seconds between autosave-triggered flushes per session
+DRAFT_TIMEOUT = 60 * 60 * 12
+# An unfinished claim is freed after this long, so a batch whose worker
+# died mid-request can be retried. Longer than any request may run.
+BATCH_CLAIM_TIMEOUT = 60
+
+
+def draft_key(team_id: int, question_id: int) -> str:
+    return DRAFT_KEY.format(team_id=team_id, question_id=question_id)
+
+
+def dirty_key(team_id: int, question_id: int) -> str:
+    return DIRTY_KEY.format(team_id=team_id, question_id=question_id)
+
+
+def save(
+    session: GameSession,
+    team_id: int,
+    question_id: int,
+    session_round_id: int,
+    text: str,
+) -> None:
+    """Buffer a team's latest text for a question."""
+    saved_at = timezone.now()
+    cache.set(
+        draft_key(team_id, question_id),
+        {"text": text, "session_round_id": session_round_id, "saved_at": saved_at},
+        DRAFT_TIMEOUT,
+    )
+    cache.set(dirty_key(team_id, question_id), saved_at, DRAFT_TIMEOUT)
+
+    # Round progress is read from the counters, so it follows drafts live;
+    # only a change between empty and non-empty is an event.
+    if session_progress.record_submission(
+        session.code, question_id, team_id, bool(text)
+    ):
+        session.record_event(
+            SessionEvent.Kind.ANSWER_SUBMITTED,
+            {"team_id": team_id, "question_id": question_id, "has_answer": bool(text)},
+            state_changed=True,
+        )
+    _maybe_flush(session)
+
+
+def discard(team_id: int, question_id: int) -> None:
+    """Drop a buffered draft, e.g. because newer text is being saved directly."""
+    cache.delete_many(
+        [dirty_key(team_id, question_id), draft_key(team_id, question_id)]
+    )
+
+
+def buffered(team_ids: list[int], question_ids: list[int]) -> dict[tuple, dict]:
+    """Buffered drafts ({"text", "saved_at", ...}) by (team_id, question_id).
+    One cache round trip.
+
+    A draft stays buffered after it is flushed, so it is never older than
+    the row in TeamAnswer.
+    """
+    keys = {
+        draft_key(team_id, question_id): (team_id, question_id)
+        for team_id in team_ids
+        for question_id in question_ids
+    }
+    return {keys[key]: draft for key, draft in cache.get_many(keys).items()}
+
+
+def flush(session: GameSession, all_drafts: bool = False) -> int:
+    """Write buffered drafts of the current round to TeamAnswer.
+
+    Covers every team of the session: the drafts flagged dirty, or with
+    `all_drafts` every buffered one (lock_round). Costs two cache round
+    trips when nothing is pending, plus one multi-row upsert
+    (TeamAnswer.submit_texts) for all pending drafts together. Drafts for
+    locked answers, or for a round that is no longer ACTIVE, are dropped.
+    Returns the number written.
+    """
+    if session.current_round_id is None:
+        return 0
+    questions = session_content.for_session(session).round_questions(
+        session.current_round_id
+    )
+    team_ids = list(session.teams.values_list("id", flat=True))
+    keys = [(team_id, q["id"]) for team_id in team_ids for q in questions]
+    if all_drafts:
+        pending = keys
+    else:
+        flags = cache.get_many([dirty_key(*key) for key in keys])
+        pending = [key for key in keys if dirty_key(*key) in flags]
+    stored = cache.get_many([draft_key(*key) for key in pending])
+    drafts = {
+        key: stored[draft_key(*key)] for key in pending if draft_key(*key) in stored
+    }
+    if not drafts:
+        return 0
+
+    with transaction.atomic():
+        # lock_round holds this row until it commits, so a flush racing it
+        # waits and then sees the round locked.
+        active = SessionRound.objects.select_for_update().filter(
+            session=session,
+            round_id=session.current_round_id,
+            status=SessionRound.Status.ACTIVE,
+        )
+        if not list(active.values_list("id", flat=True)):
+            cache.delete_many(
+                [dirty_key(*key) for key in drafts]
+                + [draft_key(*key) for key in drafts]
+            )
+            return 0
+
+        written = TeamAnswer.submit_texts(
+            [
+                (team_id, question_id, draft["session_round_id"], draft["text"])
+                for (team_id, question_id), draft in drafts.items()
+            ],
+            as_of={key: draft["saved_at"] for key, draft in drafts.items()},
+        )
+        # Flags go once the rows are committed; if the transaction (e.g.
+        # lock_round's) rolls back, they stay for the next flush.
+        transaction.on_commit(lambda: _clear_flags(drafts))
+    created: dict[int, int] = {}
+    for (_, question_id), (_, was_created) in written.items():
+        created[question_id] = created.get(question_id, 0) + was_created
+    session_progress.add_unscored(session.code, created)
+    return len(written)
+
+
+def _clear_flags(flushed: dict[tuple, dict]) -> None:
+    # A flag holds its draft's saved_at; a newer save keeps its flag.
+    flags = cache.get_many([dirty_key(*key) for key in flushed])
+    cache.delete_many(
+        [
+            dirty_key(*key)
+            for key, draft in flushed.items()
+            if flags.get(dirty_key(*key), draft["saved_at"]) <= draft["saved_at"]
+        ]
+    )
+
+
+BATCH_APPLYING = "applying"
+BATCH_APPLIED = "applied"
+
+
+def claim_batch(team_id: int, batch_id: str) -> bool:
+    """Reserve an answers-batch id for a team, atomically.
+
+    False if the id was already claimed: the batch is being applied or
+    has been. See batch_applied. The claim lapses after
+    BATCH_CLAIM_TIMEOUT unless mark_batch_applied makes it permanent.
+    """
+    key = BATCH_KEY.format(team_id=team_id, batch_id=batch_id)
+    return cache.add(key, BATCH_APPLYING, BATCH_CLAIM_TIMEOUT)
+
+
+def batch_applied(team_id: int, batch_id: str) -> bool:
+    key = BATCH_KEY.format(team_id=team_id, batch_id=batch_id)
+    return cache.get(key) == BATCH_APPLIED
+
+
+def mark_batch_applied(team_id: int, batch_id: str) -> None:
+    key = BATCH_KEY.format(team_id=team_id, batch_id=batch_id)
+    cache.set(key, BATCH_APPLIED, DRAFT_TIMEOUT)
+
+
+def release_batch(team_id: int, batch_id: str) -> None:
+    """Give up a claim that wasn't applied, so a retry can claim it again."""
+    cache.delete(BATCH_KEY.format(team_id=team_id, batch_id=batch_id))
+
+
+def _maybe_flush(session: GameSession) -> None:
+    # Whoever creates the marker flushes; it expires after FLUSH_INTERVAL.
+    if cache.add(FLUSH_KEY.format(code=session.code), 1, FLUSH_INTERVAL):
+        flush(session)
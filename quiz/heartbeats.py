@@ -0,0 +1,136 @@
+"""
+Write-behind buffer for host and team heartbeats.
+
+Every authenticated session request (polls, autosaves) used to write
+GameSession.admin_last_seen or SessionTeam.last_seen. Beats now land in
+the cache and are flushed to the DB at most once per FLUSH_INTERVAL per
+session, as one UPDATE for the host and one bulk UPDATE for the teams.
+
+The host-timeout sweeper flushes buffered host beats before it decides
+anything (flush_admin_beats). Readers that only display a time (the Django
+admin) use admin_seen/team_seen, which prefer the buffered beat.
+
+abeat_team is the async views' form of beat_team; the flush itself still
+runs the sync ORM, in a thread.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone as dt_timezone
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+
+from .models import GameSession, SessionTeam
+
+ADMIN_KEY = "session:{code}:admin_seen"
+TEAM_KEY = "team:{team_id}:seen"
+FLUSH_KEY = "session:{code}:heartbeat_flush"
+FLUSH_INTERVAL = 10  # Seconds between DB flushes per session
+BEAT_TIMEOUT = 60 * 60 * 12
+
+
+def admin_key(code: str) -> str:
+    return ADMIN_KEY.format(code=code)
+
+
+def team_key(team_id: int) -> str:
+    return TEAM_KEY.format(team_id=team_id)
+
+
+def beat_admin(code: str) -> None:
+    """Record that the host was just seen."""
+    cache.set(admin_key(code), time.time(), BEAT_TIMEOUT)
+    _maybe_flush(code)
+
+
+def beat_team(code: str, team_id: int) -> None:
+    """Record that a team was just seen."""
+    cache.set(team_key(team_id), time.time(), BEAT_TIMEOUT)
+    _maybe_flush(code)
+
+
+async def abeat_team(code: str, team_id: int) -> None:
+    await cache.aset(team_key(team_id), time.time(), BEAT_TIMEOUT)
+    if await cache.aadd(FLUSH_KEY.format(code=code), 1, FLUSH_INTERVAL):
+        await sync_to_async(flush)(code)
+
+
+def buffered_admin_seen(code: str) -> Optional[float]:
+    """Epoch seconds of the latest buffered host beat, if any."""
+    return cache.get(admin_key(code))
+
+
+def buffered_team_seen(team_id: int) -> Optional[float]:
+    """Epoch seconds of the latest buffered beat of a team, if any."""
+    return cache.get(team_key(team_id))
+
+
+def admin_seen(session: GameSession) -> datetime:
+    """When the host was last seen, counting beats not flushed yet."""
+    return _latest(session.admin_last_seen, buffered_admin_seen(session.code))
+
+
+def team_seen(team: SessionTeam) -> datetime:
+    """When a team was last seen, counting beats not flushed yet."""
+    return _latest(team.last_seen, buffered_team_seen(team.id))
+
+
+def flush_admin_beats(codes: list[str]) -> None:
+    """Write buffered host beats for several sessions to the DB.
+
+    Used by the timeout sweeper so a host whose beats haven't been flushed
+    yet is not mistaken for a stale one.
+    """
+    beats = cache.get_many([admin_key(code) for code in codes])
+    for code in codes:
+        seen = beats.get(admin_key(code))
+        if seen is not None:
+            GameSession.objects.filter(
+                code=code, admin_last_seen__lt=_to_datetime(seen)
+            ).update(admin_last_seen=_to_datetime(seen))
+
+
+def flush(code: str) -> None:
+    """Write buffered beats for one session to the DB."""
+    session = GameSession.objects.filter(code=code).only("id").first()
+    if session is None:
+        return
+
+    admin_seen = buffered_admin_seen(code)
+    if admin_seen is not None:
+        seen = _to_datetime(admin_seen)
+        # update() skips save(), so heartbeats never move the state version.
+        GameSession.objects.filter(id=session.id, admin_last_seen__lt=seen).update(
+            admin_last_seen=seen
+        )
+
+    team_ids = list(session.teams.values_list("id", flat=True))
+    keys = {team_key(team_id): team_id for team_id in team_ids}
+    beats = cache.get_many(list(keys))
+    if beats:
+        SessionTeam.objects.bulk_update(
+            [
+                SessionTeam(id=keys[key], last_seen=_to_datetime(seen))
+                for key, seen in beats.items()
+            ],
+            ["last_seen"],
+        )
+
+
+def _maybe_flush(code: str) -> None:
+    # Whoever creates the marker flushes; it expires after FLUSH_INTERVAL.
+    if cache.add(FLUSH_KEY.format(code=code), 1, FLUSH_INTERVAL):
+        flush(code)
+
+
+def _to_datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=dt_timezone.utc)
+
+
+def _latest(stored: datetime, buffered: Optional[float]) -> datetime:
+    if buffered is None:
+        return stored
+    return max(stored, _to_datetime(buffered))
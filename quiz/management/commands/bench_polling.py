@@ -0,0 +1,149 @@
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+# Polled endpoints, relative to /quiz/api/sessions/<code>/. Team endpoints
+# need --team-token.
+PUBLIC_PATHS = ["state/", "leaderboard/"]
+TEAM_PATHS = ["team/answers/"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test the polled session endpoints with many concurrent clients. "
+        "Pass several --url values (e.g. a sync gunicorn and a uvicorn-worker "
+        "server over the same database) to compare them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("code", help="Code of a live session to poll")
+        parser.add_argument(
+            "--url",
+            action="append",
+            required=True,
+            help="Server base URL, e.g. http://localhost:8000 (repeatable)",
+        )
+        parser.add_argument("--team-token", help="Also poll the team endpoints")
+        parser.add_argument(
+            "--clients",
+            type=int,
+            default=200,
+            help="Concurrent polling devices (default: 200)",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=15,
+            help="Seconds to poll each server (default: 15)",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Pause between a device's polls, 0 for back to back (default: 0)",
+        )
+
+    def handle(self, *args, **options):
+        paths = PUBLIC_PATHS + (TEAM_PATHS if options["team_token"] else [])
+        prefix = f"/quiz/api/sessions/{options['code']}/"
+
+        self.stdout.write(
+            f"{'server':<32} {'requests':>9} {'req/s':>8} {'p50 ms':>8} "
+            f"{'p95 ms':>8} {'p99 ms':>8} {'errors':>7}"
+        )
+        for url in options["url"]:
+            parts = urlsplit(url)
+            if parts.scheme != "http" or not parts.hostname:
+                raise CommandError(f"Not a plain http:// URL: {url}")
+            latencies, errors = asyncio.run(
+                self.run(
+                    parts.hostname,
+                    parts.port or 80,
+                    [prefix + path for path in paths],
+                    options,
+                )
+            )
+            self.report(url, latencies, errors, options["duration"])
+
+    async def run(self, host, port, paths, options) -> tuple[list[float], int]:
+        latencies: list[float] = []
+        errors = [0]
+        deadline = time.monotonic() + options["duration"]
+        headers = f"Host: {host}\r\n"
+        if options["team_token"]:
+            headers += f"Authorization: Bearer {options['team_token']}\r\n"
+
+        async def device(index: int) -> None:
+            reader = writer = None
+            turn = index
+            while time.monotonic() < deadline:
+                path = paths[turn % len(paths)]
+                turn += 1
+                started = time.monotonic()
+                try:
+                    if writer is None:
+                        reader, writer = await asyncio.open_connection(host, port)
+                    writer.write(
+                        f"GET {path} HTTP/1.1\r\n{headers}\r\n".encode("latin-1")
+                    )
+                    status, keep_alive = await read_response(reader)
+                except (OSError, asyncio.IncompleteReadError, ValueError):
+                    errors[0] += 1
+                    writer = None
+                    await asyncio.sleep(0.1)
+                    continue
+                latencies.append(time.monotonic() - started)
+                if status >= 400:
+                    errors[0] += 1
+                if not keep_alive:
+                    writer.close()
+                    writer = None
+                if options["interval"]:
+                    await asyncio.sleep(options["interval"])
+            if writer is not None:
+                writer.close()
+
+        await asyncio.gather(*(device(i) for i in range(options["clients"])))
+        return latencies, errors[0]
+
+    def report(self, url, latencies, errors, duration) -> None:
+        if not latencies:
+            self.stdout.write(f"{url:<32} no responses ({errors} errors)")
+            return
+        cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else []
+
+        def ms(q):
+            return f"{(cuts[q - 1] if cuts else latencies[0]) * 1000:8.1f}"
+
+        self.stdout.write(
+            f"{url:<32} {len(latencies):>9} {len(latencies) / duration:>8.0f} "
+            f"{ms(50)} {ms(95)} {ms(99)} {errors:>7}"
+        )
+
+
+async def read_response(reader: asyncio.StreamReader) -> tuple[int, bool]:
+    """Read one HTTP/1.1 response. Returns (status, connection kept alive)."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise asyncio.IncompleteReadError(b"", None)
+    status = int(status_line.split()[1])
+    length, keep_alive, chunked = 0, True, False
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        name, value = name.strip().lower(), value.strip().lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "connection":
+            keep_alive = value != "close"
+        elif name == "transfer-encoding":
+            chunked = "chunked" in value
+    if chunked:
+        while size := int((await reader.readline()).split(b";")[0], 16):
+            await reader.readexactly(size + 2)
+        await reader.readline()
+    elif length:
+        await reader.readexactly(length)
+    return status, keep_alive
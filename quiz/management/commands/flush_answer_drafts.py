@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from quiz import answer_drafts
+from quiz.models import GameSession
+
+
+class Command(BaseCommand):
+    help = "Write buffered answer autosaves of live sessions to the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep flushing every --interval seconds instead of running once",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=answer_drafts.FLUSH_INTERVAL,
+            help=f"Seconds between flushes with --loop (default: {answer_drafts.FLUSH_INTERVAL})",
+        )
+
+    def handle(self, *args, **options):
+        if not options["loop"]:
+            self.flush()
+            return
+
+        while True:
+            close_old_connections()
+            self.flush()
+            time.sleep(options["interval"])
+
+    def flush(self) -> int:
+        written = 0
+        for session in GameSession.objects.filter(
+            status=GameSession.Status.PLAYING, current_round__isnull=False
+        ).defer("content"):
+            written += answer_drafts.flush(session)
+        if written:
+            self.stdout.write(f"Flushed {written} draft answer(s)")
+        return written
@@ -0,0 +1,64 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from quiz import heartbeats
+from quiz.models import GameSession
+
+ADMIN_TIMEOUT_SECONDS = 30  # Pause if admin not seen for this long
+
+
+class Command(BaseCommand):
+    help = "Pause live sessions whose host has stopped sending heartbeats."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--timeout",
+            type=int,
+            default=ADMIN_TIMEOUT_SECONDS,
+            help=f"Seconds without a host heartbeat before pausing (default: {ADMIN_TIMEOUT_SECONDS})",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep sweeping every --interval seconds instead of running once",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds between sweeps with --loop (default: 5)",
+        )
+
+    def handle(self, *args, **options):
+        if not options["loop"]:
+            self.sweep(options["timeout"])
+            return
+
+        while True:
+            close_old_connections()
+            self.sweep(options["timeout"])
+            time.sleep(options["interval"])
+
+    def sweep(self, timeout: int) -> list[str]:
+        cutoff = timezone.now() - timedelta(seconds=timeout)
+
+        # The column lags the host's buffered beats; flush those first so an
+        # active host is never paused.
+        candidates = list(
+            GameSession.objects.filter(
+                status__in=[GameSession.Status.PLAYING, GameSession.Status.SCORING],
+                admin_last_seen__lt=cutoff,
+            ).values_list("code", flat=True)
+        )
+        if not candidates:
+            return []
+        heartbeats.flush_admin_beats(candidates)
+
+        paused = GameSession.pause_stale(cutoff)
+        for code in paused:
+            self.stdout.write(f"Paused {code} (host not seen for {timeout}s)")
+        return paused
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0049_migrate_game_naming_data"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gamesession",
+            name="state_version",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
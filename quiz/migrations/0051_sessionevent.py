@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0050_gamesession_state_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gamesession",
+            name="event_seq",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name="SessionEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("seq", models.PositiveBigIntegerField()),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("game_started", "Game Started"),
+                            ("question_changed", "Question Changed"),
+                            ("round_locked", "Round Locked"),
+                            ("round_completed", "Round Completed"),
+                            ("leaderboard_shown", "Leaderboard Shown"),
+                            ("round_started", "Round Started"),
+                            ("game_completed", "Game Completed"),
+                            ("paused", "Paused"),
+                            ("resumed", "Resumed"),
+                            ("team_navigation_changed", "Team Navigation Changed"),
+                            ("team_joined", "Team Joined"),
+                            ("answer_submitted", "Answer Submitted"),
+                            ("answer_scored", "Answer Scored"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                ("payload", models.JSONField(blank=True, default=dict)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="events",
+                        to="quiz.gamesession",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["session", "seq"],
+                "unique_together": {("session", "seq")},
+            },
+        ),
+    ]
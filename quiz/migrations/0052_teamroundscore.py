@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_round_scores(apps, schema_editor):
+    TeamAnswer = apps.get_model("quiz", "TeamAnswer")
+    TeamRoundScore = apps.get_model("quiz", "TeamRoundScore")
+    TeamRoundScore.objects.bulk_create(
+        TeamRoundScore(
+            team_id=row["team_id"],
+            session_round_id=row["session_round_id"],
+            points=row["total"],
+        )
+        for row in TeamAnswer.objects.filter(points_awarded__isnull=False)
+        .order_by()
+        .values("team_id", "session_round_id")
+        .annotate(total=models.Sum("points_awarded"))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0051_sessionevent"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TeamRoundScore",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("points", models.IntegerField(default=0)),
+                (
+                    "session_round",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="team_scores",
+                        to="quiz.sessionround",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="round_scores",
+                        to="quiz.sessionteam",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("team", "session_round")},
+            },
+        ),
+        migrations.RunPython(backfill_round_scores, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:12
+
+from django.db import migrations, models
+
+
+def freeze_scored_rounds(apps, schema_editor):
+    SessionRound = apps.get_model("quiz", "SessionRound")
+    SessionTeam = apps.get_model("quiz", "SessionTeam")
+    Question = apps.get_model("quiz", "Question")
+    TeamRoundScore = apps.get_model("quiz", "TeamRoundScore")
+
+    for session_round in SessionRound.objects.filter(status="scored").select_related(
+        "session"
+    ):
+        TeamRoundScore.objects.bulk_create(
+            [
+                TeamRoundScore(team_id=team_id, session_round=session_round)
+                for team_id in SessionTeam.objects.filter(
+                    session=session_round.session
+                ).values_list("id", flat=True)
+            ],
+            ignore_conflicts=True,
+        )
+        max_points = (
+            Question.objects.filter(
+                game_id=session_round.session.game_id,
+                game_round_id=session_round.round_id,
+            ).aggregate(total=models.Sum("total_points"))["total"]
+            or 0
+        )
+        TeamRoundScore.objects.filter(session_round=session_round).update(
+            max_points=max_points, frozen=True
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0052_teamroundscore"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="teamroundscore",
+            name="frozen",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="teamroundscore",
+            name="max_points",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(freeze_scored_rounds, migrations.RunPython.noop),
+    ]
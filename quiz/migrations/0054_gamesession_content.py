@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0053_teamroundscore_frozen"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gamesession",
+            name="content",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
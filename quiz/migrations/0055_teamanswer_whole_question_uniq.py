@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:26
+
+from django.db import migrations, models
+
+
+def drop_duplicate_answers(apps, schema_editor):
+    """Keep one whole-question row per team and question before the index.
+
+    Racing get_or_create calls could insert two; the scored, most recently
+    updated one wins. Run "Recalculate team scores" in the admin afterwards
+    if any dropped row carried points.
+    """
+    TeamAnswer = apps.get_model("quiz", "TeamAnswer")
+    seen = set()
+    duplicates = []
+    for answer_id, team_id, question_id in (
+        TeamAnswer.objects.filter(answer_part__isnull=True)
+        .order_by(
+            "team_id",
+            "question_id",
+            models.F("points_awarded").desc(nulls_last=True),
+            "-updated_at",
+            "-id",
+        )
+        .values_list("id", "team_id", "question_id")
+    ):
+        if (team_id, question_id) in seen:
+            duplicates.append(answer_id)
+        seen.add((team_id, question_id))
+    TeamAnswer.objects.filter(id__in=duplicates).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0054_gamesession_content"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_answers, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="teamanswer",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("answer_part__isnull", True)),
+                fields=("team", "question"),
+                name="quiz_teamanswer_whole_question_uniq",
+            ),
+        ),
+    ]
@@ -1,10 +1,12 @@
-from datetime import date
+from datetime import date, datetime
+from functools import partial
 
-from django.db import models
+from django.db import connection, models, transaction
 from django.contrib.auth.models import User
 from django.utils import timezone
 from tinymce.models import HTMLField
 from .fields import CloudFrontURLField, S3ImageField, S3VideoField
+from . import session_broker, session_cache
 import secrets
 import random
 import string
@@ -356,6 +358,16 @@ class GameSession(models.Model):
     completed_at = models.DateTimeField(null=True, blank=True)
     admin_last_seen = models.DateTimeField(auto_now_add=True)
 
+    # Monotonic stamp of the polled session state. Bumped on every full save
+    # and by bump_state_version()/record_event() for changes made through
+    # other rows (joins, answers, scores). The state endpoint uses it as its ETag.
+    state_version = models.PositiveBigIntegerField(default=0)
+    # Sequence number of the last SessionEvent appended for this session.
+    event_seq = models.PositiveBigIntegerField(default=0)
+    # The game's questions as compiled at creation (see session_content).
+    # Live endpoints read content from here, not from the Question tables.
+    content = models.JSONField(default=dict, blank=True, editable=False)
+
     class Meta:
         ordering = ["-created_at"]
 
@@ -365,8 +377,81 @@ class GameSession(models.Model):
     def save(self, *args, **kwargs):
         if not self.code:
             self.code = self._generate_unique_code()
+
+        # Full saves (and saves that opt in via update_fields) bump the state
+        # version in SQL, so a stale in-memory copy can never move it backwards.
+        # The event counter is owned by record_event() and kept as-is.
+        update_fields = kwargs.get("update_fields")
+        bump_version = not self._state.adding and (
+            update_fields is None or "state_version" in update_fields
+        )
+        if bump_version:
+            self.state_version = models.F("state_version") + 1
+            if update_fields is None:
+                self.event_seq = models.F("event_seq")
+
         super().save(*args, **kwargs)
 
+        if bump_version:
+            self.refresh_from_db(fields=["state_version", "event_seq"])
+            self._publish_state_version()
+
+    def bump_state_version(self):
+        """Mark the polled state as changed without saving the session row."""
+        self._increment_counters(state_version=1, event_seq=0)
+
+    def record_event(
+        self, kind: str, payload: dict | None = None, *, state_changed: bool = False
+    ) -> "SessionEvent":
+        """Append an event to the session log.
+
+        The sequence number is allocated with an UPDATE on this row, so it is
+        serialized per session and commits in order. Pass state_changed=True
+        when the change is visible in the polled state and no save() already
+        bumped the version; both counters then move in the same statement.
+        """
+        return self.record_events([(kind, payload)], state_changed=state_changed)[0]
+
+    def record_events(
+        self, events: list[tuple[str, dict | None]], *, state_changed: bool = False
+    ) -> list["SessionEvent"]:
+        """Append several (kind, payload) events with one sequence allocation."""
+        if not events:
+            return []
+        self._increment_counters(
+            state_version=int(state_changed), event_seq=len(events)
+        )
+        first_seq = self.event_seq - len(events) + 1
+        return SessionEvent.objects.bulk_create(
+            SessionEvent(
+                session=self, seq=first_seq + i, kind=kind, payload=payload or {}
+            )
+            for i, (kind, payload) in enumerate(events)
+        )
+
+    def _increment_counters(self, *, state_version: int, event_seq: int):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {GameSession._meta.db_table} "
+                "SET state_version = state_version + %s, event_seq = event_seq + %s "
+                "WHERE id = %s RETURNING state_version, event_seq",
+                [state_version, event_seq, self.pk],
+            )
+            self.state_version, self.event_seq = cursor.fetchone()
+        if state_version:
+            self._publish_state_version()
+
+    def _publish_state_version(self):
+        """Fan the new version out to live subscribers once it is committed.
+
+        The cached state snapshot is dropped right away as well, so nothing
+        serves it past this write even before the new version is announced.
+        """
+        session_cache.invalidate(self.code)
+        transaction.on_commit(
+            partial(session_broker.publish, self.code, self.state_version)
+        )
+
     @staticmethod
     def _generate_unique_code():
         """Generate a unique 6-character session code"""
@@ -381,6 +466,48 @@ class GameSession(models.Model):
             self.status_before_pause = self.status
             self.status = self.Status.PAUSED
             self.save()
+            self.record_event(SessionEvent.Kind.PAUSED, {"status": self.status})
+
+    @classmethod
+    def pause_stale(cls, admin_seen_before) -> list[str]:
+        """Pause every live session whose host was last seen before the cutoff.
+
+        Set-based counterpart of pause(): one UPDATE moves the status and
+        both counters for all matching rows, then the PAUSED events are
+        inserted in bulk. Returns the codes of the paused sessions.
+        """
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {cls._meta.db_table} "
+                    "SET status_before_pause = status, status = %s, "
+                    "state_version = state_version + 1, event_seq = event_seq + 1 "
+                    "WHERE status IN (%s, %s) AND admin_last_seen < %s "
+                    "RETURNING id, code, state_version, event_seq",
+                    [
+                        cls.Status.PAUSED,
+                        cls.Status.PLAYING,
+                        cls.Status.SCORING,
+                        admin_seen_before,
+                    ],
+                )
+                rows = cursor.fetchall()
+
+            SessionEvent.objects.bulk_create(
+                SessionEvent(
+                    session_id=session_id,
+                    seq=event_seq,
+                    kind=SessionEvent.Kind.PAUSED,
+                    payload={"status": cls.Status.PAUSED},
+                )
+                for session_id, _, _, event_seq in rows
+            )
+            for _, code, state_version, _ in rows:
+                session_cache.invalidate(code)
+                transaction.on_commit(
+                    partial(session_broker.publish, code, state_version)
+                )
+        return [code for _, code, _, _ in rows]
 
     def resume(self):
         """Resume session (admin reconnect)."""
@@ -388,6 +515,7 @@ class GameSession(models.Model):
             self.status = self.status_before_pause
             self.status_before_pause = None
             self.save()
+            self.record_event(SessionEvent.Kind.RESUMED, {"status": self.status})
 
 
 class SessionTeam(models.Model):
@@ -413,6 +541,24 @@ class SessionTeam(models.Model):
     def __str__(self) -> str:
         return f"{self.name} ({self.session.code})"
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        # The team list is part of the polled state.
+        if adding:
+            self.session.bump_state_version()
+
+    def delete(self, *args, **kwargs):
+        from . import session_progress
+
+        session = self.session
+        result = super().delete(*args, **kwargs)
+        session_cache.forget_tokens(self.token)
+        # The team's answers went with it; recount submissions from the DB.
+        session_progress.invalidate(session.code)
+        session.bump_state_version()
+        return result
+
 
 class SessionRound(models.Model):
     """Tracks round state within a session"""
@@ -476,6 +622,15 @@ class TeamAnswer(models.Model):
     class Meta:
         # Allow multiple TeamAnswers per team per question (one per part)
         unique_together = ["team", "question", "answer_part"]
+        constraints = [
+            # NULLs are distinct in the unique_together above, so whole-question
+            # answers need their own index (also the upsert's conflict target).
+            models.UniqueConstraint(
+                fields=["team", "question"],
+                condition=models.Q(answer_part__isnull=True),
+                name="quiz_teamanswer_whole_question_uniq",
+            ),
+        ]
         indexes = [
             models.Index(fields=["session_round", "team"]),
             models.Index(fields=["team", "question"]),
@@ -486,3 +641,133 @@ class TeamAnswer(models.Model):
             f" (Part {self.answer_part.display_order})" if self.answer_part else ""
         )
         return f"{self.team.name} - Q{self.question.question_number}{part_str}"
+
+    @classmethod
+    def submit_text(
+        cls, team_id: int, question_id: int, session_round_id: int, text: str
+    ) -> tuple[int, bool] | None:
+        """Insert or update a team's whole-question answer in one statement.
+
+        Returns (id, created) or None if the answer is locked.
+        """
+        return cls.submit_texts([(team_id, question_id, session_round_id, text)]).get(
+            (team_id, question_id)
+        )
+
+    @classmethod
+    def submit_texts(
+        cls,
+        answers: list[tuple[int, int, int, str]],
+        as_of: dict[tuple[int, int], datetime] | None = None,
+    ) -> dict[tuple[int, int], tuple[int, bool]]:
+        """Insert or update many whole-question answers in one statement.
+
+        `answers` are (team_id, question_id, session_round_id, text), at most
+        one per (team, question). A multi-row INSERT ... ON CONFLICT DO
+        UPDATE on the partial unique index, skipped for rows that are
+        locked. With `as_of` ({(team_id, question_id): time the text was
+        typed}), each row is stamped with that time and only replaces an
+        answer last updated before it, so an older buffered draft never
+        overwrites a newer submit. Returns {(team_id, question_id): (id,
+        created)} for the answers written; skipped ones are left out.
+        """
+        if not answers:
+            return {}
+        table = cls._meta.db_table
+        now = timezone.now()
+        rows = ", ".join(
+            ["(%s, %s, %s, NULL, %s, false, NULL, NULL, %s, %s)"] * len(answers)
+        )
+        params = []
+        for team_id, question_id, session_round_id, text in answers:
+            stamp = as_of[team_id, question_id] if as_of else now
+            params += [team_id, question_id, session_round_id, text, stamp, stamp]
+        newer = f" AND {table}.updated_at < EXCLUDED.updated_at" if as_of else ""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} "
+                "(team_id, question_id, session_round_id, answer_part_id, answer_text, "
+                "is_locked, points_awarded, scored_at, submitted_at, updated_at) "
+                f"VALUES {rows} "
+                "ON CONFLICT (team_id, question_id) WHERE answer_part_id IS NULL "
+                "DO UPDATE SET answer_text = EXCLUDED.answer_text, "
+                "updated_at = EXCLUDED.updated_at "
+                f"WHERE NOT {table}.is_locked{newer} "
+                "RETURNING team_id, question_id, id, xmax = 0",
+                params,
+            )
+            written = cursor.fetchall()
+        return {
+            (team_id, question_id): (answer_id, created)
+            for team_id, question_id, answer_id, created in written
+        }
+
+
+class TeamRoundScore(models.Model):
+    """A team's running points total for one round of a session.
+
+    Maintained with F() deltas alongside SessionTeam.score (see
+    quiz.standings), so a score write never re-sums earlier rounds. Frozen
+    once the round completes; the leaderboard reads frozen rows only.
+    """
+
+    team = models.ForeignKey(
+        SessionTeam, on_delete=models.CASCADE, related_name="round_scores"
+    )
+    session_round = models.ForeignKey(
+        SessionRound, on_delete=models.CASCADE, related_name="team_scores"
+    )
+    points = models.IntegerField(default=0)
+    max_points = models.IntegerField(default=0)  # Set when the round is frozen
+    frozen = models.BooleanField(default=False)
+
+    class Meta:
+        unique_together = ["team", "session_round"]
+
+    def __str__(self) -> str:
+        return f"{self.team.name} - {self.session_round.round.name}: {self.points}"
+
+
+class SessionEvent(models.Model):
+    """Append-only log of everything that happened in a session.
+
+    seq is allocated per session by GameSession.record_event(), so clients
+    can fetch deltas with ?after=<seq> and post-game analytics can replay a
+    night in order. Payloads are public: never put answer text in them.
+
+    Answer submissions are logged when a team's answer turns empty or
+    non-empty, the changes that already bump the state version, so the
+    seq rides on that UPDATE. Edits of non-empty text are not logged:
+    allocating a seq for every autosave would queue each team on the
+    session row.
+    """
+
+    class Kind(models.TextChoices):
+        GAME_STARTED = "game_started", "Game Started"
+        QUESTION_CHANGED = "question_changed", "Question Changed"
+        ROUND_LOCKED = "round_locked", "Round Locked"
+        ROUND_COMPLETED = "round_completed", "Round Completed"
+        LEADERBOARD_SHOWN = "leaderboard_shown", "Leaderboard Shown"
+        ROUND_STARTED = "round_started", "Round Started"
+        GAME_COMPLETED = "game_completed", "Game Completed"
+        PAUSED = "paused", "Paused"
+        RESUMED = "resumed", "Resumed"
+        TEAM_NAVIGATION_CHANGED = "team_navigation_changed", "Team Navigation Changed"
+        TEAM_JOINED = "team_joined", "Team Joined"
+        ANSWER_SUBMITTED = "answer_submitted", "Answer Submitted"
+        ANSWER_SCORED = "answer_scored", "Answer Scored"
+
+    session = models.ForeignKey(
+        GameSession, on_delete=models.CASCADE, related_name="events"
+    )
+    seq = models.PositiveBigIntegerField()
+    kind = models.CharField(max_length=32, choices=Kind.choices)
+    payload = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ["session", "seq"]
+        ordering = ["session", "seq"]
+
+    def __str__(self) -> str:
+        return f"{self.session.code} #{self.seq} {self.kind}"
@@ -0,0 +1,64 @@
+"""
+Server-suggested pace for state polls.
+
+Every device polls get_session_state. How often it needs to depends on the
+phase: while a round is being played the host moves between questions and
+teams expect to follow within a couple of seconds, but a lobby, a paused
+game or a leaderboard can sit unchanged for minutes. Each state response
+therefore carries `next_poll_ms` (and a 304 a Retry-After header), which
+play.html waits before its next poll.
+
+Each phase has a (fastest, slowest) interval. Right after a state change
+clients poll at the fastest pace; the longer the state stays the same, the
+more they back off, polling every IDLE_FRACTION of the time it has been
+idle, up to the phase's slowest pace. A change after a long quiet spell is
+therefore noticed within a fraction of that spell, and activity (teams
+joining or answering, the host navigating) keeps everyone snappy.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from .models import GameSession, SessionRound
+
+Status = GameSession.Status
+
+# {session status: (fastest, slowest) poll interval in ms}
+INTERVALS = {
+    Status.LOBBY: (3_000, 10_000),
+    Status.PLAYING: (2_000, 5_000),
+    Status.PAUSED: (5_000, 15_000),
+    Status.SCORING: (3_000, 10_000),
+    Status.REVIEWING: (2_000, 5_000),
+    Status.LEADERBOARD: (5_000, 15_000),
+    Status.COMPLETED: (30_000, 30_000),
+}
+# A round that isn't open for answers has nothing to navigate
+PLAYING_IDLE_ROUND = (3_000, 10_000)
+DEFAULT = (2_000, 5_000)
+IDLE_FRACTION = 0.25  # Poll every quarter of the time the state has been idle
+
+
+def next_poll_ms(
+    status: str,
+    round_status: Optional[str] = None,
+    changed_at: Optional[float] = None,
+    now: Optional[float] = None,
+) -> int:
+    """Milliseconds a client should wait before polling again.
+
+    `changed_at` is when the state last changed (epoch seconds); unknown
+    counts as just now.
+    """
+    fastest, slowest = INTERVALS.get(status, DEFAULT)
+    if status == Status.PLAYING and round_status not in (
+        None,
+        SessionRound.Status.ACTIVE,
+    ):
+        fastest, slowest = PLAYING_IDLE_ROUND
+    if changed_at is None:
+        return fastest
+    idle_ms = max(0.0, (now if now is not None else time.time()) - changed_at) * 1000
+    return int(min(slowest, max(fastest, idle_ms * IDLE_FRACTION)))
@@ -0,0 +1,151 @@
+"""
+Token-bucket rate limits for live session endpoints.
+
+django-ratelimit's IP-keyed windows put every phone in a venue into one
+bucket, since they share the bar's NAT address. These limits are keyed by
+the authenticated team or host session instead, falling back to the client
+IP for unauthenticated calls such as joining. The bearer token itself is
+never a key: a client could send a fresh one with every request. Apply
+rate_limit below require_team_token/require_admin_token, so it only sees
+requests whose token resolved.
+
+Each key owns a bucket of `capacity` tokens, refilled at `rate` tokens per
+second; a request takes one token or is refused with 429. Bursts up to the
+capacity pass, sustained traffic is capped at the refill rate.
+
+With settings.REDIS_URL set (Redis as the cache backend) a bucket is
+checked and updated by one Lua script, i.e. one atomic round trip, using
+the Redis server's clock. The script runs on this module's own client for
+that URL. Without Redis (the local memory cache in development) the bucket
+lives in the default cache and is updated under a process lock.
+
+Limits per endpoint class default to DEFAULT_LIMITS and can be overridden
+with settings.SESSION_RATE_LIMITS. Like django-ratelimit, they are off
+unless settings.RATELIMIT_ENABLE is set.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from functools import wraps
+from typing import Callable
+
+import redis
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, JsonResponse
+
+BUCKET_KEY = "ratelimit:{scope}:{client}"
+
+# {endpoint class: (capacity, tokens refilled per second)}
+DEFAULT_LIMITS = {
+    # A whole room joining at once from one address
+    "join": (60, 1.0),
+    # Autosaves, explicit submits and offline batches of one team
+    "team_answer": (30, 1.0),
+    # Host marking answers one by one
+    "admin_score": (120, 5.0),
+}
+
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+_local_lock = threading.Lock()
+_script = None  # TOKEN_BUCKET_SCRIPT registered on a client for REDIS_URL
+
+
+def limits(scope: str) -> tuple[int, float]:
+    """(capacity, refill rate per second) of an endpoint class."""
+    return getattr(settings, "SESSION_RATE_LIMITS", {}).get(
+        scope, DEFAULT_LIMITS[scope]
+    )
+
+
+def client_key(request: HttpRequest) -> str:
+    """The authenticated team or host session, else the IP."""
+    team = getattr(request, "team", None)
+    if team is not None:
+        return f"team:{team.id}"
+    session = getattr(request, "session_obj", None)
+    if session is not None:
+        return f"admin:{session.id}"
+    return "ip:" + request.META.get("REMOTE_ADDR", "")
+
+
+def take(scope: str, client: str) -> tuple[bool, float]:
+    """Take one token from the client's bucket for `scope`.
+
+    Returns (allowed, seconds until a token is available).
+    """
+    capacity, rate = limits(scope)
+    key = BUCKET_KEY.format(scope=scope, client=client)
+    if getattr(settings, "REDIS_URL", None):
+        allowed, tokens = _take_redis(key, capacity, rate)
+    else:
+        allowed, tokens = _take_local(key, capacity, rate)
+    return allowed, 0.0 if allowed else (1 - tokens) / rate
+
+
+def _take_redis(key: str, capacity: int, rate: float) -> tuple[bool, float]:
+    global _script
+    if _script is None:
+        _script = redis.Redis.from_url(settings.REDIS_URL).register_script(
+            TOKEN_BUCKET_SCRIPT
+        )
+    # EVALSHA, falling back to EVAL once per server if the script isn't loaded
+    allowed, tokens = _script(keys=[key], args=[capacity, rate])
+    return bool(allowed), float(tokens)
+
+
+def _take_local(key: str, capacity: int, rate: float) -> tuple[bool, float]:
+    with _local_lock:
+        now = time.time()
+        tokens, ts = cache.get(key, (capacity, now))
+        tokens = min(capacity, tokens + max(0.0, now - ts) * rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        cache.set(key, (tokens, now), math.ceil(capacity / rate) + 1)
+    return allowed, tokens
+
+
+def rate_limit(scope: str) -> Callable:
+    """Refuse requests over the `scope` limit with 429 and Retry-After."""
+
+    def decorator(view_func: Callable) -> Callable:
+        @wraps(view_func)
+        def wrapper(request: HttpRequest, *args, **kwargs):
+            if getattr(settings, "RATELIMIT_ENABLE", True):
+                allowed, retry_after = take(scope, client_key(request))
+                if not allowed:
+                    response = JsonResponse(
+                        {
+                            "error": "Rate limit exceeded. Please wait before trying again."
+                        },
+                        status=429,
+                    )
+                    response["Retry-After"] = str(math.ceil(retry_after))
+                    return response
+            return view_func(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,13 +1,21 @@
 """
 Per-question-type scoring strategies.
 
-One Scorer adapter per QuestionType. Owns three concerns that previously
+One Scorer adapter per QuestionType. Owns the concerns that previously
 switched on QuestionType.name strings inside session_api.py:
 
-  - is_multi_part:    does this question store one TeamAnswer per Answer part?
-  - split_submission: split a JSON-array submission into per-part TeamAnswer rows
-  - auto_score:       apply points_awarded where the rule is mechanical
-                      (no-op for free-text types; admin scores manually)
+  - is_multi_part:     does this question store one TeamAnswer per Answer part?
+  - score_submissions: split every team's JSON-array submission into per-part
+                       TeamAnswer rows and apply points_awarded where the rule
+                       is mechanical (free-text types are left to the admin)
+  - free_text:         answers are typed, so the scoring UI offers fuzzy
+                       suggestions for the host to confirm (quiz.suggestions)
+
+score_submissions is called by lock_round with every team's submission for
+a question at once: the per-question lookups are computed once, and unsaved
+scored part rows are returned for the caller to write in bulk. Estimation
+questions need the whole field to score at all, since a team's points
+depend on how close the other teams came.
 
 Callers resolve a Scorer via `scorer_for(question)`. Unknown type names fall
 back to SingleAnswerScorer, which is the safe default (single answer, manual
@@ -17,11 +25,14 @@ scoring).
 from __future__ import annotations
 
 import json
+import re
 from typing import Iterable, Protocol
 
+import numpy as np
+from django.conf import settings
 from django.utils import timezone
 
-from .models import Answer, Question, TeamAnswer
+from .models import Question, TeamAnswer
 
 # ============================================================================
 # Interface
@@ -31,20 +42,26 @@ from .models import Answer, Question, TeamAnswer
 class Scorer(Protocol):
     """Owns everything question-type-specific about lock-time behavior."""
 
-    def is_multi_part(self, question: Question) -> bool: ...
-
-    def split_submission(self, team_answer: TeamAnswer) -> list[TeamAnswer]:
-        """Split a JSON-array submission into per-part TeamAnswer rows.
-
-        Only called when is_multi_part(question) is True. Returns the list of
-        per-part TeamAnswer objects (created or updated). The caller is
-        responsible for deleting the original combined TeamAnswer.
-        """
+    free_text: bool
 
-    def auto_score(self, part_answers: list[TeamAnswer], question: Question) -> None:
-        """Apply points_awarded for mechanically-scored types.
+    def is_multi_part(self, question: Question) -> bool: ...
 
-        For free-text / manual-only types this is a no-op.
+    def score_submissions(
+        self,
+        question: dict,
+        submissions: Iterable[TeamAnswer],
+        stored_parts: dict[tuple[int, int], TeamAnswer],
+    ) -> list[TeamAnswer]:
+        """Split and auto-score every team's combined submission at once.
+
+        `question` is the session content snapshot's question dict, so parts
+        and correct answers are the ones frozen when the session was
+        created (quiz.session_content). For multi-part questions,
+        stored_parts maps (team_id, answer_part_id) to part rows already in
+        the DB, which are reused and updated in place, and all part rows are
+        returned. For single-answer questions the submissions themselves are
+        scored in place and returned if the type is mechanical. Nothing is
+        saved.
         """
 
 
@@ -66,41 +83,38 @@ def _parse_json_array(answer_text: str) -> list:
     return parsed
 
 
-def _split_into_parts(team_answer: TeamAnswer) -> list[TeamAnswer]:
-    """Generic JSON-array split used by all multi-part types.
+def build_parts(
+    team_answer: TeamAnswer,
+    answer_parts: list[dict],
+    stored_parts: dict[tuple[int, int], TeamAnswer],
+) -> list[TeamAnswer]:
+    """Split one team's JSON-array submission into part rows. Nothing is saved.
 
-    Creates one TeamAnswer per Answer part, in display_order, populated from
-    the corresponding array index of the original submission. Missing
-    positions are stored as empty strings.
+    Missing positions become empty strings. answer_parts are the snapshot
+    question's "answers", in display_order. stored_parts maps (team_id, answer_part_id) to part rows
+    already in the DB; those are updated in place, the rest are new unsaved
+    TeamAnswers.
     """
-    question = team_answer.question
-    answer_parts = list(question.answers.order_by("display_order"))
-
-    if not answer_parts:
-        # No parts defined - nothing to split into. Caller will see the
-        # original answer untouched.
-        return [team_answer]
-
     parsed = _parse_json_array(team_answer.answer_text)
 
-    created = []
+    parts = []
     for idx, answer_part in enumerate(answer_parts):
         text = ""
         if idx < len(parsed) and parsed[idx] is not None:
             text = str(parsed[idx])
 
-        part_answer, _ = TeamAnswer.objects.update_or_create(
-            team=team_answer.team,
-            question=question,
-            answer_part=answer_part,
-            defaults={
-                "session_round": team_answer.session_round,
-                "answer_text": text,
-                "is_locked": True,
-            },
-        )
-        created.append(part_answer)
-    return created
+        part_answer = stored_parts.get((team_answer.team_id, answer_part["id"]))
+        if part_answer is None:
+            part_answer = TeamAnswer(
+                team_id=team_answer.team_id,
+                question_id=team_answer.question_id,
+                answer_part_id=answer_part["id"],
+            )
+        part_answer.session_round_id = team_answer.session_round_id
+        part_answer.answer_text = text
+        part_answer.is_locked = True
+        parts.append(part_answer)
+    return parts
 
 
 # ============================================================================
@@ -111,15 +125,13 @@ def _split_into_parts(team_answer: TeamAnswer) -> list[TeamAnswer]:
 class SingleAnswerScorer:
     """Default: one TeamAnswer per question, scored manually by admin."""
 
+    free_text = True
+
     def is_multi_part(self, question: Question) -> bool:
         return False
 
-    def split_submission(self, team_answer: TeamAnswer) -> list[TeamAnswer]:
-        # Never called when is_multi_part is False, but keep a safe behavior.
-        return [team_answer]
-
-    def auto_score(self, part_answers, question: Question) -> None:
-        return None
+    def score_submissions(self, question, submissions, stored_parts) -> list:
+        return []  # nothing to split
 
 
 class MultipleOpenEndedScorer:
@@ -133,6 +145,8 @@ class MultipleOpenEndedScorer:
     If none of these are present, the question behaves as a single open-ended answer.
     """
 
+    free_text = True
+
     def is_multi_part(self, question: Question) -> bool:
         for answer in question.answers.all():
             has_prompt = answer.text and answer.text.strip()
@@ -142,32 +156,44 @@ class MultipleOpenEndedScorer:
                 return True
         return False
 
-    def split_submission(self, team_answer: TeamAnswer) -> list[TeamAnswer]:
-        return _split_into_parts(team_answer)
-
-    def auto_score(self, part_answers, question: Question) -> None:
-        return None  # admin scores manually
+    def score_submissions(self, question, submissions, stored_parts) -> list:
+        return [
+            part
+            for submission in submissions
+            for part in build_parts(submission, question["answers"], stored_parts)
+        ]
 
 
 class RankingScorer:
     """Players place items in order. Each position correct iff the placed
     item's correct_rank equals the position (1-indexed)."""
 
+    free_text = False
+
     def is_multi_part(self, question: Question) -> bool:
         return True
 
-    def split_submission(self, team_answer: TeamAnswer) -> list[TeamAnswer]:
-        return _split_into_parts(team_answer)
-
-    def auto_score(self, part_answers: list[TeamAnswer], question: Question) -> None:
-        # Look up the player's selected item per position by display_order.
-        answers_by_display_order = {a.display_order: a for a in question.answers.all()}
-
-        for idx, part_answer in enumerate(part_answers):
-            answer_part = part_answer.answer_part
-            if not answer_part:
-                continue
-
+    def score_submissions(self, question, submissions, stored_parts) -> list:
+        answer_parts = question["answers"]
+        # The player's selection per position is an item's display_order.
+        ranks = {a["display_order"]: a["correct_rank"] for a in answer_parts}
+        scored = []
+        for submission in submissions:
+            parts = build_parts(submission, answer_parts, stored_parts)
+            self._score(parts, answer_parts, ranks)
+            scored.extend(parts)
+        return scored
+
+    @staticmethod
+    def _score(
+        part_answers: list[TeamAnswer],
+        answer_parts: list[dict],
+        ranks: dict[int, int | None],
+    ) -> None:
+        now = timezone.now()
+        for idx, (part_answer, answer_part) in enumerate(
+            zip(part_answers, answer_parts)
+        ):
             is_correct = False
             try:
                 team_selection = (
@@ -176,48 +202,171 @@ class RankingScorer:
             except (ValueError, TypeError):
                 team_selection = None
 
-            if team_selection is not None:
-                selected_item = answers_by_display_order.get(team_selection)
-                if selected_item is not None:
-                    expected_rank = idx + 1
-                    is_correct = selected_item.correct_rank == expected_rank
+            if team_selection is not None and team_selection in ranks:
+                expected_rank = idx + 1
+                is_correct = ranks[team_selection] == expected_rank
 
-            part_answer.points_awarded = answer_part.points if is_correct else 0
-            part_answer.scored_at = timezone.now()
-            part_answer.save()
+            part_answer.points_awarded = answer_part["points"] if is_correct else 0
+            part_answer.scored_at = now
 
 
 class MatchingScorer:
     """Players type a match per prompt. Case-insensitive, whitespace-trimmed
     string equality against Answer.answer_text."""
 
+    free_text = True
+
     def is_multi_part(self, question: Question) -> bool:
         return True
 
-    def split_submission(self, team_answer: TeamAnswer) -> list[TeamAnswer]:
-        return _split_into_parts(team_answer)
+    def score_submissions(self, question, submissions, stored_parts) -> list:
+        answer_parts = question["answers"]
+        correct = [self._normalize(a["answer_text"]) for a in answer_parts]
+        scored = []
+        for submission in submissions:
+            parts = build_parts(submission, answer_parts, stored_parts)
+            self._score(parts, answer_parts, correct)
+            scored.extend(parts)
+        return scored
+
+    @staticmethod
+    def _normalize(text: str | None) -> str:
+        return text.strip().lower() if text else ""
+
+    @classmethod
+    def _score(
+        cls,
+        part_answers: list[TeamAnswer],
+        answer_parts: list[dict],
+        correct: list[str],
+    ) -> None:
+        now = timezone.now()
+        for part_answer, answer_part, expected in zip(
+            part_answers, answer_parts, correct
+        ):
+            is_correct = cls._normalize(part_answer.answer_text) == expected
+
+            part_answer.points_awarded = answer_part["points"] if is_correct else 0
+            part_answer.scored_at = now
+
+
+class EstimationScorer:
+    """Closest-to-the-number questions: tiebreakers and estimation rounds.
+
+    One numeric answer per team, compared with the first Answer.answer_text
+    that parses as a number. Submissions may use thousands separators,
+    currency and percent signs, and k/m/bn or thousand/million/billion
+    suffixes. All teams' submissions for a question are parsed into one
+    array and scored together. Each team gets the best of these tiers, as
+    a share of the question's total_points:
+
+      - exact:   the number itself
+      - closest: the `closest` smallest errors (ties share the place)
+      - within:  within `within_percent` of the number
+
+    The error is absolute (|guess - number|) or, with "error": "relative",
+    the ratio between guess and number, so guessing double is as far off
+    as guessing half; "within" then means off by at most that percentage
+    as a ratio either way. A number of 0 has no ratios, so it is always
+    scored by absolute error. Tiers default to ESTIMATION_TIERS and can be
+    overridden with settings.ESTIMATION_TIERS. Unparseable answers score 0.
+    Without a numeric correct answer nothing is scored and the host scores
+    by hand.
+    """
 
-    def auto_score(self, part_answers: list[TeamAnswer], question: Question) -> None:
-        for part_answer in part_answers:
-            answer_part = part_answer.answer_part
-            if not answer_part:
-                continue
+    free_text = False
 
-            submitted = (
-                part_answer.answer_text.strip().lower()
-                if part_answer.answer_text
-                else ""
-            )
-            correct = (
-                answer_part.answer_text.strip().lower()
-                if answer_part.answer_text
-                else ""
-            )
-            is_correct = submitted == correct
+    def is_multi_part(self, question: Question) -> bool:
+        return False
+
+    def score_submissions(self, question, submissions, stored_parts) -> list:
+        submissions = list(submissions)
+        numbers = [parse_number(a["answer_text"]) for a in question["answers"]]
+        target = next((n for n in numbers if n is not None), None)
+        if target is None or not submissions:
+            return []
+
+        # Unparseable answers become nan
+        guesses = np.array(
+            [parse_number(a.answer_text) for a in submissions], dtype=float
+        )
+        points = estimation_points(guesses, target, question["total_points"])
+
+        now = timezone.now()
+        for answer, awarded in zip(submissions, points.tolist()):
+            answer.points_awarded = awarded
+            answer.scored_at = now
+        return submissions
+
+
+ESTIMATION_TIERS = {
+    "error": "absolute",  # or "relative"
+    "exact": 1.0,  # share of total_points for the exact number
+    "closest": 1,  # how many places count as closest
+    "closest_share": 1.0,
+    "within_percent": 10.0,
+    "within_share": 0.5,
+}
+
+_MULTIPLIERS = {
+    "k": 1e3,
+    "thousand": 1e3,
+    "m": 1e6,
+    "mil": 1e6,
+    "million": 1e6,
+    "b": 1e9,
+    "bn": 1e9,
+    "billion": 1e9,
+    "t": 1e12,
+    "trillion": 1e12,
+}
+_NUMBER = re.compile(r"^([-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?)\s*([a-z]*)$")
+
+
+def parse_number(text: str | None) -> float | None:
+    """The number in a typed answer, e.g. "$1,200", "3.5 million", "40%"."""
+    if not text:
+        return None
+    cleaned = re.sub(r"[\s,_$€£%~≈]", "", text.strip().lower())
+    cleaned = cleaned.replace("about", "").replace("approx", "")
+    match = _NUMBER.match(cleaned)
+    if not match:
+        return None
+    number, suffix = match.groups()
+    if suffix and suffix not in _MULTIPLIERS:
+        return None
+    return float(number) * _MULTIPLIERS.get(suffix, 1)
+
+
+def estimation_points(
+    guesses: np.ndarray, target: float, total_points: int
+) -> np.ndarray:
+    """Points per guess (nan for unparseable) under the configured tiers."""
+    tiers = {**ESTIMATION_TIERS, **getattr(settings, "ESTIMATION_TIERS", {})}
+    valid = np.isfinite(guesses)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if tiers["error"] == "relative" and target != 0:
+            error = np.abs(np.log(guesses / target))
+            within = np.log1p(tiers["within_percent"] / 100)
+        else:
+            error = np.abs(guesses - target)
+            within = abs(target) * tiers["within_percent"] / 100
+    error = np.where(valid & np.isfinite(error), error, np.inf)
+
+    share = np.zeros(len(guesses))
+    share = np.where(error == 0, np.maximum(share, tiers["exact"]), share)
+
+    ranked = np.sort(error[np.isfinite(error)])
+    if tiers["closest"] > 0 and len(ranked):
+        cutoff = ranked[min(tiers["closest"], len(ranked)) - 1]
+        share = np.where(
+            error <= cutoff, np.maximum(share, tiers["closest_share"]), share
+        )
+
+    share = np.where(error <= within, np.maximum(share, tiers["within_share"]), share)
 
-            part_answer.points_awarded = answer_part.points if is_correct else 0
-            part_answer.scored_at = timezone.now()
-            part_answer.save()
+    return np.floor(share * total_points + 0.5).astype(int)  # half up
 
 
 # ============================================================================
@@ -229,6 +378,7 @@ _REGISTRY: dict[str, Scorer] = {
     "Ranking": RankingScorer(),
     "Matching": MatchingScorer(),
     "Multiple Open Ended": MultipleOpenEndedScorer(),
+    "Estimation": EstimationScorer(),
 }
 
 _DEFAULT: Scorer = SingleAnswerScorer()
@@ -244,4 +394,9 @@ def scorer_for(question: Question) -> Scorer:
     """
     if not question.question_type:
         return _DEFAULT
-    return _REGISTRY.get(question.question_type.name, _DEFAULT)
+    return scorer_for_type(question.question_type.name)
+
+
+def scorer_for_type(type_name: str | None) -> Scorer:
+    """scorer_for by QuestionType name, e.g. from a session content snapshot."""
+    return _REGISTRY.get(type_name, _DEFAULT)
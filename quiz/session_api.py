@@ -4,13 +4,26 @@ Token-based authentication for admin and team actions.
 """
 
 import json
+import math
+import time
+from datetime import datetime
 from functools import wraps
-from datetime import timedelta
-from typing import Callable, Optional
-
-from django.shortcuts import get_object_or_404
-from django.http import HttpRequest, JsonResponse
+from typing import AsyncIterator, Callable, Optional
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.shortcuts import aget_object_or_404, get_object_or_404
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotModified,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.http import parse_etags
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.db import models, transaction
@@ -18,16 +31,27 @@ from django_ratelimit.decorators import ratelimit
 from django_ratelimit.exceptions import Ratelimited
 
 from .models import (
-    Answer,
     Game,
-    Question,
     QuestionRound,
     GameSession,
+    SessionEvent,
     SessionTeam,
     SessionRound,
     TeamAnswer,
 )
-from .scoring import scorer_for
+from . import (
+    answer_clusters,
+    answer_drafts,
+    heartbeats,
+    poll_intervals,
+    session_broker,
+    session_cache,
+    session_content,
+    session_progress,
+    standings,
+    suggestions,
+)
+from .rate_limits import rate_limit
 from .session_director import InvalidTransition, SessionDirector
 from .utils import has_verified_email
 
@@ -40,7 +64,13 @@ def ratelimit_error(request: HttpRequest, exception: Exception) -> JsonResponse:
 
 
 # Configuration
-ADMIN_TIMEOUT_SECONDS = 30  # Pause if admin not seen for this long
+STREAM_KEEPALIVE_SECONDS = 15  # Comment line sent on idle event streams
+STREAM_MAX_SECONDS = 600  # Streams close after this long; EventSource reconnects
+STREAM_RETRY_MS = 3000  # Client reconnect delay advertised to EventSource
+EVENTS_PAGE_SIZE = 200  # Max events returned per delta-sync request
+SCORE_BATCH_MAX_ITEMS = 500  # Max scores accepted by one score-batch request
+ANSWER_BATCH_MAX_ITEMS = 100  # Max answers accepted by one answers-batch request
+ANSWER_BATCH_ID_MAX_LENGTH = 64
 
 
 # ============================================================================
@@ -48,64 +78,149 @@ ADMIN_TIMEOUT_SECONDS = 30  # Pause if admin not seen for this long
 # ============================================================================
 
 
+def _session_context() -> models.QuerySet:
+    """Sessions with the relations views touch on every request, in one query.
+
+    Question content comes from the session's snapshot (session_content),
+    so the content column itself is left unloaded here.
+    """
+    return GameSession.objects.select_related("game", "current_round").defer("content")
+
+
+def _authenticate_admin(code: str, token: str) -> tuple[Optional[GameSession], int]:
+    """Resolve an admin token to its session. Returns (session, error status)."""
+    entry = session_cache.resolve_token(code, token)
+    if entry is not None and entry["role"] == session_cache.ROLE_ADMIN:
+        session = _session_context().filter(id=entry["session_id"]).first()
+        if session is not None:
+            return session, 0
+        session_cache.forget_tokens(token)
+
+    session = _session_context().filter(code=code).first()
+    if session is None:
+        return None, 404
+    if session.admin_token != token:
+        return None, 403
+    session_cache.remember_token(
+        token, code=code, session_id=session.id, role=session_cache.ROLE_ADMIN
+    )
+    return session, 0
+
+
+def _team_context() -> models.QuerySet:
+    return SessionTeam.objects.select_related(
+        "session__game", "session__current_round"
+    ).defer("session__content")
+
+
+def _authenticate_team(code: str, token: str) -> Optional[SessionTeam]:
+    """Resolve a team token to its team, with the session context loaded."""
+    teams = _team_context()
+    entry = session_cache.resolve_token(code, token)
+    if entry is not None and entry["role"] == session_cache.ROLE_TEAM:
+        team = teams.filter(id=entry["team_id"]).first()
+        if team is not None:
+            return team
+        session_cache.forget_tokens(token)
+
+    team = teams.filter(session__code=code, token=token).first() if token else None
+    if team is not None:
+        session_cache.remember_token(
+            token,
+            code=code,
+            session_id=team.session_id,
+            role=session_cache.ROLE_TEAM,
+            team_id=team.id,
+        )
+    return team
+
+
+async def _aauthenticate_team(code: str, token: str) -> Optional[SessionTeam]:
+    teams = _team_context()
+    entry = await session_cache.aresolve_token(code, token)
+    if entry is not None and entry["role"] == session_cache.ROLE_TEAM:
+        team = await teams.filter(id=entry["team_id"]).afirst()
+        if team is not None:
+            return team
+        await session_cache.aforget_tokens(token)
+
+    team = (
+        await teams.filter(session__code=code, token=token).afirst() if token else None
+    )
+    if team is not None:
+        await session_cache.aremember_token(
+            token,
+            code=code,
+            session_id=team.session_id,
+            role=session_cache.ROLE_TEAM,
+            team_id=team.id,
+        )
+    return team
+
+
 def require_admin_token(view_func: Callable) -> Callable:
-    """Validates admin token and updates last_seen timestamp."""
+    """Validates admin token and records the host heartbeat."""
 
     @wraps(view_func)
     def wrapper(request: HttpRequest, code: str, *args, **kwargs) -> JsonResponse:
         token = request.headers.get("Authorization", "").replace("Bearer ", "")
-        try:
-            session = GameSession.objects.get(code=code)
-            if session.admin_token != token:
-                return JsonResponse({"error": "Invalid admin token"}, status=403)
+        session, error_status = _authenticate_admin(code, token)
+        if error_status == 404:
+            return JsonResponse({"error": "Session not found"}, status=404)
+        if error_status == 403:
+            return JsonResponse({"error": "Invalid admin token"}, status=403)
 
-            # Update admin heartbeat
-            session.admin_last_seen = timezone.now()
+        # Update admin heartbeat (buffered, see heartbeats)
+        heartbeats.beat_admin(code)
 
-            # Auto-resume if was paused
-            if session.status == GameSession.Status.PAUSED:
-                session.resume()
-            else:
-                session.save(update_fields=["admin_last_seen"])
+        # Auto-resume if was paused
+        if session.status == GameSession.Status.PAUSED:
+            session.admin_last_seen = timezone.now()
+            session.resume()
 
-            request.session_obj = session
-        except GameSession.DoesNotExist:
-            return JsonResponse({"error": "Session not found"}, status=404)
+        request.session_obj = session
         return view_func(request, code, *args, **kwargs)
 
     return wrapper
 
 
 def require_team_token(view_func: Callable) -> Callable:
-    """Validates team token and updates last_seen timestamp."""
+    """Validates team token and records the team heartbeat.
+
+    Wraps async views too, authenticating on the async ORM and cache API.
+    """
+
+    if iscoroutinefunction(view_func):
+
+        @wraps(view_func)
+        async def async_wrapper(
+            request: HttpRequest, code: str, *args, **kwargs
+        ) -> JsonResponse:
+            token = request.headers.get("Authorization", "").replace("Bearer ", "")
+            team = await _aauthenticate_team(code, token)
+            if team is None:
+                return JsonResponse({"error": "Invalid session or team"}, status=403)
+            await heartbeats.abeat_team(code, team.id)
+            request.session_obj = team.session
+            request.team = team
+            return await view_func(request, code, *args, **kwargs)
+
+        return async_wrapper
 
     @wraps(view_func)
     def wrapper(request: HttpRequest, code: str, *args, **kwargs) -> JsonResponse:
         token = request.headers.get("Authorization", "").replace("Bearer ", "")
-        try:
-            session = GameSession.objects.get(code=code)
-            team = session.teams.get(token=token)
-            team.last_seen = timezone.now()
-            team.save(update_fields=["last_seen"])
-            request.session_obj = session
-            request.team = team
-        except (GameSession.DoesNotExist, SessionTeam.DoesNotExist):
+        team = _authenticate_team(code, token)
+        if team is None:
             return JsonResponse({"error": "Invalid session or team"}, status=403)
+        heartbeats.beat_team(code, team.id)
+        request.session_obj = team.session
+        request.team = team
         return view_func(request, code, *args, **kwargs)
 
     return wrapper
 
 
-def check_admin_timeout(session: GameSession) -> bool:
-    """Check if admin has timed out and pause if needed."""
-    if session.status in [GameSession.Status.PLAYING, GameSession.Status.SCORING]:
-        timeout_threshold = timezone.now() - timedelta(seconds=ADMIN_TIMEOUT_SECONDS)
-        if session.admin_last_seen < timeout_threshold:
-            session.pause()
-            return True
-    return False
-
-
 # ============================================================================
 # PUBLIC ENDPOINTS
 # ============================================================================
@@ -175,6 +290,9 @@ def create_session(request: HttpRequest) -> JsonResponse:
     for round_obj in rounds:
         SessionRound.objects.create(session=session, round=round_obj)
 
+    # Freeze the game's content for this session (see session_content)
+    session_content.store(session)
+
     return JsonResponse(
         {
             "code": session.code,
@@ -187,7 +305,7 @@ def create_session(request: HttpRequest) -> JsonResponse:
 
 @csrf_exempt
 @require_http_methods(["POST"])
-@ratelimit(key="ip", rate="20/m", method="POST", block=True)
+@rate_limit("join")
 @transaction.atomic
 def join_session(request: HttpRequest, code: str) -> JsonResponse:
     """Team joins session. Supports late joins during active rounds."""
@@ -221,6 +339,10 @@ def join_session(request: HttpRequest, code: str) -> JsonResponse:
     team = SessionTeam.objects.create(
         session=session, name=team_name, joined_late=is_late_join
     )
+    session.record_event(
+        SessionEvent.Kind.TEAM_JOINED,
+        {"team_id": team.id, "team_name": team.name, "joined_late": is_late_join},
+    )
 
     return JsonResponse(
         {
@@ -235,16 +357,8 @@ def join_session(request: HttpRequest, code: str) -> JsonResponse:
     )
 
 
-@require_http_methods(["GET"])
-def get_session_state(request: HttpRequest, code: str) -> JsonResponse:
-    """Poll endpoint for current state. No auth required for basic info."""
-    session = get_object_or_404(GameSession, code=code)
-
-    # Check for admin timeout
-    is_paused = check_admin_timeout(session)
-    if is_paused:
-        session.refresh_from_db()
-
+def _build_session_state(session: GameSession) -> dict:
+    """Full state payload shared by the poll endpoint and the event stream."""
     # Get current round info
     current_round_info = None
     if session.current_round:
@@ -258,53 +372,25 @@ def get_session_state(request: HttpRequest, code: str) -> JsonResponse:
                 "status": session_round.status,
             }
 
+    content = session_content.for_session(session)
+
     # Get question info
     current_question_info = None
-    if session.current_question:
-        question = session.current_question
-        current_question_info = {
-            "id": question.id,
-            "number": question.question_number,
-            "text": question.text,
-            "total_points": question.total_points,
-            "image_url": question.question_image_url,
-            "video_url": question.question_video_url,
-            "answer_image_url": question.answer_image_url,
-            "answer_video_url": question.answer_video_url,
-            "answer_bank": question.answer_bank,
-            "category_name": question.category.name if question.category else None,
-            "question_type": (
-                question.question_type.name if question.question_type else None
-            ),
-            "answers": [
-                {
-                    "id": a.id,
-                    "text": a.text,
-                    "answer_text": a.answer_text,
-                    "display_order": a.display_order,
-                    "image_url": a.question_image_url,
-                    "answer_image_url": a.answer_image_url,
-                    "video_url": a.question_video_url,
-                    "answer_video_url": a.answer_video_url,
-                    "points": a.points,
-                    "correct_rank": a.correct_rank,
-                }
-                for a in question.answers.all().order_by("display_order")
-            ],
-        }
-
-    # Bulk query: Get set of team IDs that have answered current question
-    answered_team_ids = set()
-    if session.current_question:
-        answered_team_ids = set(
-            TeamAnswer.objects.filter(
-                team__session=session,
-                question=session.current_question,
-                answer_text__gt="",
-            ).values_list("team_id", flat=True)
-        )
+    question = content.question(session.current_question_id)
+    if question:
+        current_question_info = session_content.public_question(question)
 
     teams = list(session.teams.order_by("id"))
+
+    # Submission counters come from the cache (see session_progress)
+    questions_in_round = content.round_questions(session.current_round_id)
+    submission_counts, answered_team_ids = session_progress.submissions(
+        session,
+        [q["id"] for q in questions_in_round],
+        session.current_question_id,
+        [t.id for t in teams],
+    )
+
     teams_data = [
         {
             "id": t.id,
@@ -316,52 +402,210 @@ def get_session_state(request: HttpRequest, code: str) -> JsonResponse:
         for t in teams
     ]
 
-    # Get round progress: submission counts for each question in current round
-    round_progress = []
-    if session.current_round:
-        questions_in_round = list(
-            session.game.questions.filter(game_round=session.current_round).order_by(
-                "question_number"
-            )
-        )
+    # Round progress: submission counts for each question in current round
+    round_progress = [
+        {
+            "question_id": question["id"],
+            "question_number": question["number"],
+            "submitted_count": submission_counts[question["id"]],
+            "total_teams": len(teams),
+        }
+        for question in questions_in_round
+    ]
 
-        total_teams = len(teams)
+    return {
+        "changed": True,
+        "version": session.state_version,
+        "event_seq": session.event_seq,
+        "status": session.status,
+        "game_name": content.game_name,
+        "game_id": session.game_id,
+        "admin_name": session.admin_name,
+        "current_round": current_round_info,
+        "current_question": current_question_info,
+        "teams": teams_data,
+        "team_count": len(teams_data),
+        "max_teams": session.max_teams,
+        "allow_team_navigation": session.allow_team_navigation,
+        "round_progress": round_progress,
+    }
 
-        # Bulk query: Get submission counts per question
-        submission_counts = dict(
-            TeamAnswer.objects.filter(
-                question__in=questions_in_round,
-                team__session=session,
-                answer_text__gt="",
-            )
-            .values("question_id")
-            .annotate(count=models.Count("id"))
-            .values_list("question_id", "count")
+
+def _state_etag(version: int) -> str:
+    return f'"v{version}"'
+
+
+def _load_state_snapshot(code: str) -> Optional[dict]:
+    """Cached state snapshot, rebuilt from the DB when stale.
+
+    Returns None if the session does not exist.
+    """
+    snapshot = session_cache.get_state(code)
+    if snapshot is not None:
+        return snapshot
+
+    session = _session_context().filter(code=code).first()
+    if session is None:
+        return None
+    return session_cache.store_state(session, _build_session_state(session))
+
+
+@require_http_methods(["GET"])
+def get_session_state(request: HttpRequest, code: str) -> HttpResponse:
+    """Poll endpoint for current state. No auth required for basic info.
+
+    Read-only: host timeouts are handled by the sweep_admin_timeouts
+    command. Served from the cached snapshot (see session_cache), so a poll
+    between state changes is one cache round trip. Conditional: answers 304
+    when If-None-Match carries the current ETag, and {"changed": false} when
+    ?since_version= matches.
+
+    Responses suggest when to poll next (see poll_intervals): `next_poll_ms`
+    in the body, Retry-After on a 304.
+    """
+    if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+    since_version = request.GET.get("since_version")
+
+    snapshot = session_cache.get_state(code)
+    if snapshot is None:
+        session = get_object_or_404(_session_context(), code=code)
+
+        # An up-to-date client doesn't need the payload built.
+        version = session.state_version
+        if _state_etag(version) in if_none_match or since_version == str(version):
+            snapshot = {"version": version, "status": session.status, "body": None}
+        else:
+            snapshot = session_cache.store_state(session, _build_session_state(session))
+
+    return _state_response(snapshot, if_none_match, since_version)
+
+
+@require_http_methods(["GET"])
+async def aget_session_state(request: HttpRequest, code: str) -> HttpResponse:
+    """get_session_state for ASGI deployments (SESSION_ASYNC_VIEWS)."""
+    if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+    since_version = request.GET.get("since_version")
+
+    snapshot = await session_cache.aget_state(code)
+    if snapshot is None:
+        session = await aget_object_or_404(_session_context(), code=code)
+
+        version = session.state_version
+        if _state_etag(version) in if_none_match or since_version == str(version):
+            snapshot = {"version": version, "status": session.status, "body": None}
+        else:
+            state = await sync_to_async(_build_session_state)(session)
+            snapshot = await session_cache.astore_state(session, state)
+
+    return _state_response(snapshot, if_none_match, since_version)
+
+
+def _state_response(
+    snapshot: dict, if_none_match: list[str], since_version: Optional[str]
+) -> HttpResponse:
+    version = snapshot["version"]
+    etag = _state_etag(version)
+    next_poll_ms = poll_intervals.next_poll_ms(
+        snapshot["status"], snapshot.get("round_status"), snapshot.get("changed_at")
+    )
+    if etag in if_none_match:
+        response = HttpResponseNotModified()
+        response["ETag"] = etag
+        response["Retry-After"] = str(math.ceil(next_poll_ms / 1000))
+        return response
+
+    if since_version is not None and since_version == str(version):
+        return JsonResponse(
+            {"changed": False, "version": version, "next_poll_ms": next_poll_ms}
         )
 
-        for question in questions_in_round:
-            round_progress.append(
-                {
-                    "question_id": question.id,
-                    "question_number": question.question_number,
-                    "submitted_count": submission_counts.get(question.id, 0),
-                    "total_teams": total_teams,
-                }
-            )
+    # The cached body is an already serialized object; prepend the hint
+    # rather than decode and re-encode it on every poll.
+    body = f'{{"next_poll_ms": {next_poll_ms}, {snapshot["body"][1:]}'
+    response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    response["Cache-Control"] = "no-cache"
+    return response
+
+
+def _state_event(snapshot: dict) -> str:
+    return f"id: {snapshot['version']}\nevent: state\ndata: {snapshot['body']}\n\n"
+
+
+@require_http_methods(["GET"])
+async def session_event_stream(request: HttpRequest, code: str):
+    """Server-Sent Events stream of session state. No auth, same payload as the poll.
+
+    Sends a `state` event on connect and whenever the session's state
+    version moves, with the version as the event id. Only enabled for ASGI
+    deployments (SESSION_EVENT_STREAM_ENABLED): under sync workers each open
+    stream would pin a worker.
+    """
+    if not settings.SESSION_EVENT_STREAM_ENABLED:
+        raise Http404("Event stream disabled")
+
+    if not await GameSession.objects.filter(code=code).aexists():
+        raise Http404("Session not found")
+
+    async def stream() -> AsyncIterator[str]:
+        yield f"retry: {STREAM_RETRY_MS}\n\n"
+        deadline = time.monotonic() + STREAM_MAX_SECONDS
+        snapshot = await sync_to_async(_load_state_snapshot)(code)
+        while snapshot is not None:
+            yield _state_event(snapshot)
+            if snapshot["status"] == GameSession.Status.COMPLETED:
+                return
+
+            version = snapshot["version"]
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                new_version = await session_broker.wait_for_change(
+                    code, version, min(remaining, STREAM_KEEPALIVE_SECONDS)
+                )
+                if new_version is not None:
+                    break
+                yield ": keep-alive\n\n"
+
+            snapshot = await sync_to_async(_load_state_snapshot)(code)
+
+    response = StreamingHttpResponse(stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+@require_http_methods(["GET"])
+def get_session_events(request: HttpRequest, code: str) -> JsonResponse:
+    """Delta sync: events with seq greater than ?after=, oldest first.
+
+    Clients take a full state snapshot (which carries event_seq), then apply
+    events from there on. A reconnecting device asks only for what it missed.
+    Answer submissions are logged only when an answer turns empty or
+    non-empty; round progress comes from the state snapshot's counters.
+    """
+    session = get_object_or_404(GameSession, code=code)
+
+    try:
+        after = int(request.GET.get("after", 0))
+    except ValueError:
+        return JsonResponse({"error": "after must be an integer"}, status=400)
+
+    events = list(
+        session.events.filter(seq__gt=after)
+        .order_by("seq")
+        .values("seq", "kind", "payload", "created_at")[: EVENTS_PAGE_SIZE + 1]
+    )
+    has_more = len(events) > EVENTS_PAGE_SIZE
+    events = events[:EVENTS_PAGE_SIZE]
 
     return JsonResponse(
         {
-            "status": session.status,
-            "game_name": session.game.name,
-            "game_id": session.game.id,
-            "admin_name": session.admin_name,
-            "current_round": current_round_info,
-            "current_question": current_question_info,
-            "teams": teams_data,
-            "team_count": len(teams_data),
-            "max_teams": session.max_teams,
-            "allow_team_navigation": session.allow_team_navigation,
-            "round_progress": round_progress,
+            "events": events,
+            "last_seq": events[-1]["seq"] if events else after,
+            "has_more": has_more,
+            "version": session.state_version,
         }
     )
 
@@ -399,7 +643,9 @@ def admin_set_question(request: HttpRequest, code: str) -> JsonResponse:
     if not question_id:
         return JsonResponse({"error": "question_id required"}, status=400)
 
-    question = get_object_or_404(Question, id=question_id, game=session.game)
+    question = session_content.for_session(session).question(question_id)
+    if question is None:
+        raise Http404("Question not found")
 
     try:
         result = SessionDirector(session).set_current_question(question)
@@ -425,7 +671,11 @@ def admin_toggle_team_navigation(request: HttpRequest, code: str) -> JsonRespons
         return JsonResponse({"error": "allow_team_navigation required"}, status=400)
 
     session.allow_team_navigation = bool(allow_navigation)
-    session.save(update_fields=["allow_team_navigation"])
+    session.save(update_fields=["allow_team_navigation", "state_version"])
+    session.record_event(
+        SessionEvent.Kind.TEAM_NAVIGATION_CHANGED,
+        {"allow_team_navigation": session.allow_team_navigation},
+    )
 
     return JsonResponse(
         {
@@ -447,45 +697,69 @@ def admin_lock_round(request: HttpRequest, code: str) -> JsonResponse:
     return JsonResponse(result)
 
 
+def _suggestion_fields(suggestion: Optional[dict]) -> dict:
+    if suggestion is None:
+        return {"suggested_points": None, "suggestion_confidence": None}
+    return {
+        "suggested_points": suggestion["suggested_points"],
+        "suggestion_confidence": suggestion["confidence"],
+    }
+
+
 @require_http_methods(["GET"])
 @require_admin_token
 def admin_get_scoring_data(request: HttpRequest, code: str) -> JsonResponse:
     """Get all answers for current round for scoring UI.
-    Returns per-part structure for multi-part questions."""
+    Returns per-part structure for multi-part questions.
+
+    With ?group=clusters each question also carries "clusters": its
+    answers grouped by normalized text (see answer_clusters), to be scored
+    with admin_score_cluster.
+
+    Answers to free-text questions carry suggested_points and
+    suggestion_confidence (see suggestions); suggested_points is None where
+    the host has to judge.
+
+    Runs a fixed number of queries: the round's answers are fetched once
+    and grouped by (team, question, part) in memory."""
     session = request.session_obj
-    session_round = session.session_rounds.get(round=session.current_round)
+    group_clusters = request.GET.get("group") == "clusters"
 
-    questions = (
-        session.game.questions.filter(game_round=session.current_round)
-        .order_by("question_number")
-        .prefetch_related("answers", "question_type")
+    questions = session_content.for_session(session).round_questions(
+        session.current_round_id
     )
 
     teams = list(session.teams.order_by("id"))
+    stored = {
+        (a.team_id, a.question_id, a.answer_part_id): a
+        for a in TeamAnswer.objects.filter(
+            team__session=session, question_id__in=[q["id"] for q in questions]
+        )
+    }
     data = []
 
     for question in questions:
-        is_multi_part = scorer_for(question).is_multi_part(question)
-        answer_parts = list(question.answers.order_by("display_order"))
+        is_multi_part = question["is_multi_part"]
+        answer_parts = question["answers"]  # display order
+        question_answers = [a for key, a in stored.items() if key[1] == question["id"]]
+        suggested = suggestions.suggest(question, question_answers)
 
         q_data = {
-            "id": question.id,
-            "number": question.question_number,
-            "text": question.text,
-            "total_points": question.total_points,
-            "category_name": question.category.name if question.category else None,
-            "question_type": (
-                question.question_type.name if question.question_type else None
-            ),
+            "id": question["id"],
+            "number": question["number"],
+            "text": question["text"],
+            "total_points": question["total_points"],
+            "category_name": question["category_name"],
+            "question_type": question["question_type"],
             "is_multi_part": is_multi_part,
             "correct_answers": [
                 {
-                    "id": a.id,
-                    "sub_question": a.text,
-                    "answer_text": a.answer_text,
-                    "correct_rank": a.correct_rank,
-                    "points": a.points,
-                    "display_order": a.display_order,
+                    "id": a["id"],
+                    "sub_question": a["text"],
+                    "answer_text": a["answer_text"],
+                    "correct_rank": a["correct_rank"],
+                    "points": a["points"],
+                    "display_order": a["display_order"],
                 }
                 for a in answer_parts
             ],
@@ -494,29 +768,24 @@ def admin_get_scoring_data(request: HttpRequest, code: str) -> JsonResponse:
 
         for team in teams:
             if is_multi_part:
-                # Get per-part TeamAnswer records
-                part_answers = TeamAnswer.objects.filter(
-                    team=team, question=question, answer_part__isnull=False
-                ).select_related("answer_part")
-
-                # Build lookup by answer_part_id
-                part_lookup = {pa.answer_part_id: pa for pa in part_answers}
-
                 parts = []
                 total_points_awarded = 0
                 all_scored = True
 
                 for answer_part in answer_parts:
-                    part_answer = part_lookup.get(answer_part.id)
+                    part_answer = stored.get(
+                        (team.id, question["id"], answer_part["id"])
+                    )
                     if part_answer:
                         parts.append(
                             {
-                                "answer_part_id": answer_part.id,
+                                "answer_part_id": answer_part["id"],
                                 "team_answer_id": part_answer.id,
                                 "answer_text": part_answer.answer_text,
                                 "points_awarded": part_answer.points_awarded,
-                                "max_points": answer_part.points,
+                                "max_points": answer_part["points"],
                                 "is_scored": part_answer.points_awarded is not None,
+                                **_suggestion_fields(suggested.get(part_answer.id)),
                             }
                         )
                         if part_answer.points_awarded is not None:
@@ -526,11 +795,11 @@ def admin_get_scoring_data(request: HttpRequest, code: str) -> JsonResponse:
                     else:
                         parts.append(
                             {
-                                "answer_part_id": answer_part.id,
+                                "answer_part_id": answer_part["id"],
                                 "team_answer_id": None,
                                 "answer_text": "",
                                 "points_awarded": None,
-                                "max_points": answer_part.points,
+                                "max_points": answer_part["points"],
                                 "is_scored": False,
                             }
                         )
@@ -549,9 +818,7 @@ def admin_get_scoring_data(request: HttpRequest, code: str) -> JsonResponse:
                 )
             else:
                 # Single-answer question (backwards compatible)
-                answer = TeamAnswer.objects.filter(
-                    team=team, question=question, answer_part__isnull=True
-                ).first()
+                answer = stored.get((team.id, question["id"], None))
 
                 q_data["team_answers"].append(
                     {
@@ -563,9 +830,19 @@ def admin_get_scoring_data(request: HttpRequest, code: str) -> JsonResponse:
                         "is_scored": (
                             answer.points_awarded is not None if answer else False
                         ),
+                        **_suggestion_fields(
+                            suggested.get(answer.id if answer else None)
+                        ),
                     }
                 )
 
+        if group_clusters:
+            max_points = {a["id"]: a["points"] for a in answer_parts if is_multi_part}
+            max_points[None] = question["total_points"]
+            q_data["clusters"] = answer_clusters.build(
+                question_answers, max_points, suggested
+            )
+
         data.append(q_data)
 
     return JsonResponse(
@@ -577,9 +854,34 @@ def admin_get_scoring_data(request: HttpRequest, code: str) -> JsonResponse:
     )
 
 
+def _parse_points(raw) -> tuple[Optional[int], Optional[str]]:
+    """Validate a points value from a scoring request. Returns (points, error)."""
+    if raw is None:
+        return None, "points required"
+    try:
+        points = int(raw)
+    except (ValueError, TypeError):
+        return None, "points must be an integer"
+    if points < 0:
+        return None, "Points cannot be negative"
+    return points, None
+
+
+def _max_points(answer: TeamAnswer, content: session_content.SessionContent) -> int:
+    """Per-part answers are capped by the part's points, others by the question's.
+
+    Read from the session's content snapshot, like the scoring UI.
+    """
+    if answer.answer_part_id:
+        return content.answer_points(answer.question_id, answer.answer_part_id) or 0
+    question = content.question(answer.question_id)
+    return question["total_points"] if question else 0
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 @require_admin_token
+@rate_limit("admin_score")
 @transaction.atomic
 def admin_score_answer(request: HttpRequest, code: str) -> JsonResponse:
     """Award points for an answer or answer part.
@@ -598,20 +900,12 @@ def admin_score_answer(request: HttpRequest, code: str) -> JsonResponse:
     team_id = data.get("team_id")
     question_id = data.get("question_id")
     answer_part_id = data.get("answer_part_id")  # Optional: Answer.id for per-part
-    points = data.get("points")
-
-    if points is None:
-        return JsonResponse({"error": "points required"}, status=400)
-
-    try:
-        points = int(points)
-    except (ValueError, TypeError):
-        return JsonResponse({"error": "points must be an integer"}, status=400)
-
-    if points < 0:
-        return JsonResponse({"error": "Points cannot be negative"}, status=400)
+    points, error = _parse_points(data.get("points"))
+    if error:
+        return JsonResponse({"error": error}, status=400)
 
     # Find the TeamAnswer to score
+    content = session_content.for_session(session)
     answer = None
 
     if team_answer_id:
@@ -622,40 +916,38 @@ def admin_score_answer(request: HttpRequest, code: str) -> JsonResponse:
         answer = get_object_or_404(TeamAnswer, id=answer_id)
     elif team_id and question_id:
         team = get_object_or_404(SessionTeam, id=team_id, session=session)
-        question = get_object_or_404(Question, id=question_id)
-        session_round = session.session_rounds.get(round=question.game_round)
+        question = content.question(question_id)
+        if question is None:
+            raise Http404("Question not found")
+        session_round = session.session_rounds.get(round_id=question["round_id"])
 
         if answer_part_id:
             # Per-part scoring via team_id + question_id + answer_part_id
-            answer_part = get_object_or_404(Answer, id=answer_part_id)
-            answer, _ = TeamAnswer.objects.get_or_create(
+            if content.answer_points(question["id"], int(answer_part_id)) is None:
+                raise Http404("Answer part not found")
+            answer, created = TeamAnswer.objects.get_or_create(
                 team=team,
-                question=question,
-                answer_part=answer_part,
+                question_id=question["id"],
+                answer_part_id=int(answer_part_id),
                 defaults={"session_round": session_round, "is_locked": True},
             )
         else:
             # Single-answer question
-            answer, _ = TeamAnswer.objects.get_or_create(
+            answer, created = TeamAnswer.objects.get_or_create(
                 team=team,
-                question=question,
+                question_id=question["id"],
                 answer_part=None,
                 defaults={"session_round": session_round, "is_locked": True},
             )
+        if created:
+            session_progress.add_unscored(code, {question["id"]: 1})
     else:
         return JsonResponse(
             {"error": "Provide team_answer_id, answer_id, or (team_id + question_id)"},
             status=400,
         )
 
-    # Validate points range based on whether this is per-part or full question
-    if answer.answer_part:
-        # Per-part scoring: max is the Answer.points value
-        max_points = answer.answer_part.points
-    else:
-        # Full question scoring: max is question.total_points
-        max_points = answer.question.total_points
-
+    max_points = _max_points(answer, content)
     if points > max_points:
         return JsonResponse({"error": f"Points cannot exceed {max_points}"}, status=400)
 
@@ -674,6 +966,188 @@ def admin_score_answer(request: HttpRequest, code: str) -> JsonResponse:
     )
 
 
+@csrf_exempt
+@require_http_methods(["POST"])
+@require_admin_token
+@rate_limit("admin_score")
+@transaction.atomic
+def admin_score_batch(request: HttpRequest, code: str) -> JsonResponse:
+    """Award points for many answers in one request.
+
+    Body: {"scores": [{"team_answer_id": 12, "points": 2},
+                      {"team_id": 3, "question_id": 7, "points": 5}, ...]}
+    Items identify their answer the same ways admin_score_answer accepts
+    (team_answer_id, answer_id, or team_id + question_id [+ answer_part_id])
+    and are checked against the same max-points rules. All or nothing: any
+    invalid item rejects the batch, with its index in the error.
+    """
+    session = request.session_obj
+
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    items = data.get("scores")
+    if not isinstance(items, list) or not items:
+        return JsonResponse({"error": "scores must be a non-empty list"}, status=400)
+    if len(items) > SCORE_BATCH_MAX_ITEMS:
+        return JsonResponse(
+            {"error": f"At most {SCORE_BATCH_MAX_ITEMS} scores per request"},
+            status=400,
+        )
+
+    def item_error(index: int, message: str) -> JsonResponse:
+        return JsonResponse({"error": f"scores[{index}]: {message}"}, status=400)
+
+    # Parse every item before touching the DB.
+    parsed = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            return item_error(index, "must be an object")
+        points, error = _parse_points(item.get("points"))
+        if error:
+            return item_error(index, error)
+        try:
+            answer_id, legacy_id, team_id, question_id, part_id = (
+                int(item[field]) if item.get(field) else None
+                for field in (
+                    "team_answer_id",
+                    "answer_id",
+                    "team_id",
+                    "question_id",
+                    "answer_part_id",
+                )
+            )
+        except (ValueError, TypeError):
+            return item_error(index, "ids must be integers")
+        if answer_id or legacy_id:
+            parsed.append((index, points, answer_id or legacy_id, None))
+        elif team_id and question_id:
+            parsed.append((index, points, None, (team_id, question_id, part_id)))
+        else:
+            return item_error(
+                index, "Provide team_answer_id, answer_id, or (team_id + question_id)"
+            )
+
+    # Resolve everything with a fixed number of queries.
+    content = session_content.for_session(session)
+    answers = TeamAnswer.objects.filter(team__session=session)
+    by_id = {a.id: a for a in answers.filter(id__in=[p[2] for p in parsed if p[2]])}
+    keys = [p[3] for p in parsed if p[3]]
+    by_key = {}
+    if keys:
+        by_key = {
+            (a.team_id, a.question_id, a.answer_part_id): a
+            for a in answers.filter(
+                team_id__in={k[0] for k in keys}, question_id__in={k[1] for k in keys}
+            )
+        }
+        team_ids = set(
+            session.teams.filter(id__in={k[0] for k in keys}).values_list(
+                "id", flat=True
+            )
+        )
+        session_rounds = {sr.round_id: sr for sr in session.session_rounds.all()}
+
+    # Answers addressed by (team, question[, part]) that don't exist yet are
+    # created locked, as admin_score_answer's get_or_create does.
+    to_create = []
+    for index, _, _, key in parsed:
+        if key is None or key in by_key:
+            continue
+        team_id, question_id, part_id = key
+        question = content.question(question_id)
+        if team_id not in team_ids or question is None:
+            return item_error(index, "Unknown team or question")
+        if part_id and content.answer_points(question_id, part_id) is None:
+            return item_error(index, "Unknown answer part")
+        session_round = session_rounds.get(question["round_id"])
+        if session_round is None:
+            return item_error(index, "Question is not in this session")
+        by_key[key] = TeamAnswer(
+            team_id=team_id,
+            question_id=question_id,
+            answer_part_id=part_id,
+            session_round=session_round,
+            is_locked=True,
+        )
+        to_create.append(by_key[key])
+
+    scores = []
+    for index, points, answer_id, key in parsed:
+        answer = by_id.get(answer_id) if answer_id else by_key[key]
+        if answer is None:
+            return item_error(index, "Answer not found")
+        max_points = _max_points(answer, content)
+        if points > max_points:
+            return item_error(index, f"Points cannot exceed {max_points}")
+        scores.append((answer, points))
+
+    TeamAnswer.objects.bulk_create(to_create)
+    created: dict[int, int] = {}
+    for answer in to_create:
+        created[answer.question_id] = created.get(answer.question_id, 0) + 1
+    session_progress.add_unscored(code, created)
+    result = SessionDirector(session).score_answers(scores)
+    return JsonResponse({"status": "scored", **result})
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+@require_admin_token
+@rate_limit("admin_score")
+@transaction.atomic
+def admin_score_cluster(request: HttpRequest, code: str) -> JsonResponse:
+    """Award the same points to every answer in a cluster.
+
+    Body: {"question_id": 7, "answer_part_id": null, "key": "paris",
+           "points": 2}, with `key` as returned by
+    admin_get_scoring_data?group=clusters. Members are resolved again
+    here, so the cluster is every answer to the question (or part) whose
+    normalized text equals `key` at the time of scoring.
+    """
+    session = request.session_obj
+
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    points, error = _parse_points(data.get("points"))
+    if error:
+        return JsonResponse({"error": error}, status=400)
+    key = data.get("key")
+    if not isinstance(key, str):
+        return JsonResponse({"error": "key required"}, status=400)
+    try:
+        part_id = int(data["answer_part_id"]) if data.get("answer_part_id") else None
+    except (ValueError, TypeError):
+        return JsonResponse({"error": "answer_part_id must be an integer"}, status=400)
+    content = session_content.for_session(session)
+    question = content.question(data.get("question_id"))
+    if question is None:
+        return JsonResponse({"error": "question_id required"}, status=400)
+
+    members = [
+        answer
+        for answer in TeamAnswer.objects.filter(
+            team__session=session, question_id=question["id"], answer_part_id=part_id
+        )
+        if answer_clusters.member_of(answer, key)
+    ]
+    if not members:
+        return JsonResponse({"error": "No answers in this cluster"}, status=404)
+    max_points = _max_points(members[0], content)
+    if points > max_points:
+        return JsonResponse({"error": f"Points cannot exceed {max_points}"}, status=400)
+
+    result = SessionDirector(session).score_answers(
+        [(answer, points) for answer in members]
+    )
+    return JsonResponse({"status": "scored", "count": len(members), **result})
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 @require_admin_token
@@ -714,49 +1188,61 @@ def admin_show_leaderboard(request: HttpRequest, code: str) -> JsonResponse:
 def get_leaderboard_data(request: HttpRequest, code: str) -> JsonResponse:
     """Get leaderboard data with team rankings, per-round scores, and upcoming rounds."""
     session = get_object_or_404(GameSession, code=code)
+    return JsonResponse(
+        _leaderboard_payload(
+            list(_leaderboard_rounds(session)),
+            standings.leaderboard(session),
+            session_content.for_session(session),
+        )
+    )
 
-    # Get all teams ordered by score
-    teams = list(session.teams.order_by("-score", "joined_at"))
 
-    # Get scored rounds
-    scored_rounds = list(
-        session.session_rounds.filter(status=SessionRound.Status.SCORED)
-        .select_related("round")
-        .order_by("round__round_number")
+@require_http_methods(["GET"])
+async def aget_leaderboard_data(request: HttpRequest, code: str) -> JsonResponse:
+    """get_leaderboard_data for ASGI deployments (SESSION_ASYNC_VIEWS)."""
+    session = await aget_object_or_404(GameSession, code=code)
+    session_rounds = [sr async for sr in _leaderboard_rounds(session)]
+    return JsonResponse(
+        _leaderboard_payload(
+            session_rounds,
+            await standings.aleaderboard(session),
+            await session_content.afor_session(session),
+        )
     )
 
-    # Get upcoming rounds (pending status)
-    upcoming_rounds = list(
-        session.session_rounds.filter(status=SessionRound.Status.PENDING)
+
+def _leaderboard_rounds(session: GameSession) -> models.QuerySet:
+    """Scored and upcoming rounds, in one query."""
+    return (
+        session.session_rounds.filter(
+            status__in=[SessionRound.Status.SCORED, SessionRound.Status.PENDING]
+        )
         .select_related("round")
         .order_by("round__round_number")
     )
 
-    # Pre-calculate max points per round with a single aggregated query
-    round_max_points = dict(
-        Question.objects.filter(game=session.game)
-        .values("game_round_id")
-        .annotate(max_points=models.Sum("total_points"))
-        .values_list("game_round_id", "max_points")
-    )
 
-    # Pre-calculate team scores per round with a single aggregated query
-    team_round_scores = {}
-    score_data = (
-        TeamAnswer.objects.filter(team__session=session, points_awarded__isnull=False)
-        .values("team_id", "session_round_id")
-        .annotate(total=models.Sum("points_awarded"))
-    )
-    for row in score_data:
-        key = (row["team_id"], row["session_round_id"])
-        team_round_scores[key] = row["total"]
+def _leaderboard_payload(
+    session_rounds: list[SessionRound],
+    teams: list[dict],
+    content: session_content.SessionContent,
+) -> dict:
+    """Leaderboard body from _leaderboard_rounds and standings.leaderboard.
+
+    Round max points come from the content snapshot."""
+    scored_rounds = [
+        sr for sr in session_rounds if sr.status == SessionRound.Status.SCORED
+    ]
+    upcoming_rounds = [
+        sr for sr in session_rounds if sr.status == SessionRound.Status.PENDING
+    ]
 
     # Build completed rounds info
     total_game_points = 0
     points_played = 0
     completed_rounds = []
     for sr in scored_rounds:
-        max_pts = round_max_points.get(sr.round_id, 0)
+        max_pts = content.round_max_points(sr.round_id)
         points_played += max_pts
         total_game_points += max_pts
         completed_rounds.append(
@@ -770,7 +1256,7 @@ def get_leaderboard_data(request: HttpRequest, code: str) -> JsonResponse:
     # Build upcoming rounds info
     upcoming_rounds_data = []
     for sr in upcoming_rounds:
-        available_points = round_max_points.get(sr.round_id, 0)
+        available_points = content.round_max_points(sr.round_id)
         total_game_points += available_points
         upcoming_rounds_data.append(
             {
@@ -782,26 +1268,27 @@ def get_leaderboard_data(request: HttpRequest, code: str) -> JsonResponse:
 
     points_remaining = total_game_points - points_played
 
-    # Build leaderboard with per-round scores (no additional queries needed)
+    # Ranked teams with their frozen round subtotals (standings.leaderboard)
     leaderboard = []
-    for rank, team in enumerate(teams, start=1):
+    for team in teams:
+        team_rounds = {r["round_number"]: r for r in team["rounds"]}
         round_scores = []
-        for sr in scored_rounds:
-            points_scored = team_round_scores.get((team.id, sr.id), 0)
-            max_points = round_max_points.get(sr.round_id, 0)
+        for round_data in completed_rounds:
+            # A team that joined late has no row for earlier rounds
+            team_round = team_rounds.get(round_data["round_number"])
             round_scores.append(
                 {
-                    "round_number": sr.round.round_number,
-                    "points_scored": points_scored,
-                    "max_points": max_points,
+                    "round_number": round_data["round_number"],
+                    "points_scored": team_round["points"] if team_round else 0,
+                    "max_points": round_data["max_points"],
                 }
             )
 
         leaderboard.append(
             {
-                "rank": rank,
-                "team_name": team.name,
-                "total_score": team.score,
+                "rank": team["rank"],
+                "team_name": team["name"],
+                "total_score": team["score"],
                 "round_scores": round_scores,
             }
         )
@@ -809,17 +1296,15 @@ def get_leaderboard_data(request: HttpRequest, code: str) -> JsonResponse:
     # Determine if this is the final round
     is_final_round = len(upcoming_rounds_data) == 0
 
-    return JsonResponse(
-        {
-            "leaderboard": leaderboard,
-            "completed_rounds": completed_rounds,
-            "upcoming_rounds": upcoming_rounds_data,
-            "total_game_points": total_game_points,
-            "points_played": points_played,
-            "points_remaining": points_remaining,
-            "is_final_round": is_final_round,
-        }
-    )
+    return {
+        "leaderboard": leaderboard,
+        "completed_rounds": completed_rounds,
+        "upcoming_rounds": upcoming_rounds_data,
+        "total_game_points": total_game_points,
+        "points_played": points_played,
+        "points_remaining": points_remaining,
+        "is_final_round": is_final_round,
+    }
 
 
 # ============================================================================
@@ -829,8 +1314,8 @@ def get_leaderboard_data(request: HttpRequest, code: str) -> JsonResponse:
 
 @csrf_exempt
 @require_http_methods(["POST"])
-@ratelimit(key="ip", rate="60/m", method="POST", block=True)
 @require_team_token
+@rate_limit("team_answer")
 def team_submit_answer(request: HttpRequest, code: str) -> JsonResponse:
     """Submit or update answer. Only works for active rounds."""
     session = request.session_obj
@@ -845,76 +1330,380 @@ def team_submit_answer(request: HttpRequest, code: str) -> JsonResponse:
     if not question_id:
         return JsonResponse({"error": "question_id required"}, status=400)
 
-    question = get_object_or_404(Question, id=question_id, game=session.game)
-    session_round = session.session_rounds.get(round=question.game_round)
+    question = session_content.for_session(session).question(question_id)
+    if question is None:
+        raise Http404("Question not found")
+    session_round = session.session_rounds.select_related("round").get(
+        round_id=question["round_id"]
+    )
 
     accepts, reason = SessionDirector(session).accepts_answers_for_round(session_round)
     if not accepts:
         return JsonResponse({"error": reason}, status=400)
 
     # Late joiners can only answer current round
-    if team.joined_late:
-        first_accessible_round = (
-            session.session_rounds.filter(started_at__gte=team.joined_at)
-            .order_by("round__round_number")
-            .first()
+    first_round_number = _first_accessible_round_number(session, team)
+    if first_round_number and session_round.round.round_number < first_round_number:
+        return JsonResponse(
+            {"error": "Cannot answer questions from earlier rounds"}, status=400
         )
 
-        if (
-            first_accessible_round
-            and session_round.round.round_number
-            < first_accessible_round.round.round_number
-        ):
-            return JsonResponse(
-                {"error": "Cannot answer questions from earlier rounds"}, status=400
-            )
+    answer_text = data.get("answer_text", "")
+    if not isinstance(answer_text, str):
+        return JsonResponse({"error": "answer_text must be a string"}, status=400)
+    if data.get("draft"):
+        # Autosaves are buffered in the cache and flushed in batches.
+        answer_drafts.save(
+            session, team.id, question["id"], session_round.id, answer_text
+        )
+        return JsonResponse({"status": "draft", "question_id": question["id"]})
 
-    answer, created = TeamAnswer.objects.get_or_create(
-        team=team, question=question, defaults={"session_round": session_round}
+    # An explicit submit supersedes any buffered draft: one upsert statement.
+    answer_drafts.discard(team.id, question["id"])
+    submitted = TeamAnswer.submit_text(
+        team.id, question["id"], session_round.id, answer_text
     )
-
-    if answer.is_locked:
+    if submitted is None:
         return JsonResponse({"error": "Answer is locked"}, status=400)
-
-    answer.answer_text = data.get("answer_text", "")
-    answer.save()
+    answer_id, created = submitted
+
+    if created:
+        session_progress.add_unscored(code, {question["id"]: 1})
+    # The polled state only exposes whether a team has answered, so only a
+    # change between empty and non-empty moves the state version and is
+    # logged; both in the one UPDATE of record_event.
+    has_answer = bool(answer_text)
+    if session_progress.record_submission(code, question["id"], team.id, has_answer):
+        session.record_event(
+            SessionEvent.Kind.ANSWER_SUBMITTED,
+            {
+                "team_id": team.id,
+                "question_id": question["id"],
+                "has_answer": has_answer,
+            },
+            state_changed=True,
+        )
 
     return JsonResponse(
-        {"status": "saved", "answer_id": answer.id, "question_id": question.id}
+        {"status": "saved", "answer_id": answer_id, "question_id": question["id"]}
+    )
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+@require_team_token
+@rate_limit("team_answer")
+def team_submit_answers_batch(request: HttpRequest, code: str) -> JsonResponse:
+    """Save several answers in one request, e.g. a queue kept while offline.
+
+    Body: {"batch_id": "...", "answers": [{"question_id": 3, "answer_text":
+    "..."}, ...]}
+    `batch_id` is a random id the client generates for each batch and keeps
+    until the batch is acknowledged. The id is claimed per team before
+    anything is written, so a retried batch is acknowledged as "duplicate"
+    without being applied again, and a retry racing the original gets a
+    409 to try again later. Batches from the team's other devices have
+    their own ids and are always applied. Round status and late-join rules
+    are checked for all items first; any invalid item rejects the batch,
+    with its index in the error. Answers are then written in one
+    transaction. Items for answers that are already locked are skipped and
+    listed under "locked".
+    """
+    session = request.session_obj
+    team = request.team
+
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    batch_id = data.get("batch_id")
+    if (
+        not isinstance(batch_id, str)
+        or not batch_id
+        or len(batch_id) > ANSWER_BATCH_ID_MAX_LENGTH
+    ):
+        return JsonResponse(
+            {
+                "error": "batch_id must be a string of 1 to "
+                f"{ANSWER_BATCH_ID_MAX_LENGTH} characters"
+            },
+            status=400,
+        )
+    items = data.get("answers")
+    if not isinstance(items, list) or not items:
+        return JsonResponse({"error": "answers must be a non-empty list"}, status=400)
+    if len(items) > ANSWER_BATCH_MAX_ITEMS:
+        return JsonResponse(
+            {"error": f"At most {ANSWER_BATCH_MAX_ITEMS} answers per request"},
+            status=400,
+        )
+
+    if not answer_drafts.claim_batch(team.id, batch_id):
+        if answer_drafts.batch_applied(team.id, batch_id):
+            return JsonResponse({"status": "duplicate", "batch_id": batch_id})
+        return JsonResponse(
+            {"error": "This batch is still being saved", "batch_id": batch_id},
+            status=409,
+        )
+    try:
+        with transaction.atomic():
+            response = _apply_answers_batch(session, team, items)
+            if response.status_code == 200:
+                # Applied exactly when the answers are committed; a worker
+                # dying in between leaves the claim to lapse and the retry
+                # to apply the batch.
+                transaction.on_commit(
+                    lambda: answer_drafts.mark_batch_applied(team.id, batch_id)
+                )
+    except Exception:
+        answer_drafts.release_batch(team.id, batch_id)
+        raise
+    if response.status_code != 200:
+        answer_drafts.release_batch(team.id, batch_id)
+    return response
+
+
+def _apply_answers_batch(
+    session: GameSession, team: SessionTeam, items: list
+) -> JsonResponse:
+    """Validate and write the items of an answers-batch whose id is claimed."""
+    code = session.code
+
+    def item_error(index: int, message: str) -> JsonResponse:
+        return JsonResponse({"error": f"answers[{index}]: {message}"}, status=400)
+
+    # Validate every item against the session before writing anything.
+    content = session_content.for_session(session)
+    session_rounds = {
+        sr.round_id: sr for sr in session.session_rounds.select_related("round")
+    }
+    first_round_number = _first_accessible_round_number(session, team)
+    director = SessionDirector(session)
+    texts: dict[int, tuple[str, SessionRound]] = {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            return item_error(index, "must be an object")
+        answer_text = item.get("answer_text", "")
+        if not isinstance(answer_text, str):
+            return item_error(index, "answer_text must be a string")
+        question = content.question(item.get("question_id"))
+        session_round = question and session_rounds.get(question["round_id"])
+        if not session_round:
+            return item_error(index, "Question not found")
+        accepts, reason = director.accepts_answers_for_round(session_round)
+        if not accepts:
+            return item_error(index, reason)
+        if first_round_number and session_round.round.round_number < first_round_number:
+            return item_error(index, "Cannot answer questions from earlier rounds")
+        # Queued in order: the last text for a question wins.
+        texts[question["id"]] = (answer_text, session_round)
+
+    saved, locked = [], []
+    created: dict[int, int] = {}
+    events = []
+    with transaction.atomic():
+        for question_id, (answer_text, session_round) in texts.items():
+            answer_drafts.discard(team.id, question_id)
+            submitted = TeamAnswer.submit_text(
+                team.id, question_id, session_round.id, answer_text
+            )
+            if submitted is None:
+                locked.append(question_id)
+                continue
+            saved.append(question_id)
+            if submitted[1]:
+                created[question_id] = 1
+            has_answer = bool(answer_text)
+            if session_progress.record_submission(
+                code, question_id, team.id, has_answer
+            ):
+                events.append(
+                    (
+                        SessionEvent.Kind.ANSWER_SUBMITTED,
+                        {
+                            "team_id": team.id,
+                            "question_id": question_id,
+                            "has_answer": has_answer,
+                        },
+                    )
+                )
+        session_progress.add_unscored(code, created)
+        session.record_events(events, state_changed=True)
+
+    return JsonResponse({"status": "saved", "saved": saved, "locked": locked})
+
+
+def _first_accessible_round_number(
+    session: GameSession, team: SessionTeam
+) -> Optional[int]:
+    """For a late joiner, the first round started after they joined."""
+    if not team.joined_late:
+        return None
+    first_accessible_round = (
+        session.session_rounds.filter(started_at__gte=team.joined_at)
+        .select_related("round")
+        .order_by("round__round_number")
+        .first()
     )
+    return first_accessible_round.round.round_number if first_accessible_round else None
 
 
 @require_http_methods(["GET"])
 @require_team_token
 def team_get_answers(request: HttpRequest, code: str) -> JsonResponse:
-    """Get team's answers for current round."""
+    """Get team's answers for current round.
+
+    With ?since=<last_updated from a previous response>, only questions
+    whose answers changed after that moment are returned.
+    """
     session = request.session_obj
     team = request.team
 
+    since = None
+    if request.GET.get("since"):
+        since = parse_datetime(request.GET["since"])
+        if since is None:
+            return JsonResponse({"error": "Invalid since timestamp"}, status=400)
+
     round_id = request.GET.get("round_id")
     if round_id:
-        target_round = get_object_or_404(QuestionRound, id=round_id)
-    else:
+        session_round = get_object_or_404(
+            SessionRound.objects.select_related("round"),
+            session=session,
+            round_id=round_id,
+        )
+        target_round = session_round.round
+    elif session.current_round:
         target_round = session.current_round
+        session_round = session.session_rounds.get(round=target_round)
+    else:
+        return JsonResponse({"answers": []})
+
+    # Get all questions in round with team's answers
+    questions = session_content.for_session(session).round_questions(target_round.id)
+    drafts = _team_drafts(session_round, team, questions)
+
+    answers = list(_team_round_answers(team, questions, since, drafts))
+    return JsonResponse(
+        _team_answers_payload(
+            session_round, target_round, questions, answers, drafts, since
+        )
+    )
 
-    if not target_round:
+
+@require_http_methods(["GET"])
+@require_team_token
+async def ateam_get_answers(request: HttpRequest, code: str) -> JsonResponse:
+    """team_get_answers for ASGI deployments (SESSION_ASYNC_VIEWS)."""
+    session = request.session_obj
+    team = request.team
+
+    since = None
+    if request.GET.get("since"):
+        since = parse_datetime(request.GET["since"])
+        if since is None:
+            return JsonResponse({"error": "Invalid since timestamp"}, status=400)
+
+    round_id = request.GET.get("round_id")
+    if round_id:
+        session_round = await aget_object_or_404(
+            SessionRound.objects.select_related("round"),
+            session=session,
+            round_id=round_id,
+        )
+        target_round = session_round.round
+    elif session.current_round:
+        target_round = session.current_round
+        session_round = await session.session_rounds.aget(round=target_round)
+    else:
         return JsonResponse({"answers": []})
 
-    session_round = session.session_rounds.get(round=target_round)
+    content = await session_content.afor_session(session)
+    questions = content.round_questions(target_round.id)
+    drafts = await sync_to_async(_team_drafts)(session_round, team, questions)
 
-    # Get all questions in round with team's answers
-    questions = session.game.questions.filter(game_round=target_round).order_by(
-        "question_number"
+    answers = [a async for a in _team_round_answers(team, questions, since, drafts)]
+    return JsonResponse(
+        _team_answers_payload(
+            session_round, target_round, questions, answers, drafts, since
+        )
+    )
+
+
+def _team_drafts(
+    session_round: SessionRound, team: SessionTeam, questions: list[dict]
+) -> dict[int, dict]:
+    """The team's buffered autosaves (answer_drafts) by question id. Only an
+    active round has drafts that aren't in TeamAnswer yet."""
+    if session_round.status != SessionRound.Status.ACTIVE:
+        return {}
+    drafts = answer_drafts.buffered([team.id], [q["id"] for q in questions])
+    return {question_id: draft for (_, question_id), draft in drafts.items()}
+
+
+def _team_round_answers(
+    team: SessionTeam,
+    questions: list[dict],
+    since: Optional[datetime],
+    drafts: dict[int, dict],
+) -> models.QuerySet:
+    """Every answer row the team has for `questions`, in one query; per-part
+    rows in display order."""
+    answers = team.answers.filter(question_id__in=[q["id"] for q in questions])
+    if since:
+        # A changed part means the whole question is resent, as does a
+        # newer draft
+        answers = answers.filter(
+            models.Q(
+                question__in=answers.filter(updated_at__gt=since).values("question")
+            )
+            | models.Q(
+                question_id__in=[
+                    question_id
+                    for question_id, draft in drafts.items()
+                    if draft["saved_at"] > since
+                ]
+            )
+        )
+    return answers.order_by("answer_part__display_order")
+
+
+def _team_answers_payload(
+    session_round: SessionRound,
+    target_round: QuestionRound,
+    questions: list[dict],
+    answers: list[TeamAnswer],
+    drafts: dict[int, dict],
+    since: Optional[datetime],
+) -> dict:
+    by_question: dict[int, list[TeamAnswer]] = {}
+    for answer in answers:
+        by_question.setdefault(answer.question_id, []).append(answer)
+    if since:
+        drafts = {
+            question_id: draft
+            for question_id, draft in drafts.items()
+            if draft["saved_at"] > since or question_id in by_question
+        }
+
+    last_updated = max(
+        [
+            *(a.updated_at for rows in by_question.values() for a in rows),
+            *(draft["saved_at"] for draft in drafts.values()),
+        ],
+        default=since,
     )
 
     answers_data = []
     for question in questions:
-        # Check for per-part answers first (new format)
-        part_answers = team.answers.filter(
-            question=question, answer_part__isnull=False
-        ).order_by("answer_part__display_order")
+        rows = by_question.get(question["id"], [])
+        draft = drafts.get(question["id"])
+        if since and not rows and not draft:
+            continue
 
-        if part_answers.exists():
+        part_answers = [a for a in rows if a.answer_part_id is not None]
+        if part_answers:
             # Aggregate per-part answers into JSON array format for frontend
             answer_texts = [pa.answer_text or "" for pa in part_answers]
             combined_answer_text = json.dumps(answer_texts)
@@ -929,9 +1718,9 @@ def team_get_answers(request: HttpRequest, code: str) -> JsonResponse:
 
             answers_data.append(
                 {
-                    "question_id": question.id,
-                    "question_number": question.question_number,
-                    "question_text": question.text,
+                    "question_id": question["id"],
+                    "question_number": question["number"],
+                    "question_text": question["text"],
                     "answer_text": combined_answer_text,
                     "is_locked": any_locked,
                     "points_awarded": total_points if all_scored else None,
@@ -939,27 +1728,28 @@ def team_get_answers(request: HttpRequest, code: str) -> JsonResponse:
             )
         else:
             # Fall back to single answer (old format or simple questions)
-            answer = team.answers.filter(
-                question=question, answer_part__isnull=True
-            ).first()
+            answer = rows[0] if rows else None
+            answer_text = answer.answer_text if answer else ""
+            if draft and not (answer and answer.is_locked):
+                answer_text = draft["text"]
             answers_data.append(
                 {
-                    "question_id": question.id,
-                    "question_number": question.question_number,
-                    "question_text": question.text,
-                    "answer_text": answer.answer_text if answer else "",
+                    "question_id": question["id"],
+                    "question_number": question["number"],
+                    "question_text": question["text"],
+                    "answer_text": answer_text,
                     "is_locked": answer.is_locked if answer else False,
                     "points_awarded": answer.points_awarded if answer else None,
                 }
             )
 
-    return JsonResponse(
-        {
-            "round_number": target_round.round_number,
-            "round_status": session_round.status,
-            "answers": answers_data,
-        }
-    )
+    return {
+        "round_number": target_round.round_number,
+        "round_status": session_round.status,
+        "answers": answers_data,
+        # Full precision: the JSON encoder would cut this to milliseconds
+        "last_updated": last_updated.isoformat() if last_updated else None,
+    }
 
 
 @require_http_methods(["GET"])
@@ -967,49 +1757,48 @@ def team_get_answers(request: HttpRequest, code: str) -> JsonResponse:
 def team_get_question_details(request: HttpRequest, code: str) -> JsonResponse:
     """Get full details for a specific question (for team navigation)."""
     session = request.session_obj
-    team = request.team
 
     question_id = request.GET.get("question_id")
     if not question_id:
         return JsonResponse({"error": "question_id required"}, status=400)
 
-    question = get_object_or_404(Question, id=question_id, game=session.game)
-    session_round = session.session_rounds.filter(round=question.game_round).first()
+    question = session_content.for_session(session).question(question_id)
+    if question is None:
+        raise Http404("Question not found")
+    session_round = session.session_rounds.filter(round_id=question["round_id"]).first()
+
+    return _question_details_response(question, session_round)
+
+
+@require_http_methods(["GET"])
+@require_team_token
+async def ateam_get_question_details(request: HttpRequest, code: str) -> JsonResponse:
+    """team_get_question_details for ASGI deployments (SESSION_ASYNC_VIEWS)."""
+    session = request.session_obj
+
+    question_id = request.GET.get("question_id")
+    if not question_id:
+        return JsonResponse({"error": "question_id required"}, status=400)
+
+    content = await session_content.afor_session(session)
+    question = content.question(question_id)
+    if question is None:
+        raise Http404("Question not found")
+    session_round = await session.session_rounds.filter(
+        round_id=question["round_id"]
+    ).afirst()
 
+    return _question_details_response(question, session_round)
+
+
+def _question_details_response(
+    question: dict, session_round: Optional[SessionRound]
+) -> JsonResponse:
     # Verify question is in current or completed round (not future rounds)
     if not session_round or session_round.status == SessionRound.Status.PENDING:
         return JsonResponse({"error": "Question not accessible yet"}, status=400)
 
-    question_data = {
-        "id": question.id,
-        "number": question.question_number,
-        "text": question.text,
-        "total_points": question.total_points,
-        "image_url": question.question_image_url,
-        "video_url": question.question_video_url,
-        "answer_image_url": question.answer_image_url,
-        "answer_video_url": question.answer_video_url,
-        "answer_bank": question.answer_bank,
-        "category_name": question.category.name if question.category else None,
-        "question_type": (
-            question.question_type.name if question.question_type else None
-        ),
-        "answers": [
-            {
-                "id": a.id,
-                "text": a.text,
-                "answer_text": a.answer_text,
-                "display_order": a.display_order,
-                "image_url": a.question_image_url,
-                "answer_image_url": a.answer_image_url,
-                "video_url": a.question_video_url,
-                "answer_video_url": a.answer_video_url,
-                "points": a.points,
-                "correct_rank": a.correct_rank,
-            }
-            for a in question.answers.all().order_by("display_order")
-        ],
-    }
+    question_data = session_content.public_question(question)
 
     return JsonResponse({"question": question_data})
 
@@ -1021,37 +1810,35 @@ def team_get_results(request: HttpRequest, code: str) -> JsonResponse:
     session = request.session_obj
     team = request.team
 
-    rounds_data = []
-    for session_round in session.session_rounds.filter(
-        status=SessionRound.Status.SCORED
-    ):
-        round_answers = team.answers.filter(session_round=session_round)
-        round_score = (
-            round_answers.aggregate(total=models.Sum("points_awarded"))["total"] or 0
-        )
-
-        rounds_data.append(
-            {
-                "round_number": session_round.round.round_number,
-                "round_name": session_round.round.name,
-                "score": round_score,
-            }
-        )
-
-    # Get current standings
-    standings = list(session.teams.order_by("-score").values("id", "name", "score"))
-    team_rank = next(
-        (i + 1 for i, t in enumerate(standings) if t["id"] == team.id), None
-    )
+    ranked = standings.leaderboard(session)
+    own = next(t for t in ranked if t["id"] == team.id)
+    # Every scored round is listed; a team without a frozen row for one
+    # (joined after it) scored 0 in it.
+    own_points = {r["round_number"]: r["points"] for r in own["rounds"]}
+    rounds_data = [
+        {
+            "round_number": sr.round.round_number,
+            "round_name": sr.round.name,
+            "score": own_points.get(sr.round.round_number, 0),
+        }
+        for sr in session.session_rounds.filter(status=SessionRound.Status.SCORED)
+        .select_related("round")
+        .order_by("round__round_number")
+    ]
+    team_rank = own["rank"]
+    standings_data = [
+        {"id": t["id"], "name": t["name"], "score": t["score"], "rank": t["rank"]}
+        for t in ranked
+    ]
 
     return JsonResponse(
         {
             "team_name": team.name,
-            "total_score": team.score,
+            "total_score": own["score"],
             "rank": team_rank,
-            "total_teams": len(standings),
+            "total_teams": len(standings_data),
             "rounds": rounds_data,
-            "standings": standings,
+            "standings": standings_data,
         }
     )
 
@@ -1090,8 +1877,7 @@ def validate_session_access(request: HttpRequest, code: str) -> JsonResponse:
     if admin_token and session.admin_token == admin_token:
         response["is_valid_admin"] = True
         # Update admin heartbeat
-        session.admin_last_seen = timezone.now()
-        session.save(update_fields=["admin_last_seen"])
+        heartbeats.beat_admin(code)
 
     # Validate team token
     if team_token:
@@ -1101,8 +1887,7 @@ def validate_session_access(request: HttpRequest, code: str) -> JsonResponse:
             response["team_id"] = team.id
             response["team_name"] = team.name
             # Update team heartbeat
-            team.last_seen = timezone.now()
-            team.save(update_fields=["last_seen"])
+            heartbeats.beat_team(code, team.id)
         except SessionTeam.DoesNotExist:
             pass
 
@@ -0,0 +1,102 @@
+"""
+Pub/sub for live session updates.
+
+Publishers are the places that move GameSession.state_version (the model,
+on commit). Subscribers are the SSE streams in session_api, one per
+connected device. Sessions are identified by their code, which is also how
+every client addresses them.
+
+Fan-out has two legs:
+
+  - in-process: waiters registered in this process are woken immediately
+    via their event loop, so a host action served by the same ASGI process
+    reaches every device in milliseconds.
+  - cross-process: the latest version is also written to the configured
+    cache (Redis in prod). Waiters re-check it every CROSS_PROCESS_INTERVAL
+    seconds, which covers publishers running in another worker.
+
+The module holds no Django model imports so models.py can publish from it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from django.core.cache import cache
+
+VERSION_KEY = "session:{code}:version"
+VERSION_TIMEOUT = 60 * 60 * 12  # Outlives any pub night
+CROSS_PROCESS_INTERVAL = 1.0  # Seconds between cache checks while waiting
+
+_lock = threading.Lock()
+_waiters: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+
+def version_key(code: str) -> str:
+    return VERSION_KEY.format(code=code)
+
+
+def publish(code: str, version: int) -> None:
+    """Announce that a session's state moved to `version`.
+
+    Safe to call from any thread; typically runs from transaction.on_commit.
+    """
+    cache.set(version_key(code), version, VERSION_TIMEOUT)
+
+    with _lock:
+        waiters = list(_waiters.get(code, ()))
+    for loop, event in waiters:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # Loop already closed - the subscriber is gone.
+            pass
+
+
+def published_version(code: str) -> Optional[int]:
+    """Latest version announced for a session, or None if unknown to the cache."""
+    return cache.get(version_key(code))
+
+
+async def wait_for_change(
+    code: str, after_version: int, timeout: float
+) -> Optional[int]:
+    """Wait until the session's version exceeds `after_version`.
+
+    Returns the new version, or None if `timeout` seconds pass without a
+    change.
+    """
+    loop = asyncio.get_running_loop()
+    event = asyncio.Event()
+    waiter = (loop, event)
+    with _lock:
+        _waiters.setdefault(code, set()).add(waiter)
+
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            version = await cache.aget(version_key(code))
+            if version is not None and version > after_version:
+                return version
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+
+            event.clear()
+            try:
+                await asyncio.wait_for(
+                    event.wait(), min(remaining, CROSS_PROCESS_INTERVAL)
+                )
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        with _lock:
+            waiters = _waiters.get(code)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del _waiters[code]
@@ -0,0 +1,161 @@
+"""
+Cache-backed hot copy of each session's public state.
+
+The state payload (current question with its answers, teams, round
+progress) is built once per state version and stored serialized in the
+configured cache. Polls and event streams then read it with one cache
+round trip: the snapshot and the version stamp session_broker publishes on
+commit are fetched together, and the snapshot is only served while its
+version matches. Anything that bumps GameSession.state_version therefore
+invalidates it; GameSession also drops the snapshot as soon as the version
+moves, before the new stamp is published on commit.
+
+It also caches what an API token resolves to, so authenticated requests
+look their session/team up by primary key. Entries are dropped when a
+team is removed or the session completes.
+
+Functions used by the async poll views have `a`-prefixed counterparts on
+the cache's async API.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from typing import Optional
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from . import session_broker
+
+STATE_KEY = "session:{code}:state"
+STATE_TIMEOUT = session_broker.VERSION_TIMEOUT
+TOKEN_KEY = "session-token:{digest}"
+TOKEN_TIMEOUT = 60 * 60 * 12
+
+ROLE_ADMIN = "admin"
+ROLE_TEAM = "team"
+
+
+def state_key(code: str) -> str:
+    return STATE_KEY.format(code=code)
+
+
+def get_state(code: str) -> Optional[dict]:
+    """Current snapshot for a session, or None if missing or out of date.
+
+    A snapshot is a dict with `version`, `status`, `round_status`,
+    `changed_at` (epoch seconds it was built, i.e. roughly when the state
+    last changed) and `body` (the serialized state payload).
+    """
+    return _current(code, cache.get_many(_state_keys(code)))
+
+
+async def aget_state(code: str) -> Optional[dict]:
+    return _current(code, await cache.aget_many(_state_keys(code)))
+
+
+def _state_keys(code: str) -> list[str]:
+    return [session_broker.version_key(code), state_key(code)]
+
+
+def _current(code: str, found: dict) -> Optional[dict]:
+    version = found.get(session_broker.version_key(code))
+    snapshot = found.get(state_key(code))
+    if snapshot is None or version is None or snapshot["version"] != version:
+        return None
+    return snapshot
+
+
+def store_state(session, state: dict) -> dict:
+    """Serialize `state` (built from `session`) and cache it as the snapshot."""
+    snapshot = _snapshot(session, state)
+    cache.set(state_key(session.code), snapshot, STATE_TIMEOUT)
+    # Seed the version stamp if the cache lost it (restart, eviction) so the
+    # next poll can hit. add() never overwrites a newer published version.
+    cache.add(
+        session_broker.version_key(session.code),
+        session.state_version,
+        session_broker.VERSION_TIMEOUT,
+    )
+    return snapshot
+
+
+async def astore_state(session, state: dict) -> dict:
+    snapshot = _snapshot(session, state)
+    await cache.aset(state_key(session.code), snapshot, STATE_TIMEOUT)
+    await cache.aadd(
+        session_broker.version_key(session.code),
+        session.state_version,
+        session_broker.VERSION_TIMEOUT,
+    )
+    return snapshot
+
+
+def _snapshot(session, state: dict) -> dict:
+    return {
+        "version": session.state_version,
+        "status": session.status,
+        "round_status": (state.get("current_round") or {}).get("status"),
+        "changed_at": time.time(),
+        "body": json.dumps(state, cls=DjangoJSONEncoder),
+    }
+
+
+def invalidate(code: str) -> None:
+    cache.delete(state_key(code))
+
+
+def token_key(token: str) -> str:
+    # Tokens are credentials; keep them out of cache key listings.
+    return TOKEN_KEY.format(digest=hashlib.sha256(token.encode()).hexdigest())
+
+
+def resolve_token(code: str, token: str) -> Optional[dict]:
+    """Cached {session_id, team_id, role} for a token used on session `code`."""
+    return _for_code(code, cache.get(token_key(token)))
+
+
+async def aresolve_token(code: str, token: str) -> Optional[dict]:
+    return _for_code(code, await cache.aget(token_key(token)))
+
+
+def _for_code(code: str, entry: Optional[dict]) -> Optional[dict]:
+    if entry is None or entry["code"] != code:
+        return None
+    return entry
+
+
+def remember_token(
+    token: str, *, code: str, session_id: int, role: str, team_id: int | None = None
+) -> None:
+    cache.set(
+        token_key(token),
+        {"code": code, "session_id": session_id, "team_id": team_id, "role": role},
+        TOKEN_TIMEOUT,
+    )
+
+
+async def aremember_token(
+    token: str, *, code: str, session_id: int, role: str, team_id: int | None = None
+) -> None:
+    await cache.aset(
+        token_key(token),
+        {"code": code, "session_id": session_id, "team_id": team_id, "role": role},
+        TOKEN_TIMEOUT,
+    )
+
+
+def forget_tokens(*tokens: str) -> None:
+    cache.delete_many([token_key(token) for token in tokens])
+
+
+async def aforget_tokens(*tokens: str) -> None:
+    await cache.adelete_many([token_key(token) for token in tokens])
+
+
+def forget_session_tokens(session) -> None:
+    """Drop cached resolutions for the host and every team of a session."""
+    forget_tokens(session.admin_token, *session.teams.values_list("token", flat=True))
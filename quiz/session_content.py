@@ -0,0 +1,185 @@
+"""
+Frozen copy of a game's content, compiled once per session.
+
+create_session compiles the game's rounds, ordered questions and their
+answers (media URLs included, the scorer's multi-part decision resolved)
+into a plain JSON document. It is stored on GameSession.content and kept
+in the cache, and live session endpoints read questions from it instead of
+the Question/Answer/Category/QuestionType tables. That covers the
+lifecycle too: lock_round splits and auto-scores from the snapshot's
+parts, and round max points come from it. A running night therefore
+issues no content queries, and edits made in the admin mid-game don't
+reach sessions already in progress.
+
+Sessions created before snapshots existed compile theirs on first use.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+
+from .models import Game, GameSession, Question
+from .scoring import scorer_for
+
+CONTENT_KEY = "session:{code}:content"
+CONTENT_TIMEOUT = 60 * 60 * 12
+
+
+def content_key(code: str) -> str:
+    return CONTENT_KEY.format(code=code)
+
+
+def compile_content(game: Game) -> dict:
+    """Snapshot `game` as a JSON-serializable dict. Two queries."""
+    questions = list(
+        game.questions.select_related("category", "question_type", "game_round")
+        .prefetch_related("answers")
+        .order_by("game_round__round_number", "question_number")
+    )
+
+    rounds: dict[int, dict] = {}
+    for question in questions:
+        game_round = question.game_round
+        if game_round is None:
+            continue
+        rounds.setdefault(
+            game_round.id,
+            {
+                "id": game_round.id,
+                "round_number": game_round.round_number,
+                "name": game_round.name,
+                "question_ids": [],
+            },
+        )["question_ids"].append(question.id)
+
+    return {
+        "game_id": game.id,
+        "game_name": game.name,
+        "rounds": list(rounds.values()),
+        "questions": [_compile_question(question) for question in questions],
+    }
+
+
+def _compile_question(question: Question) -> dict:
+    return {
+        "id": question.id,
+        "round_id": question.game_round_id,
+        "number": question.question_number,
+        "text": question.text,
+        "total_points": question.total_points,
+        "image_url": question.question_image_url,
+        "video_url": question.question_video_url,
+        "answer_image_url": question.answer_image_url,
+        "answer_video_url": question.answer_video_url,
+        "answer_bank": question.answer_bank,
+        "category_name": question.category.name if question.category else None,
+        "question_type": (
+            question.question_type.name if question.question_type else None
+        ),
+        "is_multi_part": scorer_for(question).is_multi_part(question),
+        "answers": [
+            {
+                "id": a.id,
+                "text": a.text,
+                "answer_text": a.answer_text,
+                "display_order": a.display_order,
+                "image_url": a.question_image_url,
+                "answer_image_url": a.answer_image_url,
+                "video_url": a.question_video_url,
+                "answer_video_url": a.answer_video_url,
+                "points": a.points,
+                "correct_rank": a.correct_rank,
+            }
+            for a in sorted(question.answers.all(), key=lambda a: a.display_order)
+        ],
+    }
+
+
+class SessionContent:
+    """Lookups over a compiled snapshot. Question and answer dicts are shared;
+    treat them as read-only."""
+
+    def __init__(self, data: dict):
+        self.data = data
+        self._questions = {q["id"]: q for q in data["questions"]}
+        self._rounds = {r["id"]: r for r in data["rounds"]}
+
+    @property
+    def game_name(self) -> str:
+        return self.data["game_name"]
+
+    def question(self, question_id) -> Optional[dict]:
+        """The question with this id, or None (also for non-integer ids)."""
+        try:
+            return self._questions.get(int(question_id))
+        except (TypeError, ValueError):
+            return None
+
+    def round_questions(self, round_id: Optional[int]) -> list[dict]:
+        """Questions of a round, by question number."""
+        game_round = self._rounds.get(round_id)
+        if game_round is None:
+            return []
+        return [self._questions[qid] for qid in game_round["question_ids"]]
+
+    def first_question_id(self, round_id: Optional[int]) -> Optional[int]:
+        """The round's lowest-numbered question, where play and review start."""
+        game_round = self._rounds.get(round_id)
+        return game_round["question_ids"][0] if game_round else None
+
+    def round_max_points(self, round_id: Optional[int]) -> int:
+        """Total points available in a round."""
+        return sum(q["total_points"] or 0 for q in self.round_questions(round_id))
+
+    def answer_points(self, question_id: int, answer_part_id: int) -> Optional[int]:
+        """Points of one part of a multi-part question."""
+        question = self._questions.get(question_id)
+        for answer in question["answers"] if question else []:
+            if answer["id"] == answer_part_id:
+                return answer["points"]
+        return None
+
+
+def public_question(question: dict) -> dict:
+    """The question payload sent to clients (the snapshot minus internals)."""
+    return {
+        key: value
+        for key, value in question.items()
+        if key not in ("round_id", "is_multi_part")
+    }
+
+
+def store(session: GameSession) -> dict:
+    """Compile the session's game and save it on the session and in the cache."""
+    data = compile_content(session.game)
+    session.content = data
+    GameSession.objects.filter(id=session.id).update(content=data)
+    cache.set(content_key(session.code), data, CONTENT_TIMEOUT)
+    return data
+
+
+def for_session(session: GameSession) -> SessionContent:
+    """The session's content snapshot: cache, then the session row."""
+    data = cache.get(content_key(session.code))
+    if data is None:
+        data = (
+            GameSession.objects.filter(id=session.id)
+            .values_list("content", flat=True)
+            .first()
+        )
+        if data:
+            cache.set(content_key(session.code), data, CONTENT_TIMEOUT)
+        else:
+            data = store(session)
+    return SessionContent(data)
+
+
+async def afor_session(session: GameSession) -> SessionContent:
+    """for_session on the async cache API; a miss is filled in a thread."""
+    data = await cache.aget(content_key(session.code))
+    if data is None:
+        return await sync_to_async(for_session)(session)
+    return SessionContent(data)
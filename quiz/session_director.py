@@ -30,12 +30,19 @@ from django.utils import timezone
 
 from .models import (
     GameSession,
-    Question,
+    SessionEvent,
     SessionRound,
     SessionTeam,
     TeamAnswer,
 )
-from .scoring import scorer_for
+from . import (
+    answer_drafts,
+    session_cache,
+    session_content,
+    session_progress,
+    standings,
+)
+from .scoring import scorer_for_type
 
 
 class InvalidTransition(Exception):
@@ -64,15 +71,13 @@ class SessionDirector:
         if not first_session_round:
             raise InvalidTransition("No rounds found in game")
 
-        first_question = (
-            session.game.questions.filter(game_round=first_session_round.round)
-            .order_by("question_number")
-            .first()
+        first_question_id = session_content.for_session(session).first_question_id(
+            first_session_round.round_id
         )
 
         session.status = GameSession.Status.PLAYING
         session.current_round = first_session_round.round
-        session.current_question = first_question
+        session.current_question_id = first_question_id
         session.started_at = timezone.now()
         session.save()
 
@@ -80,99 +85,227 @@ class SessionDirector:
         first_session_round.started_at = timezone.now()
         first_session_round.save()
 
-        return {
-            "status": "started",
-            "current_question_id": first_question.id if first_question else None,
-        }
+        session.record_event(
+            SessionEvent.Kind.GAME_STARTED,
+            {
+                "status": session.status,
+                "round_number": first_session_round.round.round_number,
+                "question_id": first_question_id,
+            },
+        )
+
+        return {"status": "started", "current_question_id": first_question_id}
 
-    def set_current_question(self, question: Question) -> dict:
-        """Admin navigates to a specific question.
+    def set_current_question(self, question: dict) -> dict:
+        """Admin navigates to a specific question (a content snapshot dict).
 
         Allowed when the question's round is non-PENDING. In REVIEWING mode,
         restricted to the current round.
         """
         session = self.session
-        session_round = session.session_rounds.filter(round=question.game_round).first()
+        session_round = (
+            session.session_rounds.select_related("round")
+            .filter(round_id=question["round_id"])
+            .first()
+        )
         if not session_round or session_round.status == SessionRound.Status.PENDING:
             raise InvalidTransition("Question not in active round")
 
         if (
             session.status == GameSession.Status.REVIEWING
-            and question.game_round != session.current_round
+            and question["round_id"] != session.current_round_id
         ):
             raise InvalidTransition(
                 "Can only navigate within current round in review mode"
             )
 
-        session.current_question = question
-        session.current_round = question.game_round
+        session.current_question_id = question["id"]
+        session.current_round = session_round.round
         session.save()
 
+        session.record_event(
+            SessionEvent.Kind.QUESTION_CHANGED,
+            {
+                "question_id": question["id"],
+                "question_number": question["number"],
+                "round_number": session_round.round.round_number,
+            },
+        )
+
         return {
             "status": "ok",
-            "question_id": question.id,
-            "question_number": question.question_number,
+            "question_id": question["id"],
+            "question_number": question["number"],
         }
 
     @transaction.atomic
     def lock_round(self) -> dict:
         """PLAYING -> SCORING. Splits multi-part answers, auto-scores where
         the question type's Scorer is mechanical, fills 0s for missing
-        submissions, locks all TeamAnswers in the round."""
+        submissions, locks all TeamAnswers in the round.
+
+        Questions and their parts come from the session's content snapshot,
+        like everything the scoring UI shows."""
         session = self.session
-        session_round = session.session_rounds.get(round=session.current_round)
+        # Row-locked so draft flushes wait for this lock to commit (see
+        # answer_drafts.flush).
+        session_round = session.session_rounds.select_for_update().get(
+            round=session.current_round
+        )
 
         if session_round.status != SessionRound.Status.ACTIVE:
             raise InvalidTransition("Round not active")
 
-        questions_in_round = session.game.questions.filter(
-            game_round=session.current_round
-        ).prefetch_related("answers", "question_type")
+        # Buffered autosaves are part of the answers being locked.
+        answer_drafts.flush(session, all_drafts=True)
+
+        questions_in_round = session_content.for_session(session).round_questions(
+            session_round.round_id
+        )
+        question_ids = [question["id"] for question in questions_in_round]
 
         teams = list(session.teams.order_by("id"))
 
-        for question in questions_in_round:
-            scorer = scorer_for(question)
-            is_multi_part = scorer.is_multi_part(question)
+        # One fetch of every stored answer in the round, grouped by
+        # (team, question, part). Everything below runs in memory and is
+        # written back with a few bulk statements. The rows are locked, so a
+        # concurrent submit waits for this transaction and then finds its
+        # answer locked rather than being overwritten.
+        round_answers = TeamAnswer.objects.filter(
+            team__session=session, question_id__in=question_ids
+        )
+        stored = {
+            (a.team_id, a.question_id, a.answer_part_id): a
+            for a in round_answers.select_for_update()
+        }
 
-            for team in teams:
-                existing = TeamAnswer.objects.filter(
-                    team=team, question=question, answer_part__isnull=True
-                ).first()
+        # Points as stored, so the team totals can move by the difference.
+        before = {
+            a.id: (a.team_id, a.session_round_id, a.points_awarded)
+            for a in stored.values()
+        }
 
-                if is_multi_part:
-                    if existing:
-                        part_answers = scorer.split_submission(existing)
-                        scorer.auto_score(part_answers, question)
-                        existing.delete()
-                    else:
-                        # No submission: create 0-point placeholders per part.
-                        for answer_part in question.answers.order_by("display_order"):
-                            TeamAnswer.objects.create(
-                                team=team,
-                                question=question,
-                                answer_part=answer_part,
-                                session_round=session_round,
-                                answer_text="",
-                                is_locked=True,
-                                points_awarded=0,
-                                scored_at=timezone.now(),
-                            )
-                else:
+        now = timezone.now()
+        to_create: list[TeamAnswer] = []
+        to_lock: list[TeamAnswer] = []  # Submitted whole-question answers
+        to_update: list[TeamAnswer] = []  # Part rows, rewritten from the split
+        to_delete: list[int] = []
+
+        def placeholder(team, question_id, answer_part_id=None) -> TeamAnswer:
+            return TeamAnswer(
+                team=team,
+                question_id=question_id,
+                answer_part_id=answer_part_id,
+                session_round=session_round,
+                answer_text="",
+                is_locked=True,
+                points_awarded=0,
+                scored_at=now,
+            )
+
+        for question in questions_in_round:
+            scorer = scorer_for_type(question["question_type"])
+
+            if not question["is_multi_part"]:
+                submissions = []
+                for team in teams:
+                    existing = stored.get((team.id, question["id"], None))
                     if existing:
                         existing.is_locked = True
-                        existing.save(update_fields=["is_locked"])
+                        submissions.append(existing)
                     else:
-                        TeamAnswer.objects.create(
-                            team=team,
-                            question=question,
-                            session_round=session_round,
-                            answer_text="",
-                            is_locked=True,
-                            points_awarded=0,
-                            scored_at=timezone.now(),
+                        to_create.append(placeholder(team, question["id"]))
+                # Scored in place where the type is mechanical (estimation)
+                scorer.score_submissions(question, submissions, {})
+                to_lock.extend(submissions)
+                continue
+
+            submissions = []
+            for team in teams:
+                existing = stored.get((team.id, question["id"], None))
+                if existing:
+                    submissions.append(existing)
+                    to_delete.append(existing.id)
+                else:
+                    # No submission: create 0-point placeholders per part.
+                    for answer_part in question["answers"]:
+                        to_create.append(
+                            placeholder(team, question["id"], answer_part["id"])
                         )
 
+            stored_parts = {
+                (team_id, part_id): answer
+                for (team_id, question_id, part_id), answer in stored.items()
+                if question_id == question["id"] and part_id is not None
+            }
+            for part_answer in scorer.score_submissions(
+                question, submissions, stored_parts
+            ):
+                if part_answer.pk is None:
+                    to_create.append(part_answer)
+                else:
+                    to_update.append(part_answer)
+
+        TeamAnswer.objects.filter(id__in=to_delete).delete()
+        # A first submit that raced the fetch above already holds the slot
+        # of its placeholder; it is locked with the stragglers below.
+        TeamAnswer.objects.bulk_create(to_create, ignore_conflicts=True)
+        for answer in [*to_lock, *to_update]:
+            answer.updated_at = now
+        # Submitted text is left as the team wrote it.
+        TeamAnswer.objects.bulk_update(
+            to_lock, ["is_locked", "points_awarded", "scored_at", "updated_at"]
+        )
+        TeamAnswer.objects.bulk_update(
+            to_update,
+            [
+                "session_round",
+                "answer_text",
+                "is_locked",
+                "points_awarded",
+                "scored_at",
+                "updated_at",
+            ],
+        )
+        stragglers = self._lock_stragglers(
+            round_answers, questions_in_round, session_round, now
+        )
+
+        # Auto-scored parts count towards the totals straight away.
+        deltas = standings.new_deltas()
+        for answer in stragglers:
+            standings.add_change(
+                deltas, answer.team_id, session_round.id, None, answer.points_awarded
+            )
+        for answer_id in to_delete:
+            standings.add_change(deltas, *before[answer_id], None)
+        for answer in [*to_lock, *to_update]:
+            standings.add_change(deltas, *before[answer.id], None)
+            standings.add_change(
+                deltas,
+                answer.team_id,
+                answer.session_round_id,
+                None,
+                answer.points_awarded,
+            )
+        for answer in to_create:
+            standings.add_change(
+                deltas, answer.team_id, session_round.id, None, answer.points_awarded
+            )
+        standings.apply_deltas(deltas)
+
+        # Every row of the round is in hand, so the unscored counters can be
+        # set outright rather than moved.
+        deleted = set(to_delete)
+        unscored: dict[int, int] = dict.fromkeys(question_ids, 0)
+        for answer in [*stored.values(), *to_create]:
+            if answer.id not in deleted and answer.points_awarded is None:
+                unscored[answer.question_id] += 1
+        for answer in stragglers:
+            if answer.points_awarded is None:
+                unscored[answer.question_id] += 1
+        session_progress.set_unscored(session.code, unscored)
+
         session_round.status = SessionRound.Status.LOCKED
         session_round.locked_at = timezone.now()
         session_round.save()
@@ -180,27 +313,111 @@ class SessionDirector:
         session.status = GameSession.Status.SCORING
         session.save()
 
+        session.record_event(
+            SessionEvent.Kind.ROUND_LOCKED,
+            {
+                "status": session.status,
+                "round_number": session.current_round.round_number,
+            },
+        )
+
         return {"status": "locked"}
 
+    @staticmethod
+    def _lock_stragglers(
+        round_answers, questions_in_round: list[dict], session_round, now
+    ) -> list[TeamAnswer]:
+        """Lock first submits that landed after lock_round's fetch.
+
+        They go through the same split and auto-scoring as the main pass; a
+        multi-part submit replaces its team's 0-point placeholder parts.
+        Returns the locked rows (part rows for multi-part questions), whose
+        points all count as new.
+        """
+        by_question: dict[int, list[TeamAnswer]] = {}
+        for answer in round_answers.filter(is_locked=False).select_for_update():
+            by_question.setdefault(answer.question_id, []).append(answer)
+        if not by_question:
+            return []
+
+        locked, parts, to_delete = [], [], []
+        for question in questions_in_round:
+            submissions = by_question.get(question["id"])
+            if not submissions:
+                continue
+            scorer = scorer_for_type(question["question_type"])
+            if not question["is_multi_part"]:
+                for answer in submissions:
+                    answer.is_locked = True
+                    answer.updated_at = now
+                scorer.score_submissions(question, submissions, {})
+                locked.extend(submissions)
+                continue
+
+            placeholders = {
+                (answer.team_id, answer.answer_part_id): answer
+                for answer in round_answers.filter(
+                    question_id=question["id"],
+                    team_id__in=[answer.team_id for answer in submissions],
+                    answer_part__isnull=False,
+                ).select_for_update()
+            }
+            for answer in placeholders.values():
+                answer.points_awarded = None
+                answer.scored_at = None
+            for part_answer in scorer.score_submissions(
+                question, submissions, placeholders
+            ):
+                part_answer.updated_at = now
+                parts.append(part_answer)
+            to_delete.extend(answer.id for answer in submissions)
+
+        TeamAnswer.objects.filter(id__in=to_delete).delete()
+        TeamAnswer.objects.bulk_update(
+            locked, ["is_locked", "points_awarded", "scored_at", "updated_at"]
+        )
+        TeamAnswer.objects.bulk_create([a for a in parts if a.pk is None])
+        TeamAnswer.objects.bulk_update(
+            [a for a in parts if a.pk is not None],
+            [
+                "session_round",
+                "answer_text",
+                "is_locked",
+                "points_awarded",
+                "scored_at",
+                "updated_at",
+            ],
+        )
+        return [*locked, *parts]
+
     def score_answer(self, answer: TeamAnswer, points: int) -> dict:
-        """Award points to a single TeamAnswer and recompute the team total.
+        """Award points to a single TeamAnswer and move the team's totals.
 
         The view is responsible for resolving the TeamAnswer (the lookup has
         four input shapes) and validating the points range against either
         answer_part.points or question.total_points.
         """
+        # Re-read the previous points under a row lock so two concurrent
+        # scorers of the same answer can't both apply a delta from it.
+        previous = (
+            TeamAnswer.objects.select_for_update()
+            .values_list("points_awarded", flat=True)
+            .get(id=answer.id)
+        )
         answer.points_awarded = points
         answer.scored_at = timezone.now()
         answer.save()
 
-        team = answer.team
-        team.score = (
-            team.answers.filter(points_awarded__isnull=False).aggregate(
-                total=models.Sum("points_awarded")
-            )["total"]
-            or 0
+        deltas = standings.new_deltas()
+        standings.add_change(
+            deltas, answer.team_id, answer.session_round_id, previous, points
         )
-        team.save()
+        standings.apply_deltas(deltas)
+        if previous is None:
+            session_progress.add_unscored(self.session.code, {answer.question_id: -1})
+
+        team = answer.team
+        team.refresh_from_db(fields=["score"])
 
         question_total = (
             TeamAnswer.objects.filter(
@@ -211,6 +428,18 @@ class SessionDirector:
             or 0
         )
 
+        self.session.record_event(
+            SessionEvent.Kind.ANSWER_SCORED,
+            {
+                "team_id": team.id,
+                "question_id": answer.question_id,
+                "answer_part_id": answer.answer_part_id,
+                "points_awarded": points,
+                "team_score": team.score,
+            },
+            state_changed=True,
+        )
+
         return {
             "team_answer_id": answer.id,
             "answer_part_id": answer.answer_part_id,
@@ -219,31 +448,135 @@ class SessionDirector:
             "team_score": team.score,
         }
 
+    def score_answers(self, scores: list[tuple[TeamAnswer, int]]) -> dict:
+        """Bulk form of score_answer.
+
+        Writes every TeamAnswer with one bulk_update and applies the team
+        and round deltas together. Same contract as score_answer: the caller
+        resolves the answers and validates each points value. If an answer
+        appears twice, the last entry wins.
+        """
+        now = timezone.now()
+        answers: dict[int, TeamAnswer] = {}
+        for answer, points in scores:
+            answer.points_awarded = points
+            answer.scored_at = now
+            answer.updated_at = now
+            answers[answer.id] = answer
+
+        previous = dict(
+            TeamAnswer.objects.select_for_update()
+            .filter(id__in=answers)
+            .values_list("id", "points_awarded")
+        )
+        TeamAnswer.objects.bulk_update(
+            answers.values(), ["points_awarded", "scored_at", "updated_at"]
+        )
+        deltas = standings.new_deltas()
+        newly_scored: dict[int, int] = {}
+        for answer in answers.values():
+            standings.add_change(
+                deltas,
+                answer.team_id,
+                answer.session_round_id,
+                previous.get(answer.id),
+                answer.points_awarded,
+            )
+            if previous.get(answer.id) is None:
+                newly_scored[answer.question_id] = (
+                    newly_scored.get(answer.question_id, 0) - 1
+                )
+        standings.apply_deltas(deltas)
+        session_progress.add_unscored(self.session.code, newly_scored)
+
+        team_ids = {answer.team_id for answer in answers.values()}
+        question_ids = {answer.question_id for answer in answers.values()}
+        question_totals = {
+            (row["team_id"], row["question_id"]): row["total"]
+            for row in TeamAnswer.objects.filter(
+                team_id__in=team_ids,
+                question_id__in=question_ids,
+                points_awarded__isnull=False,
+            )
+            .values("team_id", "question_id")
+            .annotate(total=models.Sum("points_awarded"))
+        }
+        team_scores = dict(
+            SessionTeam.objects.filter(id__in=team_ids).values_list("id", "score")
+        )
+
+        self.session.record_events(
+            [
+                (
+                    SessionEvent.Kind.ANSWER_SCORED,
+                    {
+                        "team_id": answer.team_id,
+                        "question_id": answer.question_id,
+                        "answer_part_id": answer.answer_part_id,
+                        "points_awarded": answer.points_awarded,
+                        "team_score": team_scores[answer.team_id],
+                    },
+                )
+                for answer in answers.values()
+            ],
+            state_changed=True,
+        )
+
+        return {
+            "results": [
+                {
+                    "team_answer_id": answer.id,
+                    "answer_part_id": answer.answer_part_id,
+                    "points_awarded": answer.points_awarded,
+                    "question_total": question_totals.get(
+                        (answer.team_id, answer.question_id), 0
+                    ),
+                }
+                for answer in answers.values()
+            ],
+            "team_scores": team_scores,
+        }
+
     def complete_round(self) -> dict:
         """SCORING -> REVIEWING. All answers must be scored before this fires.
         Resets current_question to the first question of the round for review."""
         session = self.session
         session_round = session.session_rounds.get(round=session.current_round)
 
+        content = session_content.for_session(session)
+        question_ids = [
+            q["id"] for q in content.round_questions(session_round.round_id)
+        ]
+        # The cached counters drive the progress UI, but this transition
+        # freezes the round's scores, so it counts the rows themselves: a
+        # counter that drifted either way can't block it or let it through.
         unscored = TeamAnswer.objects.filter(
             session_round=session_round,
             points_awarded__isnull=True,
         ).count()
         if unscored > 0:
             raise InvalidTransition(f"{unscored} answers still need scoring")
+        if session_progress.unscored(session, question_ids) != 0:
+            session_progress.rebuild(session)
 
         session_round.status = SessionRound.Status.SCORED
         session_round.scored_at = timezone.now()
         session_round.save()
+        standings.freeze_round(session_round)
 
         session.status = GameSession.Status.REVIEWING
-        session.current_question = (
-            session.game.questions.filter(game_round=session.current_round)
-            .order_by("question_number")
-            .first()
-        )
+        session.current_question_id = content.first_question_id(session_round.round_id)
         session.save()
 
+        session.record_event(
+            SessionEvent.Kind.ROUND_COMPLETED,
+            {
+                "status": session.status,
+                "round_number": session.current_round.round_number,
+                "question_id": session.current_question_id,
+            },
+        )
+
         return {
             "status": "reviewing",
             "round_number": session.current_round.round_number,
@@ -257,6 +590,9 @@ class SessionDirector:
             raise InvalidTransition("Not in review mode")
         session.status = GameSession.Status.LEADERBOARD
         session.save()
+        session.record_event(
+            SessionEvent.Kind.LEADERBOARD_SHOWN, {"status": session.status}
+        )
         return {"status": "leaderboard"}
 
     def advance(self) -> dict:
@@ -282,17 +618,24 @@ class SessionDirector:
             next_session_round.started_at = timezone.now()
             next_session_round.save()
 
-            first_question = (
-                session.game.questions.filter(game_round=next_session_round.round)
-                .order_by("question_number")
-                .first()
+            first_question_id = session_content.for_session(session).first_question_id(
+                next_session_round.round_id
             )
 
             session.status = GameSession.Status.PLAYING
             session.current_round = next_session_round.round
-            session.current_question = first_question
+            session.current_question_id = first_question_id
             session.save()
 
+            session.record_event(
+                SessionEvent.Kind.ROUND_STARTED,
+                {
+                    "status": session.status,
+                    "round_number": next_session_round.round.round_number,
+                    "question_id": first_question_id,
+                },
+            )
+
             return {
                 "status": "next_round",
                 "round_number": next_session_round.round.round_number,
@@ -304,11 +647,17 @@ class SessionDirector:
         session.completed_at = timezone.now()
         session.save()
 
-        standings = [
-            {"rank": i + 1, "name": t.name, "score": t.score}
-            for i, t in enumerate(session.teams.order_by("-score"))
+        session.record_event(
+            SessionEvent.Kind.GAME_COMPLETED, {"status": session.status}
+        )
+        session_cache.forget_session_tokens(session)
+
+        # Ranked like the leaderboard and results views: ties share a rank.
+        final_standings = [
+            {"rank": team["rank"], "name": team["name"], "score": team["score"]}
+            for team in standings.leaderboard(session)
         ]
-        return {"status": "game_complete", "standings": standings}
+        return {"status": "game_complete", "standings": final_standings}
 
     # ------------------------------------------------------------------
     # Predicates - for non-admin views that need to ask the lifecycle
@@ -0,0 +1,194 @@
+"""
+Cached per-question counters for a running session.
+
+Round progress (how many teams have submitted each question, and who has
+answered the current one) and the "everything scored?" check before
+complete_round used to be COUNT queries over TeamAnswer. They are now
+counters in the configured cache, moved by whoever changes the rows:
+
+  - submitted:  teams with a non-empty answer to the question, plus one
+                flag per team so a re-submit isn't counted twice
+  - unscored:   TeamAnswer rows for the question with no points yet
+
+team_submit_answer, lock_round and the scoring paths keep them current.
+Readers go through this module, which rebuilds every counter of the
+session from the DB (rebuild) when they are missing, e.g. after a cache
+restart or eviction.
+"""
+
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.db import models
+
+from . import session_content
+from .models import GameSession, TeamAnswer
+
+PROGRESS_KEY = "session:{code}:progress"
+SUBMITTED_KEY = "session:{code}:question:{question_id}:submitted"
+ANSWERED_KEY = "session:{code}:question:{question_id}:team:{team_id}"
+UNSCORED_KEY = "session:{code}:question:{question_id}:unscored"
+PROGRESS_TIMEOUT = 60 * 60 * 12
+
+
+def submitted_key(code: str, question_id: int) -> str:
+    return SUBMITTED_KEY.format(code=code, question_id=question_id)
+
+
+def answered_key(code: str, question_id: int, team_id: int) -> str:
+    return ANSWERED_KEY.format(code=code, question_id=question_id, team_id=team_id)
+
+
+def unscored_key(code: str, question_id: int) -> str:
+    return UNSCORED_KEY.format(code=code, question_id=question_id)
+
+
+# ----------------------------------------------------------------------------
+# Writers
+# ----------------------------------------------------------------------------
+
+
+def record_submission(
+    code: str, question_id: int, team_id: int, answered: bool
+) -> bool:
+    """Record whether a team's answer to a question is non-empty.
+
+    Returns True if that changed, i.e. the submitted count moved.
+    """
+    key = answered_key(code, question_id, team_id)
+    if answered:
+        # add() only succeeds for the first answer, so the count moves once.
+        changed = cache.add(key, 1, PROGRESS_TIMEOUT)
+        if changed:
+            _incr(code, submitted_key(code, question_id), 1)
+    else:
+        changed = cache.delete(key)
+        if changed:
+            _incr(code, submitted_key(code, question_id), -1)
+    return bool(changed)
+
+
+def add_unscored(code: str, deltas: dict[int, int]) -> None:
+    """Move the unscored counters by {question_id: delta}."""
+    for question_id, delta in deltas.items():
+        if delta:
+            _incr(code, unscored_key(code, question_id), delta)
+
+
+def set_unscored(code: str, counts: dict[int, int]) -> None:
+    """Overwrite the unscored counters, e.g. with lock_round's exact totals."""
+    cache.set_many(
+        {unscored_key(code, question_id): n for question_id, n in counts.items()},
+        PROGRESS_TIMEOUT,
+    )
+
+
+def _incr(code: str, key: str, delta: int) -> None:
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        # Counter gone: the next read rebuilds all of them from the DB.
+        invalidate(code)
+
+
+def invalidate(code: str) -> None:
+    """Drop the counters' validity marker; the next read rebuilds them."""
+    cache.delete(PROGRESS_KEY.format(code=code))
+
+
+# ----------------------------------------------------------------------------
+# Readers
+# ----------------------------------------------------------------------------
+
+
+def submissions(
+    session: GameSession,
+    question_ids: list[int],
+    current_question_id: int | None,
+    team_ids: list[int],
+) -> tuple[dict[int, int], set[int]]:
+    """Submitted-team counts for `question_ids`, and the teams in `team_ids`
+    that have answered the current question. One cache round trip."""
+    code = session.code
+    counts_keys = {submitted_key(code, qid): qid for qid in question_ids}
+    flag_keys = {}
+    if current_question_id:
+        flag_keys = {
+            answered_key(code, current_question_id, tid): tid for tid in team_ids
+        }
+
+    found = _get_many(session, [*counts_keys, *flag_keys], required=counts_keys)
+    counts = {qid: found[key] for key, qid in counts_keys.items()}
+    answered = {tid for key, tid in flag_keys.items() if key in found}
+    return counts, answered
+
+
+def unscored(session: GameSession, question_ids: list[int]) -> int:
+    """Total TeamAnswer rows still waiting for points across `question_ids`."""
+    keys = [unscored_key(session.code, qid) for qid in question_ids]
+    found = _get_many(session, keys, required=keys)
+    return sum(found[key] for key in keys)
+
+
+def _get_many(session: GameSession, keys: list[str], required) -> dict:
+    progress_key = PROGRESS_KEY.format(code=session.code)
+    found = cache.get_many([progress_key, *keys])
+    if progress_key not in found or any(key not in found for key in required):
+        rebuild(session)
+        found = cache.get_many(keys)
+    return found
+
+
+# ----------------------------------------------------------------------------
+# Repair
+# ----------------------------------------------------------------------------
+
+
+def rebuild(session: GameSession) -> None:
+    """Recompute every counter of the session from the DB. Three queries.
+
+    Buffered drafts of the current round count as answers too.
+    """
+    from . import answer_drafts  # imports this module
+
+    code = session.code
+    content = session_content.for_session(session)
+    question_ids = [q["id"] for q in content.data["questions"]]
+    team_ids = list(session.teams.values_list("id", flat=True))
+    answers = TeamAnswer.objects.filter(team__session=session).order_by()
+
+    answered = set(
+        answers.filter(answer_text__gt="").values_list("team_id", "question_id")
+    )
+    current_ids = [q["id"] for q in content.round_questions(session.current_round_id)]
+    for key, draft in answer_drafts.buffered(team_ids, current_ids).items():
+        if draft["text"]:
+            answered.add(key)
+        else:
+            answered.discard(key)
+    unscored_counts = dict(
+        answers.filter(points_awarded__isnull=True)
+        .values("question_id")
+        .annotate(n=models.Count("id"))
+        .values_list("question_id", "n")
+    )
+
+    submitted_counts = dict.fromkeys(question_ids, 0)
+    for _, question_id in answered:
+        submitted_counts[question_id] = submitted_counts.get(question_id, 0) + 1
+
+    values = {submitted_key(code, qid): n for qid, n in submitted_counts.items()}
+    values.update(
+        {unscored_key(code, qid): unscored_counts.get(qid, 0) for qid in question_ids}
+    )
+    values.update({answered_key(code, qid, tid): 1 for tid, qid in answered})
+    cache.delete_many(
+        [
+            answered_key(code, qid, tid)
+            for qid in question_ids
+            for tid in team_ids
+            if (tid, qid) not in answered
+        ]
+    )
+    values[PROGRESS_KEY.format(code=code)] = 1
+    cache.set_many(values, PROGRESS_TIMEOUT)
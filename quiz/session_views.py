@@ -3,6 +3,7 @@ Frontend views for live game sessions.
 Renders HTML pages for session interaction.
 """
 
+from django.conf import settings
 from django.shortcuts import render, get_object_or_404, redirect
 from django.http import HttpRequest, HttpResponse
 from django.contrib import messages
@@ -98,5 +99,6 @@ def session_play(request: HttpRequest, code: str) -> HttpResponse:
             "session": session,
             "game": session.game,
             "rounds_data": rounds_data,
+            "use_event_stream": settings.SESSION_EVENT_STREAM_ENABLED,
         },
     )
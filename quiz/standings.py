@@ -0,0 +1,220 @@
+"""
+Running score totals for session teams.
+
+SessionTeam.score and the per-round TeamRoundScore subtotals are kept up
+to date incrementally: whoever changes TeamAnswer.points_awarded collects
+the change as a delta (new points minus previous points) per
+(team, session round) and applies it with apply_deltas, as F() updates.
+A score write therefore costs the same in round one and round eight.
+
+repair() is the slow path: it recomputes every total of the given
+sessions from TeamAnswer, for when the running totals may have drifted
+(points edited in the Django admin, rows deleted by hand).
+
+When a round completes, freeze_round() stamps its rows with the round's
+max_points and marks them frozen. The leaderboard endpoints, which every
+device polls at the same moment, read ranked standings from these rows
+in one query (leaderboard()).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Optional
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import models
+from django.db.models.functions import Coalesce, JSONObject, Rank
+
+from . import session_content
+from .models import SessionTeam, TeamAnswer, TeamRoundScore
+
+Deltas = dict[tuple[int, int], int]
+
+
+def new_deltas() -> Deltas:
+    """Empty {(team_id, session_round_id): delta} accumulator."""
+    return defaultdict(int)
+
+
+def add_change(
+    deltas: Deltas,
+    team_id: int,
+    session_round_id: int,
+    before: Optional[int],
+    after: Optional[int],
+) -> None:
+    """Record one answer's points moving from `before` to `after`.
+
+    None (unscored) counts as zero.
+    """
+    deltas[(team_id, session_round_id)] += (after or 0) - (before or 0)
+
+
+def apply_deltas(deltas: Deltas) -> None:
+    """Add the collected deltas to the team and round totals.
+
+    At most three statements regardless of how many teams or rounds are
+    involved: one UPDATE on SessionTeam, one INSERT of missing round rows
+    and one UPDATE on TeamRoundScore.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    team_deltas: dict[int, int] = defaultdict(int)
+    for (team_id, _), delta in deltas.items():
+        team_deltas[team_id] += delta
+    SessionTeam.objects.filter(id__in=team_deltas).update(
+        score=models.F("score")
+        + models.Case(
+            *[
+                models.When(id=team_id, then=models.Value(delta))
+                for team_id, delta in team_deltas.items()
+            ],
+            default=models.Value(0),
+        )
+    )
+
+    TeamRoundScore.objects.bulk_create(
+        [
+            TeamRoundScore(team_id=team_id, session_round_id=session_round_id)
+            for team_id, session_round_id in deltas
+        ],
+        ignore_conflicts=True,
+    )
+    whens = [
+        models.When(
+            team_id=team_id, session_round_id=session_round_id, then=models.Value(delta)
+        )
+        for (team_id, session_round_id), delta in deltas.items()
+    ]
+    keys = models.Q()
+    for team_id, session_round_id in deltas:
+        keys |= models.Q(team_id=team_id, session_round_id=session_round_id)
+    TeamRoundScore.objects.filter(keys).update(
+        points=models.F("points") + models.Case(*whens, default=models.Value(0))
+    )
+
+
+def repair(sessions) -> int:
+    """Recompute every team and round total of `sessions` from TeamAnswer.
+
+    `sessions` is a GameSession queryset. Team totals are fixed with one
+    UPDATE across all of them, round subtotals with another (after adding
+    any missing rows). Frozen flags and max_points are left alone. Returns
+    the number of teams recomputed.
+    """
+    count = SessionTeam.objects.filter(session__in=sessions).update(
+        score=Coalesce(models.Subquery(_points_total(team=models.OuterRef("pk"))), 0)
+    )
+
+    TeamRoundScore.objects.bulk_create(
+        [
+            TeamRoundScore(team_id=team_id, session_round_id=session_round_id)
+            for team_id, session_round_id in _scored(team__session__in=sessions)
+            .values_list("team_id", "session_round_id")
+            .distinct()
+        ],
+        ignore_conflicts=True,
+    )
+    TeamRoundScore.objects.filter(team__session__in=sessions).update(
+        points=Coalesce(
+            models.Subquery(
+                _points_total(
+                    team=models.OuterRef("team"),
+                    session_round=models.OuterRef("session_round"),
+                )
+            ),
+            0,
+        )
+    )
+
+    for session in sessions:
+        # Team scores are part of the polled state.
+        session.bump_state_version()
+    return count
+
+
+def freeze_round(session_round) -> None:
+    """Finalize a round's subtotals as it completes.
+
+    Every team of the session gets a row for the round, recomputed from
+    its answers and stamped with the round's max_points (from the session's
+    content snapshot), and the rows are marked frozen: the leaderboard shows
+    frozen rounds only. Scores corrected afterwards keep flowing in through
+    apply_deltas.
+    """
+    TeamRoundScore.objects.bulk_create(
+        [
+            TeamRoundScore(team_id=team_id, session_round=session_round)
+            for team_id in session_round.session.teams.values_list("id", flat=True)
+        ],
+        ignore_conflicts=True,
+    )
+    max_points = session_content.for_session(session_round.session).round_max_points(
+        session_round.round_id
+    )
+    TeamRoundScore.objects.filter(session_round=session_round).update(
+        points=Coalesce(
+            models.Subquery(
+                _points_total(team=models.OuterRef("team"), session_round=session_round)
+            ),
+            0,
+        ),
+        max_points=max_points,
+        frozen=True,
+    )
+
+
+def leaderboard(session) -> list[dict]:
+    """Teams of `session` by score, with ranks and frozen round subtotals.
+
+    One query. Ranks come from SQL RANK(), so tied teams share a rank and
+    the next one skips ahead (1, 1, 3). Each team dict carries `id`,
+    `name`, `score`, `rank` and `rounds`, a list of {round_number,
+    round_name, points, max_points} in round order.
+    """
+    return list(_leaderboard_query(session))
+
+
+async def aleaderboard(session) -> list[dict]:
+    return [team async for team in _leaderboard_query(session)]
+
+
+def _leaderboard_query(session) -> models.QuerySet:
+    rounds = (
+        TeamRoundScore.objects.filter(team=models.OuterRef("pk"), frozen=True)
+        .order_by("session_round__round__round_number")
+        .values(
+            json=JSONObject(
+                round_number="session_round__round__round_number",
+                round_name="session_round__round__name",
+                points="points",
+                max_points="max_points",
+            )
+        )
+    )
+    return (
+        SessionTeam.objects.filter(session=session)
+        .annotate(
+            rank=models.Window(Rank(), order_by=models.F("score").desc()),
+            rounds=ArraySubquery(rounds),
+        )
+        .order_by("rank", "joined_at")
+        .values("id", "name", "score", "rank", "rounds")
+    )
+
+
+def _scored(**filters):
+    return TeamAnswer.objects.filter(points_awarded__isnull=False, **filters).order_by()
+
+
+def _points_total(**filters):
+    """One team's SUM(points_awarded), for use as a correlated subquery."""
+    return (
+        _scored(**filters)
+        .values("team")
+        .annotate(total=models.Sum("points_awarded"))
+        .values("total")
+    )
@@ -0,0 +1,152 @@
+"""
+Fuzzy point suggestions for typed answers.
+
+Free-text questions are scored by hand. To speed that up the scoring
+payload carries a suggestion per team answer: its similarity to the
+closest correct answer, and suggested points when the match is clear
+either way. The host then only has to look at the ambiguous ones.
+
+Similarity is the Dice coefficient over character bigrams of the
+normalized texts (answer_clusters.normalize), which tolerates typos,
+missing words and reordering. Each correct Answer.answer_text also counts
+with its alternates: "Plastic wrap/Saran wrap" and "Heptagon (or
+Septagon)" accept either name. All of a question's team answers are
+compared against all of its accepted forms in one numpy pass, over count
+vectors on the bigrams that actually occur in the question; a part answer
+then only keeps the scores against its own part's forms, a whole-question
+answer against every form.
+
+Thresholds default to DEFAULT_THRESHOLDS and can be overridden with
+settings.SCORING_SUGGESTION_THRESHOLDS.
+"""
+
+from __future__ import annotations
+
+import re
+
+import numpy as np
+from django.conf import settings
+
+from .answer_clusters import normalize
+from .models import TeamAnswer
+from .scoring import scorer_for_type
+
+# Similarity at or above "accept" suggests full points, at or below
+# "reject" suggests zero; anything between is left to the host.
+DEFAULT_THRESHOLDS = {"accept": 0.8, "reject": 0.3}
+
+HIGH = "high"
+AMBIGUOUS = "ambiguous"
+
+
+def thresholds() -> dict[str, float]:
+    return {
+        **DEFAULT_THRESHOLDS,
+        **getattr(settings, "SCORING_SUGGESTION_THRESHOLDS", {}),
+    }
+
+
+def alternates(answer_text: str | None) -> list[str]:
+    """Normalized accepted forms of a correct answer.
+
+    The full text, the text outside parentheses, each parenthesized part
+    (minus a leading "or") and every "/"-separated option. Forms without
+    letters (numbers, ranges) are left out; those need a human or the
+    estimation scorer.
+    """
+    if not answer_text:
+        return []
+    outside = re.sub(r"\([^)]*\)", " ", answer_text)
+    inside = [
+        re.sub(r"^\s*or\s+", "", m) for m in re.findall(r"\(([^)]*)\)", answer_text)
+    ]
+    forms = [answer_text, outside, *inside, *outside.split("/")]
+    seen = []
+    for form in map(normalize, forms):
+        if form and form not in seen and any(c.isalpha() for c in form):
+            seen.append(form)
+    return seen
+
+
+def bigrams(text: str) -> list[str]:
+    """Character bigrams of a (normalized) text, padded with spaces."""
+    padded = f" {text} "
+    return [padded[i : i + 2] for i in range(len(padded) - 1)]
+
+
+def bigram_counts(texts: list[list[str]], vocabulary: dict[str, int]) -> np.ndarray:
+    """Bigram count vectors over `vocabulary`, one row per text."""
+    counts = np.zeros((len(texts), len(vocabulary)), dtype=np.int32)
+    for row, grams in enumerate(texts):
+        np.add.at(counts[row], [vocabulary[gram] for gram in grams], 1)
+    return counts
+
+
+def similarity(texts: list[str], references: list[str]) -> np.ndarray:
+    """Dice similarity of every text against every reference, in [0, 1]."""
+    text_grams = [bigrams(text) for text in texts]
+    reference_grams = [bigrams(reference) for reference in references]
+    vocabulary: dict[str, int] = {}
+    for grams in (*text_grams, *reference_grams):
+        for gram in grams:
+            vocabulary.setdefault(gram, len(vocabulary))
+    a = bigram_counts(text_grams, vocabulary)
+    b = bigram_counts(reference_grams, vocabulary)
+    shared = np.minimum(a[:, None, :], b[None, :, :]).sum(-1)
+    sizes = a.sum(-1)[:, None] + b.sum(-1)[None, :]
+    return 2 * shared / sizes
+
+
+def suggest(question: dict, answers: list[TeamAnswer]) -> dict[int, dict]:
+    """Suggestions for one question's answers, by TeamAnswer id.
+
+    `question` is the session content snapshot's question dict. Each
+    suggestion is {"similarity", "suggested_points", "confidence"}, with
+    suggested_points None when the confidence is "ambiguous". Questions
+    whose type isn't free-text, and answers with nothing to compare to,
+    get no entry.
+    """
+    if not scorer_for_type(question["question_type"]).free_text:
+        return {}
+
+    # Whole-question answers match any correct answer, part answers only
+    # their own part's: score against every form at once, then mask.
+    forms, owners = [], []
+    for part in question["answers"]:
+        for form in alternates(part["answer_text"]):
+            forms.append(form)
+            owners.append(part["id"])
+    rows = [
+        answer
+        for answer in answers
+        if answer.answer_part_id or not question["is_multi_part"]
+    ]
+    if not forms or not rows:
+        return {}
+
+    texts = [normalize(answer.answer_text) for answer in rows]
+    scores = similarity(texts, forms)
+    parts = np.array([answer.answer_part_id or 0 for answer in rows])[:, None]
+    owned = (parts == 0) | (parts == np.array(owners)[None, :])
+    best = np.where(owned, scores, -1.0).max(axis=1)
+
+    limits = thresholds()
+    points = {part["id"]: part["points"] for part in question["answers"]}
+    suggestions = {}
+    for answer, text, score in zip(rows, texts, best):
+        if score < 0:
+            continue  # No accepted form for this part
+        part_id = answer.answer_part_id
+        full_points = points[part_id] if part_id else question["total_points"]
+        if not text or score <= limits["reject"]:
+            suggested, confidence = 0, HIGH
+        elif score >= limits["accept"]:
+            suggested, confidence = full_points, HIGH
+        else:
+            suggested, confidence = None, AMBIGUOUS
+        suggestions[answer.id] = {
+            "similarity": round(float(score), 2),
+            "suggested_points": suggested,
+            "confidence": confidence,
+        }
+    return suggestions
@@ -0,0 +1,126 @@
+"""
+Tests for grouping identical answers (quiz.answer_clusters) and scoring them
+per cluster.
+"""
+
+import json
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from quiz import answer_clusters, session_content
+from quiz.models import (
+    Game,
+    GameSession,
+    Question,
+    QuestionRound,
+    QuestionType,
+    SessionRound,
+    SessionTeam,
+    TeamAnswer,
+)
+
+
+class NormalizeTest(SimpleTestCase):
+    def test_case_accents_punctuation_and_spacing(self):
+        """Test that spelling noise doesn't split an answer"""
+        variants = ["Beyoncé", "beyonce", "  BEYONCE! ", "Beyonce."]
+
+        self.assertEqual({answer_clusters.normalize(v) for v in variants}, {"beyonce"})
+
+    def test_punctuation_separates_words(self):
+        """Test that hyphens and slashes act as spaces"""
+        self.assertEqual(answer_clusters.normalize("A-ha"), "a ha")
+        self.assertEqual(answer_clusters.normalize("AC/DC"), "ac dc")
+
+    def test_empty(self):
+        self.assertEqual(answer_clusters.normalize(None), "")
+        self.assertEqual(answer_clusters.normalize(" ?! "), "")
+
+
+class AnswerClusterAPITest(TestCase):
+    def setUp(self):
+        self.game = Game.objects.create(subtitle="Test Game")
+        self.round = QuestionRound.objects.create(name="Round 1", round_number=1)
+        self.question = Question.objects.create(
+            game=self.game,
+            question_type=QuestionType.objects.create(name="Multiple Choice"),
+            game_round=self.round,
+            text="Capital of France?",
+            question_number=1,
+            total_points=2,
+        )
+        self.session = GameSession.objects.create(
+            game=self.game,
+            admin_name="Host",
+            status=GameSession.Status.SCORING,
+            current_round=self.round,
+        )
+        session_round = SessionRound.objects.create(
+            session=self.session, round=self.round, status=SessionRound.Status.LOCKED
+        )
+        session_content.store(self.session)
+        self.answers = [
+            TeamAnswer.objects.create(
+                team=SessionTeam.objects.create(session=self.session, name=f"T{i}"),
+                question=self.question,
+                session_round=session_round,
+                answer_text=text,
+                is_locked=True,
+            )
+            for i, text in enumerate(["Paris", "paris ", "PARIS!", "Lyon"])
+        ]
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {self.session.admin_token}"}
+
+    def score_cluster(self, key, points):
+        return self.client.post(
+            reverse("quiz:session_admin_score_cluster", args=[self.session.code]),
+            data=json.dumps(
+                {"question_id": self.question.id, "key": key, "points": points}
+            ),
+            content_type="application/json",
+            **self.headers,
+        )
+
+    def test_scoring_data_groups_answers(self):
+        """Test that ?group=clusters returns one cluster per distinct answer"""
+        response = self.client.get(
+            reverse("quiz:session_admin_scoring", args=[self.session.code])
+            + "?group=clusters",
+            **self.headers,
+        )
+
+        clusters = response.json()["questions"][0]["clusters"]
+        self.assertEqual(
+            [(c["key"], c["count"]) for c in clusters], [("paris", 3), ("lyon", 1)]
+        )
+        self.assertEqual(clusters[0]["answer_text"], "Paris")
+        self.assertEqual(clusters[0]["max_points"], 2)
+        self.assertFalse(clusters[0]["is_scored"])
+
+    def test_scoring_data_ungrouped_by_default(self):
+        response = self.client.get(
+            reverse("quiz:session_admin_scoring", args=[self.session.code]),
+            **self.headers,
+        )
+
+        self.assertNotIn("clusters", response.json()["questions"][0])
+
+    def test_score_cluster_scores_every_member(self):
+        """Test that one request scores all teams with the same answer"""
+        response = self.score_cluster("paris", 2)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 3)
+        points = [TeamAnswer.objects.get(id=a.id).points_awarded for a in self.answers]
+        self.assertEqual(points, [2, 2, 2, None])
+        self.assertEqual(
+            sorted(SessionTeam.objects.values_list("score", flat=True)), [0, 2, 2, 2]
+        )
+
+    def test_score_cluster_validates_points(self):
+        self.assertEqual(self.score_cluster("paris", 3).status_code, 400)
+        self.assertIsNone(TeamAnswer.objects.get(id=self.answers[0].id).points_awarded)
+
+    def test_unknown_cluster(self):
+        self.assertEqual(self.score_cluster("rome", 1).status_code, 404)
@@ -0,0 +1,210 @@
+"""
+Tests for the buffered answer autosaves in quiz.answer_drafts.
+"""
+
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from quiz import answer_drafts, session_content, session_progress
+from quiz.models import (
+    Game,
+    GameSession,
+    Question,
+    QuestionRound,
+    QuestionType,
+    SessionRound,
+    SessionTeam,
+    TeamAnswer,
+)
+from quiz.session_director import SessionDirector
+
+
+class AnswerDraftTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.game = Game.objects.create(subtitle="Test Game")
+        self.round = QuestionRound.objects.create(name="Round 1", round_number=1)
+        self.question = Question.objects.create(
+            game=self.game,
+            question_type=QuestionType.objects.create(name="Multiple Choice"),
+            game_round=self.round,
+            text="Q1",
+            question_number=1,
+            total_points=5,
+        )
+        self.session = GameSession.objects.create(game=self.game, admin_name="Host")
+        SessionRound.objects.create(session=self.session, round=self.round)
+        session_content.store(self.session)
+        self.team = SessionTeam.objects.create(session=self.session, name="Team A")
+        SessionDirector(self.session).start()
+        self.session.refresh_from_db()
+        # Hold off the autosave-triggered flush so drafts stay buffered.
+        cache.set(answer_drafts.FLUSH_KEY.format(code=self.session.code), 1)
+
+    def post(self, text, draft=True):
+        return self.client.post(
+            reverse("quiz:session_team_answer", args=[self.session.code]),
+            data=json.dumps(
+                {"question_id": self.question.id, "answer_text": text, "draft": draft}
+            ),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {self.team.token}",
+        )
+
+    def stored_text(self):
+        answer = TeamAnswer.objects.filter(team=self.team).first()
+        return answer.answer_text if answer else None
+
+    def test_autosave_stays_in_cache(self):
+        """Test that draft saves don't write TeamAnswer rows"""
+        for text in ("P", "Pa", "Paris"):
+            self.assertEqual(self.post(text).status_code, 200)
+
+        self.assertIsNone(self.stored_text())
+        state = self.client.get(
+            reverse("quiz:session_state", args=[self.session.code])
+        ).json()
+        self.assertEqual(state["round_progress"][0]["submitted_count"], 1)
+
+    def test_flush_writes_latest_draft_once(self):
+        """Test that a flush persists the latest text and clears the buffer"""
+        self.post("Pa")
+        self.post("Paris")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(answer_drafts.flush(self.session), 1)
+        self.assertEqual(self.stored_text(), "Paris")
+        with self.assertNumQueries(1):  # the session's teams; nothing pending
+            self.assertEqual(answer_drafts.flush(self.session), 0)
+
+    def test_flush_writes_all_drafts_in_one_statement(self):
+        """Test that the flush cost doesn't grow with the number of drafts"""
+        teams = [self.team] + [
+            SessionTeam.objects.create(session=self.session, name=f"Team {i}")
+            for i in range(5)
+        ]
+        session_round = self.session.session_rounds.get()
+        for team in teams:
+            answer_drafts.save(
+                self.session, team.id, self.question.id, session_round.id, team.name
+            )
+        TeamAnswer.objects.create(
+            team=teams[1],
+            question=self.question,
+            session_round=session_round,
+            answer_text="Locked in",
+            is_locked=True,
+        )
+
+        # The session's teams, the round's row lock (in a savepoint), one upsert
+        with self.assertNumQueries(5):
+            self.assertEqual(answer_drafts.flush(self.session), 5)
+
+        self.assertEqual(TeamAnswer.objects.get(team=teams[1]).answer_text, "Locked in")
+        self.assertEqual(TeamAnswer.objects.get(team=teams[5]).answer_text, "Team 4")
+
+    def test_lock_round_flushes_drafts(self):
+        """Test that buffered drafts are locked with the round"""
+        self.post("Paris")
+
+        SessionDirector(self.session).lock_round()
+
+        answer = TeamAnswer.objects.get(team=self.team)
+        self.assertEqual(answer.answer_text, "Paris")
+        self.assertTrue(answer.is_locked)
+
+    def test_drafts_survive_a_failed_lock(self):
+        """Test that a lock rolled back after its flush leaves drafts pending"""
+        self.post("Paris")
+
+        with (
+            patch.object(session_progress, "set_unscored", side_effect=RuntimeError),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            with self.assertRaises(RuntimeError):
+                SessionDirector(self.session).lock_round()
+
+        self.assertIsNone(self.stored_text())
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(answer_drafts.flush(self.session), 1)
+        self.assertEqual(self.stored_text(), "Paris")
+
+    def test_lock_round_writes_drafts_without_flags(self):
+        """Test that the lock writes every buffered draft, flagged or not"""
+        self.post("Paris")
+        cache.delete(answer_drafts.dirty_key(self.team.id, self.question.id))
+
+        SessionDirector(self.session).lock_round()
+
+        self.assertEqual(self.stored_text(), "Paris")
+
+    def test_submit_discards_older_draft(self):
+        """Test that an explicit submit isn't overwritten by a stale draft"""
+        self.post("Lyon")
+        self.post("Paris", draft=False)
+
+        answer_drafts.flush(self.session)
+
+        self.assertEqual(self.stored_text(), "Paris")
+
+    def test_stale_draft_does_not_overwrite_submit(self):
+        """Test that a draft read just before a submit can't undo the submit"""
+        self.post("Lyon")
+        keys = [
+            answer_drafts.draft_key(self.team.id, self.question.id),
+            answer_drafts.dirty_key(self.team.id, self.question.id),
+        ]
+        in_flight = cache.get_many(keys)
+        self.post("Paris", draft=False)
+        cache.set_many(in_flight)  # The flush read these before the discard
+
+        self.assertEqual(answer_drafts.flush(self.session), 0)
+        self.assertEqual(self.stored_text(), "Paris")
+
+    def test_drafts_after_lock_are_dropped(self):
+        """Test that a draft accepted while the round locked is never written"""
+        session_round = self.session.session_rounds.get()
+        SessionDirector(self.session).lock_round()
+        answer_drafts.save(
+            self.session, self.team.id, self.question.id, session_round.id, "Late"
+        )
+
+        self.assertEqual(answer_drafts.flush(self.session), 0)
+        self.assertEqual(TeamAnswer.objects.get(team=self.team).answer_text, "")
+        self.assertEqual(answer_drafts.buffered([self.team.id], [self.question.id]), {})
+
+    def test_get_answers_sees_drafts(self):
+        """Test that a team reloading its answers gets its buffered text,
+        without the read writing it"""
+        self.post("Paris")
+        url = reverse("quiz:session_team_answers", args=[self.session.code])
+
+        response = self.client.get(
+            url, HTTP_AUTHORIZATION=f"Bearer {self.team.token}"
+        ).json()
+
+        self.assertEqual(response["answers"][0]["answer_text"], "Paris")
+        self.assertIsNone(self.stored_text())
+
+        self.post("Paris!")
+        changed = self.client.get(
+            url,
+            {"since": response["last_updated"]},
+            HTTP_AUTHORIZATION=f"Bearer {self.team.token}",
+        ).json()
+
+        self.assertEqual([a["answer_text"] for a in changed["answers"]], ["Paris!"])
+
+    def test_command_flushes_live_sessions(self):
+        """Test that the periodic flush command writes pending drafts"""
+        self.post("Paris")
+
+        call_command("flush_answer_drafts", stdout=StringIO())
+
+        self.assertEqual(self.stored_text(), "Paris")
@@ -0,0 +1,104 @@
+"""
+Tests for the buffered host/team heartbeats in quiz.heartbeats.
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from quiz import heartbeats
+from quiz.models import Game, GameSession, SessionTeam
+
+
+class HeartbeatBufferTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.game = Game.objects.create(subtitle="Test Game")
+        self.session = GameSession.objects.create(game=self.game, admin_name="Host")
+        self.team = SessionTeam.objects.create(session=self.session, name="Team A")
+        self.stale = timezone.now() - timedelta(minutes=5)
+        GameSession.objects.filter(id=self.session.id).update(
+            admin_last_seen=self.stale
+        )
+        SessionTeam.objects.filter(id=self.team.id).update(last_seen=self.stale)
+
+    def test_first_beat_flushes(self):
+        """Test that the first beat of an interval writes through"""
+        heartbeats.beat_admin(self.session.code)
+
+        self.session.refresh_from_db()
+        self.assertGreater(self.session.admin_last_seen, self.stale)
+
+    def test_beats_within_interval_stay_in_cache(self):
+        """Test that later beats in the interval don't touch the DB"""
+        heartbeats.beat_admin(self.session.code)
+
+        with self.assertNumQueries(0):
+            heartbeats.beat_admin(self.session.code)
+            heartbeats.beat_team(self.session.code, self.team.id)
+
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.last_seen, self.stale)
+
+    def test_flush_writes_team_beats(self):
+        """Test that a flush bulk-updates buffered team beats"""
+        heartbeats.beat_admin(self.session.code)
+        heartbeats.beat_team(self.session.code, self.team.id)
+
+        heartbeats.flush(self.session.code)
+
+        self.team.refresh_from_db()
+        self.assertGreater(self.team.last_seen, self.stale)
+
+    def test_flush_does_not_bump_state_version(self):
+        """Test that heartbeats are invisible to state polling"""
+        heartbeats.beat_team(self.session.code, self.team.id)
+        heartbeats.flush(self.session.code)
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.state_version, 1)
+
+    def test_sweeper_respects_buffered_beat(self):
+        """Test that an unflushed host beat keeps the session running"""
+        self.session.status = GameSession.Status.PLAYING
+        self.session.save()
+        GameSession.objects.filter(id=self.session.id).update(
+            admin_last_seen=self.stale
+        )
+        cache.set(heartbeats.admin_key(self.session.code), timezone.now().timestamp())
+
+        call_command("sweep_admin_timeouts", stdout=StringIO())
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.status, GameSession.Status.PLAYING)
+
+    def test_sweeper_pauses_stale_host(self):
+        """Test that a session with no recent host beat is paused"""
+        self.session.status = GameSession.Status.SCORING
+        self.session.save()
+        GameSession.objects.filter(id=self.session.id).update(
+            admin_last_seen=self.stale
+        )
+
+        call_command("sweep_admin_timeouts", stdout=StringIO())
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.status, GameSession.Status.PAUSED)
+        self.assertEqual(self.session.status_before_pause, GameSession.Status.SCORING)
+
+    def test_team_request_skips_last_seen_write(self):
+        """Test that an authenticated team request buffers its heartbeat"""
+        heartbeats.beat_team(self.session.code, self.team.id)  # opens the interval
+        SessionTeam.objects.filter(id=self.team.id).update(last_seen=self.stale)
+        url = reverse("quiz:session_team_answers", args=[self.session.code])
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {self.team.token}")
+
+        self.assertEqual(response.status_code, 200)
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.last_seen, self.stale)
@@ -0,0 +1,45 @@
+"""
+Tests for the server-suggested poll pace (quiz.poll_intervals).
+"""
+
+from django.test import SimpleTestCase
+
+from quiz.models import GameSession, SessionRound
+from quiz.poll_intervals import next_poll_ms
+
+Status = GameSession.Status
+
+
+class NextPollTest(SimpleTestCase):
+    def test_fast_right_after_a_change(self):
+        self.assertEqual(next_poll_ms(Status.PLAYING, SessionRound.Status.ACTIVE), 2000)
+        self.assertEqual(next_poll_ms(Status.PLAYING, changed_at=100, now=100), 2000)
+
+    def test_backs_off_with_idle_time(self):
+        """Test that the interval grows with the time since the last change"""
+        intervals = [
+            next_poll_ms(Status.LOBBY, changed_at=0, now=idle) for idle in (0, 20, 600)
+        ]
+
+        self.assertEqual(intervals, [3000, 5000, 10000])
+
+    def test_idle_phases_slower_than_play(self):
+        """Test that leaderboard, pause and end back off further than a round"""
+        for status in (Status.LEADERBOARD, Status.PAUSED, Status.COMPLETED):
+            self.assertGreaterEqual(
+                next_poll_ms(status, changed_at=0, now=600), 15000, status
+            )
+        self.assertEqual(
+            next_poll_ms(
+                Status.PLAYING, SessionRound.Status.ACTIVE, changed_at=0, now=600
+            ),
+            5000,
+        )
+
+    def test_locked_round_polled_slower(self):
+        self.assertEqual(
+            next_poll_ms(
+                Status.PLAYING, SessionRound.Status.LOCKED, changed_at=0, now=600
+            ),
+            10000,
+        )
@@ -0,0 +1,170 @@
+"""
+Tests for the token-bucket limits in quiz.rate_limits.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from quiz import rate_limits
+from quiz.models import (
+    Game,
+    GameSession,
+    Question,
+    QuestionRound,
+    QuestionType,
+    SessionRound,
+    SessionTeam,
+)
+
+
+@override_settings(SESSION_RATE_LIMITS={"team_answer": (2, 0.5)})
+class TokenBucketTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_burst_up_to_capacity(self):
+        """Test that a full bucket passes `capacity` requests, then refuses"""
+        results = [rate_limits.take("team_answer", "a") for _ in range(3)]
+
+        self.assertEqual([allowed for allowed, _ in results], [True, True, False])
+        self.assertAlmostEqual(results[2][1], 2.0, delta=0.1)
+
+    def test_refills_at_rate(self):
+        """Test that tokens come back at the configured rate"""
+        with patch("quiz.rate_limits.time.time", return_value=1000.0):
+            rate_limits.take("team_answer", "a")
+            rate_limits.take("team_answer", "a")
+        with patch("quiz.rate_limits.time.time", return_value=1002.0):
+            self.assertTrue(rate_limits.take("team_answer", "a")[0])
+            self.assertFalse(rate_limits.take("team_answer", "a")[0])
+
+    def test_buckets_are_per_client(self):
+        """Test that one client's empty bucket doesn't affect another"""
+        for _ in range(3):
+            rate_limits.take("team_answer", "a")
+
+        self.assertTrue(rate_limits.take("team_answer", "b")[0])
+
+
+@override_settings(
+    REDIS_URL="redis://redis:6379/0", SESSION_RATE_LIMITS={"team_answer": (2, 0.5)}
+)
+class RedisTokenBucketTest(TestCase):
+    """The Redis path, with the registered Lua script mocked out."""
+
+    def setUp(self):
+        self.script = MagicMock()
+        redis_client = patch("quiz.rate_limits.redis.Redis.from_url").start()
+        redis_client.return_value.register_script.return_value = self.script
+        patch("quiz.rate_limits._script", None).start()
+        self.addCleanup(patch.stopall)
+
+    def test_script_gets_bucket_key_and_limits(self):
+        """Test that one script call takes the token, on the module's client"""
+        self.script.return_value = [1, b"1"]
+
+        self.assertEqual(rate_limits.take("team_answer", "team:1"), (True, 0.0))
+        self.script.assert_called_once_with(
+            keys=["ratelimit:team_answer:team:1"], args=[2, 0.5]
+        )
+        rate_limits.redis.Redis.from_url.assert_called_once_with("redis://redis:6379/0")
+
+    def test_refusal_waits_for_the_missing_fraction(self):
+        """Test that Retry-After covers the part of a token still missing"""
+        self.script.return_value = [0, b"0.25"]
+
+        allowed, retry_after = rate_limits.take("team_answer", "team:1")
+
+        self.assertFalse(allowed)
+        self.assertEqual(retry_after, 1.5)  # 0.75 tokens at 0.5 per second
+
+    @override_settings(RATELIMIT_ENABLE=True)
+    def test_refusal_response(self):
+        """Test that the decorator turns a refused take into a 429"""
+        self.script.return_value = [0, b"0.25"]
+        view = rate_limits.rate_limit("team_answer")(MagicMock())
+        request = MagicMock(team=MagicMock(id=1))
+
+        response = view(request)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "2")
+
+
+@override_settings(
+    RATELIMIT_ENABLE=True, SESSION_RATE_LIMITS={"team_answer": (2, 0.01)}
+)
+class TeamAnswerRateLimitTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        game = Game.objects.create(subtitle="Test Game")
+        game_round = QuestionRound.objects.create(name="Round 1", round_number=1)
+        self.question = Question.objects.create(
+            game=game,
+            question_type=QuestionType.objects.create(name="Multiple Choice"),
+            game_round=game_round,
+            text="Q1",
+            question_number=1,
+        )
+        self.session = GameSession.objects.create(
+            game=game, admin_name="Host", status=GameSession.Status.PLAYING
+        )
+        SessionRound.objects.create(
+            session=self.session, round=game_round, status=SessionRound.Status.ACTIVE
+        )
+        self.teams = [
+            SessionTeam.objects.create(session=self.session, name=name)
+            for name in ("Team A", "Team B")
+        ]
+
+    def post(self, team):
+        return self.client.post(
+            reverse("quiz:session_team_answer", args=[self.session.code]),
+            data=json.dumps({"question_id": self.question.id, "answer_text": "x"}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {team.token}",
+        )
+
+    def test_limit_is_per_team_not_per_address(self):
+        """Test that teams behind one NAT address are limited separately"""
+        statuses = [self.post(self.teams[0]).status_code for _ in range(3)]
+
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(self.post(self.teams[1]).status_code, 200)
+
+    def test_refusal_carries_retry_after(self):
+        """Test that a throttled client is told when to come back"""
+        for _ in range(2):
+            self.post(self.teams[0])
+
+        response = self.post(self.teams[0])
+
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response["Retry-After"]), 0)
+
+
+@override_settings(RATELIMIT_ENABLE=True, SESSION_RATE_LIMITS={"join": (2, 0.01)})
+class JoinRateLimitTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.session = GameSession.objects.create(
+            game=Game.objects.create(subtitle="Test Game"), admin_name="Host"
+        )
+
+    def test_fresh_bearer_tokens_share_the_address_bucket(self):
+        """Test that a made-up token per request doesn't get a new bucket"""
+        statuses = [
+            self.client.post(
+                reverse("quiz:session_join", args=[self.session.code]),
+                data=json.dumps({"team_name": f"Team {i}"}),
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"Bearer random-{i}",
+            ).status_code
+            for i in range(3)
+        ]
+
+        self.assertEqual(statuses, [200, 200, 429])
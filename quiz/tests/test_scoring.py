@@ -3,12 +3,13 @@ Unit tests for quiz.scoring.
 
 These tests exercise the Scorer adapters directly. They do not go through
 HTTP, view auth, or transactions. The interface under test is is_multi_part,
-split_submission, auto_score, and scorer_for resolution.
+score_submissions, and scorer_for resolution.
 """
 
 import json
 
-from django.test import TestCase
+import numpy as np
+from django.test import SimpleTestCase, TestCase, override_settings
 
 from quiz.models import (
     Answer,
@@ -21,11 +22,15 @@ from quiz.models import (
     SessionTeam,
     TeamAnswer,
 )
+from quiz.session_content import SessionContent, compile_content
 from quiz.scoring import (
+    EstimationScorer,
     MatchingScorer,
     MultipleOpenEndedScorer,
     RankingScorer,
     SingleAnswerScorer,
+    estimation_points,
+    parse_number,
     scorer_for,
 )
 
@@ -59,6 +64,11 @@ def _fixture(question_type_name, *, with_answer_text=False, with_prompts=False):
     return question, session_round, team
 
 
+def _snapshot(question):
+    """The question as lock_round sees it: its session content snapshot dict."""
+    return SessionContent(compile_content(question.game)).question(question.id)
+
+
 # ----------------------------------------------------------------------------
 # Resolution
 # ----------------------------------------------------------------------------
@@ -89,6 +99,14 @@ class ScorerForTest(TestCase):
         )
         self.assertIsInstance(scorer_for(q), MultipleOpenEndedScorer)
 
+    def test_resolves_estimation(self):
+        qt = QuestionType.objects.create(name="Estimation")
+        game = Game.objects.create(subtitle="G")
+        q = Question.objects.create(
+            game=game, question_type=qt, question_number=1, text="?"
+        )
+        self.assertIsInstance(scorer_for(q), EstimationScorer)
+
     def test_unknown_type_falls_back_to_single(self):
         qt = QuestionType.objects.create(name="Fictional Type")
         game = Game.objects.create(subtitle="G")
@@ -156,37 +174,41 @@ class IsMultiPartTest(TestCase):
 
 
 # ----------------------------------------------------------------------------
-# RankingScorer.auto_score
+# RankingScorer.score_submissions
 # ----------------------------------------------------------------------------
 
 
-class RankingScorerAutoScoreTest(TestCase):
-    def _submit_ranking(self, question, session_round, team, placements):
-        """Create the unsplit TeamAnswer that the player would submit.
+def _score_one(scorer, question, session_round, team, submission):
+    """Score one team's submission the way lock_round does.
 
-        placements is the player's array: index = position, value = the
-        display_order of the item placed at that position.
-        """
-        ta = TeamAnswer.objects.create(
-            team=team,
-            question=question,
-            session_round=session_round,
-            answer_text=json.dumps(placements),
-        )
-        return RankingScorer().split_submission(ta)
+    submission is the player's array, stored as the combined JSON answer.
+    Returns the unsaved part rows.
+    """
+    ta = TeamAnswer.objects.create(
+        team=team,
+        question=question,
+        session_round=session_round,
+        answer_text=json.dumps(submission),
+    )
+    return scorer.score_submissions(_snapshot(question), [ta], {})
+
+
+class RankingScorerTest(TestCase):
+    def _submit_ranking(self, question, session_round, team, placements):
+        """placements: index = position, value = the display_order of the
+        item placed at that position."""
+        return _score_one(RankingScorer(), question, session_round, team, placements)
 
     def test_all_correct(self):
         q, sr, t = _fixture("Ranking")
         # Item with display_order=1 has correct_rank=1, place it at position 1, etc.
         parts = self._submit_ranking(q, sr, t, [1, 2, 3])
-        RankingScorer().auto_score(parts, q)
         for pa in parts:
             self.assertEqual(pa.points_awarded, 1)
 
     def test_all_wrong(self):
         q, sr, t = _fixture("Ranking")
         parts = self._submit_ranking(q, sr, t, [3, 1, 2])
-        RankingScorer().auto_score(parts, q)
         for pa in parts:
             self.assertEqual(pa.points_awarded, 0)
 
@@ -194,82 +216,229 @@ class RankingScorerAutoScoreTest(TestCase):
         q, sr, t = _fixture("Ranking")
         # Position 1 correct (item 1, rank 1); position 2 wrong; position 3 wrong.
         parts = self._submit_ranking(q, sr, t, [1, 3, 2])
-        RankingScorer().auto_score(parts, q)
-        scored = sorted(parts, key=lambda p: p.answer_part.display_order)
-        self.assertEqual([p.points_awarded for p in scored], [1, 0, 0])
+        self.assertEqual([p.points_awarded for p in parts], [1, 0, 0])
 
     def test_missing_position_scores_zero(self):
         q, sr, t = _fixture("Ranking")
         parts = self._submit_ranking(q, sr, t, [1])  # only one placement
-        RankingScorer().auto_score(parts, q)
-        scored = sorted(parts, key=lambda p: p.answer_part.display_order)
-        self.assertEqual([p.points_awarded for p in scored], [1, 0, 0])
+        self.assertEqual([p.points_awarded for p in parts], [1, 0, 0])
 
 
 # ----------------------------------------------------------------------------
-# MatchingScorer.auto_score
+# MatchingScorer.score_submissions
 # ----------------------------------------------------------------------------
 
 
-class MatchingScorerAutoScoreTest(TestCase):
+class MatchingScorerTest(TestCase):
     def _submit(self, question, session_round, team, submissions):
-        ta = TeamAnswer.objects.create(
-            team=team,
-            question=question,
-            session_round=session_round,
-            answer_text=json.dumps(submissions),
-        )
-        return MatchingScorer().split_submission(ta)
+        return _score_one(MatchingScorer(), question, session_round, team, submissions)
 
     def test_exact_match_all(self):
         q, sr, t = _fixture("Matching", with_answer_text=True)
         parts = self._submit(q, sr, t, ["correct-1", "correct-2", "correct-3"])
-        MatchingScorer().auto_score(parts, q)
         for pa in parts:
             self.assertEqual(pa.points_awarded, 1)
 
     def test_case_insensitive_and_whitespace_trimmed(self):
         q, sr, t = _fixture("Matching", with_answer_text=True)
         parts = self._submit(q, sr, t, ["  CORRECT-1  ", "Correct-2", "correct-3"])
-        MatchingScorer().auto_score(parts, q)
         for pa in parts:
             self.assertEqual(pa.points_awarded, 1)
 
     def test_wrong_matches_get_zero(self):
         q, sr, t = _fixture("Matching", with_answer_text=True)
         parts = self._submit(q, sr, t, ["wrong", "correct-2", "also wrong"])
-        MatchingScorer().auto_score(parts, q)
-        scored = sorted(parts, key=lambda p: p.answer_part.display_order)
-        self.assertEqual([p.points_awarded for p in scored], [0, 1, 0])
+        self.assertEqual([p.points_awarded for p in parts], [0, 1, 0])
 
 
 # ----------------------------------------------------------------------------
-# split_submission shape
+# Part split shape
 # ----------------------------------------------------------------------------
 
 
-class SplitSubmissionTest(TestCase):
-    def test_creates_one_team_answer_per_part(self):
+class SplitPartsTest(TestCase):
+    def test_one_team_answer_per_part(self):
         q, sr, t = _fixture("Ranking")
-        ta = TeamAnswer.objects.create(
-            team=t,
-            question=q,
-            session_round=sr,
-            answer_text=json.dumps([2, 1, 3]),
-        )
-        parts = RankingScorer().split_submission(ta)
+        parts = _score_one(RankingScorer(), q, sr, t, [2, 1, 3])
         self.assertEqual(len(parts), 3)
         # Each part is locked and links to a distinct Answer part.
-        for pa in parts:
-            self.assertTrue(pa.is_locked)
-            self.assertIsNotNone(pa.answer_part)
+        self.assertTrue(all(pa.is_locked for pa in parts))
+        self.assertEqual(len({pa.answer_part_id for pa in parts}), 3)
 
     def test_malformed_json_yields_empty_part_texts(self):
         q, sr, t = _fixture("Ranking")
         ta = TeamAnswer.objects.create(
             team=t, question=q, session_round=sr, answer_text="not-json"
         )
-        parts = RankingScorer().split_submission(ta)
+        parts = RankingScorer().score_submissions(_snapshot(q), [ta], {})
         self.assertEqual(len(parts), 3)
         for pa in parts:
             self.assertEqual(pa.answer_text, "")
+
+
+# ----------------------------------------------------------------------------
+# score_submissions (batch)
+# ----------------------------------------------------------------------------
+
+
+class ScoreSubmissionsTest(TestCase):
+    def _submissions(self, question, session_round, first_team, texts):
+        """One unsaved combined submission per team, first_team plus new teams."""
+        teams = [first_team] + [
+            SessionTeam.objects.create(session=first_team.session, name=f"T{i}")
+            for i in range(2, len(texts) + 1)
+        ]
+        return [
+            TeamAnswer(
+                team=team,
+                question=question,
+                session_round=session_round,
+                answer_text=json.dumps(text),
+            )
+            for team, text in zip(teams, texts)
+        ]
+
+    def test_ranking_scores_all_teams_without_queries(self):
+        q, sr, t = _fixture("Ranking")
+        submissions = self._submissions(q, sr, t, [[1, 2, 3], [1, 3, 2]])
+        q = _snapshot(q)
+
+        with self.assertNumQueries(0):
+            parts = RankingScorer().score_submissions(q, submissions, {})
+
+        self.assertEqual(len(parts), 6)
+        self.assertTrue(all(p.pk is None and p.is_locked for p in parts))
+        self.assertEqual([p.points_awarded for p in parts], [1, 1, 1, 1, 0, 0])
+
+    def test_matching_scores_all_teams(self):
+        q, sr, t = _fixture("Matching", with_answer_text=True)
+        submissions = self._submissions(
+            q, sr, t, [["correct-1", "x", "CORRECT-3"], ["", "correct-2", ""]]
+        )
+
+        parts = MatchingScorer().score_submissions(_snapshot(q), submissions, {})
+
+        self.assertEqual([p.points_awarded for p in parts], [1, 0, 1, 0, 1, 0])
+
+    def test_open_ended_splits_without_scoring(self):
+        q, sr, t = _fixture("Multiple Open Ended", with_prompts=True)
+        submissions = self._submissions(q, sr, t, [["a", "b", "c"]])
+
+        parts = MultipleOpenEndedScorer().score_submissions(
+            _snapshot(q), submissions, {}
+        )
+
+        self.assertEqual([p.answer_text for p in parts], ["a", "b", "c"])
+        self.assertTrue(all(p.points_awarded is None for p in parts))
+
+    def test_stored_parts_are_reused(self):
+        q, sr, t = _fixture("Ranking")
+        first_part = q.answers.order_by("display_order").first()
+        stored = TeamAnswer.objects.create(
+            team=t, question=q, session_round=sr, answer_part=first_part
+        )
+        submissions = self._submissions(q, sr, t, [[1, 2, 3]])
+
+        parts = RankingScorer().score_submissions(
+            _snapshot(q), submissions, {(t.id, first_part.id): stored}
+        )
+
+        self.assertIs(parts[0], stored)
+        self.assertEqual(parts[0].answer_text, "1")
+        self.assertIsNone(parts[1].pk)
+
+
+# ----------------------------------------------------------------------------
+# Estimation
+# ----------------------------------------------------------------------------
+
+
+class ParseNumberTest(SimpleTestCase):
+    def test_formats(self):
+        cases = {
+            "1969": 1969,
+            "$1,200": 1200,
+            "3.5 million": 3_500_000,
+            "1.5k": 1500,
+            "40%": 40,
+            "-3": -3,
+        }
+        for text, expected in cases.items():
+            self.assertEqual(parse_number(text), expected, text)
+
+    def test_not_a_number(self):
+        for text in (None, "", "lots", "12 apples"):
+            self.assertIsNone(parse_number(text), text)
+
+
+class EstimationPointsTest(SimpleTestCase):
+    def test_default_tiers(self):
+        """Test exact, closest and within-10% tiers; best tier wins"""
+        points = estimation_points(np.array([100, 95, 120, np.nan]), 100, 2)
+
+        self.assertEqual(points.tolist(), [2, 1, 0, 0])
+
+    def test_ties_share_closest(self):
+        points = estimation_points(np.array([90.0, 110.0, 150.0]), 100, 2)
+
+        self.assertEqual(points.tolist(), [2, 2, 0])
+
+    @override_settings(ESTIMATION_TIERS={"error": "relative", "within_percent": 0})
+    def test_relative_error(self):
+        """Test that relative error ranks guesses by ratio, not distance"""
+        points = estimation_points(np.array([250.0, 1600.0]), 1000, 2)
+
+        self.assertEqual(points.tolist(), [0, 2])
+
+    @override_settings(ESTIMATION_TIERS={"error": "relative", "closest": 0})
+    def test_relative_within_is_a_ratio(self):
+        """Test that "within 10%" allows a factor of 1.1 either way"""
+        points = estimation_points(np.array([109.0, 91.0, 90.5, 111.0]), 100, 2)
+
+        self.assertEqual(points.tolist(), [1, 1, 0, 0])
+
+    @override_settings(ESTIMATION_TIERS={"error": "relative", "closest": 0})
+    def test_relative_error_with_zero_target(self):
+        """Test that a target of 0 falls back to absolute error"""
+        points = estimation_points(np.array([0.0, 1.0]), 0, 2)
+
+        self.assertEqual(points.tolist(), [2, 0])
+
+    @override_settings(ESTIMATION_TIERS={"closest": 2, "closest_share": 0.5})
+    def test_configured_tiers(self):
+        points = estimation_points(np.array([10.0, 20.0, 30.0]), 12, 4)
+
+        self.assertEqual(points.tolist(), [2, 2, 0])
+
+
+class EstimationScorerTest(TestCase):
+    def setUp(self):
+        self.question, self.session_round, self.team = _fixture("Estimation")
+        self.question.answers.all().delete()
+        Answer.objects.create(question=self.question, answer_text="8,849")
+
+    def test_scores_submissions_in_place(self):
+        submissions = [
+            TeamAnswer(team=self.team, question=self.question, answer_text=text)
+            for text in ("8849", "9000", "no idea")
+        ]
+
+        scored = EstimationScorer().score_submissions(
+            _snapshot(self.question), submissions, {}
+        )
+
+        self.assertEqual(scored, submissions)
+        self.assertEqual([a.points_awarded for a in scored], [3, 2, 0])
+        self.assertTrue(all(a.scored_at for a in scored))
+
+    def test_no_numeric_answer_leaves_unscored(self):
+        self.question.answers.update(answer_text="Everest")
+        submission = TeamAnswer(team=self.team, question=self.question, answer_text="1")
+
+        self.assertEqual(
+            EstimationScorer().score_submissions(
+                _snapshot(self.question), [submission], {}
+            ),
+            [],
+        )
+        self.assertIsNone(submission.points_awarded)
@@ -4,6 +4,9 @@ Tests for session admin interface.
 Verifies admin registrations and custom admin features.
 """
 
+from datetime import timedelta
+
+from django.core.cache import cache
 from django.test import TestCase
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth.models import User
@@ -11,6 +14,7 @@ from django.http import HttpRequest
 from django.utils import timezone
 from unittest.mock import MagicMock
 
+from quiz import heartbeats
 from quiz.models import (
     Game,
     GameSession,
@@ -151,6 +155,20 @@ class GameSessionAdminTest(TestCase):
         self.assertIn("admin_token", self.admin.readonly_fields)
         self.assertIn("code", self.admin.readonly_fields)
 
+    def test_host_last_seen_includes_buffered_beat(self):
+        """Test that an unflushed host heartbeat is shown over the DB value"""
+        cache.clear()
+        self.session.admin_last_seen = timezone.now() - timedelta(minutes=5)
+        seen = timezone.now()
+        cache.set(heartbeats.admin_key(self.session.code), seen.timestamp())
+
+        self.assertEqual(self.admin.host_last_seen(self.session), seen)
+
+        cache.clear()
+        self.assertEqual(
+            self.admin.host_last_seen(self.session), self.session.admin_last_seen
+        )
+
 
 class SessionTeamAdminTest(TestCase):
     """Test SessionTeam admin interface"""
@@ -187,6 +205,18 @@ class SessionTeamAdminTest(TestCase):
         self.assertIn(self.team.token, result)
         self.assertIn('type="text"', result)
 
+    def test_team_last_seen_includes_buffered_beat(self):
+        """Test that an unflushed team heartbeat is shown over the DB value"""
+        cache.clear()
+        self.team.last_seen = timezone.now() - timedelta(minutes=5)
+        seen = timezone.now()
+        cache.set(heartbeats.team_key(self.team.id), seen.timestamp())
+
+        self.assertEqual(self.admin.team_last_seen(self.team), seen)
+
+        cache.clear()
+        self.assertEqual(self.admin.team_last_seen(self.team), self.team.last_seen)
+
 
 class SessionRoundAdminTest(TestCase):
     """Test SessionRound admin interface"""
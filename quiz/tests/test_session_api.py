@@ -3,7 +3,13 @@ Tests for session API endpoints
 """
 
 import json
-from django.test import TestCase, Client
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncClient, TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -14,10 +20,13 @@ from quiz.models import (
     QuestionType,
     QuestionRound,
     GameSession,
+    SessionEvent,
     SessionTeam,
     SessionRound,
     TeamAnswer,
 )
+from quiz import answer_drafts, session_cache, session_content, standings
+from quiz.session_api import _authenticate_admin, _authenticate_team
 from quiz.tests.test_utils import create_verified_user
 
 
@@ -308,6 +317,367 @@ class GetSessionStateAPITest(TestCase):
         self.assertIsNone(ans2["image_url"])
 
 
+class SessionStateVersionAPITest(TestCase):
+    """Test conditional polling of get_session_state via the state version"""
+
+    def setUp(self):
+        self.client = Client()
+        self.game = Game.objects.create(subtitle="Test Game")
+        self.session = GameSession.objects.create(game=self.game, admin_name="Host")
+        self.url = reverse("quiz:session_state", args=[self.session.code])
+
+    def test_state_includes_version_and_etag(self):
+        """Test that a full state response carries the version as its ETag"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["version"], 0)
+        self.assertEqual(response["ETag"], '"v0"')
+
+    def test_if_none_match_returns_304(self):
+        """Test that an unchanged state answers 304 without a body"""
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_unchanged_poll_skips_payload_queries(self):
+        """Test that a 304 is answered from the cache without touching the DB"""
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(0):
+            self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_cold_304_skips_payload_build(self):
+        """Test that a cache miss with a matching ETag costs only the session lookup"""
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH='"v0"')
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_repeat_poll_served_from_snapshot(self):
+        """Test that the full payload is built once per state version"""
+        first = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.json(), first.json())
+
+    def test_state_change_drops_snapshot(self):
+        """Test that a version bump rebuilds the payload on the next poll"""
+        self.client.get(self.url)
+        self.session.status = GameSession.Status.PLAYING
+        self.session.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.json()["status"], GameSession.Status.PLAYING)
+        self.assertEqual(response.json()["version"], 1)
+
+    def test_since_version_no_change(self):
+        """Test the since_version short-circuit response"""
+        response = self.client.get(self.url, {"since_version": 0})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(), {"changed": False, "version": 0, "next_poll_ms": 3000}
+        )
+
+    def test_poll_hint(self):
+        """Test that responses say when to poll next, 304s via Retry-After"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.json()["next_poll_ms"], 3000)
+        not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(not_modified["Retry-After"], "3")
+
+    def test_poll_hint_backs_off_while_idle(self):
+        """Test that a lobby nobody has touched for a minute is polled slowly"""
+        etag = self.client.get(self.url)["ETag"]
+
+        with patch("quiz.poll_intervals.time.time", return_value=time.time() + 60):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response["Retry-After"], "10")
+
+    def test_team_join_changes_etag(self):
+        """Test that joining a team invalidates the previous ETag"""
+        etag = self.client.get(self.url)["ETag"]
+
+        self.client.post(
+            reverse("quiz:session_join", args=[self.session.code]),
+            data=json.dumps({"team_name": "Team A"}),
+            content_type="application/json",
+        )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["team_count"], 1)
+
+    def test_answer_submission_bumps_only_on_answered_change(self):
+        """Test that autosaves of a non-empty answer do not bump the version"""
+        round_ = QuestionRound.objects.create(name="Round 1", round_number=1)
+        q_type = QuestionType.objects.create(name="Multiple Choice")
+        question = Question.objects.create(
+            game=self.game,
+            question_type=q_type,
+            game_round=round_,
+            text="Q1",
+            question_number=1,
+        )
+        SessionRound.objects.create(
+            session=self.session, round=round_, status=SessionRound.Status.ACTIVE
+        )
+        team = SessionTeam.objects.create(session=self.session, name="Team A")
+        submit_url = reverse("quiz:session_team_answer", args=[self.session.code])
+
+        def submit(text):
+            self.client.post(
+                submit_url,
+                data=json.dumps({"question_id": question.id, "answer_text": text}),
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"Bearer {team.token}",
+            )
+            self.session.refresh_from_db()
+            return self.session.state_version
+
+        self.session.refresh_from_db()
+        start = self.session.state_version
+
+        self.assertEqual(submit("Par"), start + 1)
+        self.assertEqual(submit("Paris"), start + 1)
+        self.assertEqual(submit(""), start + 2)
+
+
+class SessionEventsAPITest(TestCase):
+    """Test the get_session_events delta-sync endpoint"""
+
+    def setUp(self):
+        self.client = Client()
+        self.game = Game.objects.create(subtitle="Test Game")
+        self.session = GameSession.objects.create(game=self.game, admin_name="Host")
+        self.url = reverse("quiz:session_events", args=[self.session.code])
+
+    def _join(self, name):
+        return self.client.post(
+            reverse("quiz:session_join", args=[self.session.code]),
+            data=json.dumps({"team_name": name}),
+            content_type="application/json",
+        ).json()
+
+    def test_join_is_logged(self):
+        """Test that a team join appends a team_joined event"""
+        team = self._join("Team A")
+
+        data = self.client.get(self.url).json()
+
+        self.assertEqual(len(data["events"]), 1)
+        event = data["events"][0]
+        self.assertEqual(event["seq"], 1)
+        self.assertEqual(event["kind"], SessionEvent.Kind.TEAM_JOINED)
+        self.assertEqual(event["payload"]["team_id"], team["team_id"])
+        self.assertEqual(data["last_seq"], 1)
+        self.assertFalse(data["has_more"])
+
+    def test_after_returns_only_missed_events(self):
+        """Test that ?after= skips events the client already applied"""
+        self._join("Team A")
+        self._join("Team B")
+        self._join("Team C")
+
+        data = self.client.get(self.url, {"after": 1}).json()
+
+        self.assertEqual([e["seq"] for e in data["events"]], [2, 3])
+        self.assertEqual(data["last_seq"], 3)
+
+    def test_no_new_events_echoes_after(self):
+        """Test an up-to-date client gets an empty page"""
+        data = self.client.get(self.url, {"after": 5}).json()
+
+        self.assertEqual(data["events"], [])
+        self.assertEqual(data["last_seq"], 5)
+
+    def test_invalid_after(self):
+        """Test a non-integer after parameter is rejected"""
+        response = self.client.get(self.url, {"after": "abc"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_answer_events_do_not_leak_answer_text(self):
+        """Test answer_submitted events carry status only, not the answer"""
+        round_ = QuestionRound.objects.create(name="Round 1", round_number=1)
+        q_type = QuestionType.objects.create(name="Multiple Choice")
+        question = Question.objects.create(
+            game=self.game,
+            question_type=q_type,
+            game_round=round_,
+            text="Q1",
+            question_number=1,
+        )
+        SessionRound.objects.create(
+            session=self.session, round=round_, status=SessionRound.Status.ACTIVE
+        )
+        team = SessionTeam.objects.create(session=self.session, name="Team A")
+
+        def submit(text):
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.post(
+                    reverse("quiz:session_team_answer", args=[self.session.code]),
+                    data=json.dumps({"question_id": question.id, "answer_text": text}),
+                    content_type="application/json",
+                    HTTP_AUTHORIZATION=f"Bearer {team.token}",
+                )
+            return [
+                q["sql"]
+                for q in ctx.captured_queries
+                if q["sql"].startswith("UPDATE quiz_gamesession")
+            ]
+
+        self.assertEqual(len(submit("Par")), 1)
+        # An edit of non-empty text is neither an event nor a session write.
+        self.assertEqual(submit("Paris"), [])
+
+        events = self.client.get(self.url).json()["events"]
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["kind"], SessionEvent.Kind.ANSWER_SUBMITTED)
+        self.assertEqual(
+            events[0]["payload"],
+            {"team_id": team.id, "question_id": question.id, "has_answer": True},
+        )
+
+    def test_state_snapshot_carries_event_seq(self):
+        """Test the state payload tells clients where to resume deltas from"""
+        self._join("Team A")
+
+        state = self.client.get(
+            reverse("quiz:session_state", args=[self.session.code])
+        ).json()
+
+        self.assertEqual(state["event_seq"], 1)
+
+
+class SessionEventStreamAPITest(TestCase):
+    """Test the session_event_stream SSE endpoint"""
+
+    def setUp(self):
+        self.game = Game.objects.create(subtitle="Test Game")
+        self.session = GameSession.objects.create(game=self.game, admin_name="Host")
+        self.url = reverse("quiz:session_stream", args=[self.session.code])
+
+    @override_settings(SESSION_EVENT_STREAM_ENABLED=False)
+    async def test_stream_disabled_returns_404(self):
+        """Test that the stream is refused unless enabled for ASGI deployments"""
+        response = await AsyncClient().get(self.url)
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(SESSION_EVENT_STREAM_ENABLED=True)
+    async def test_stream_unknown_session_returns_404(self):
+        """Test streaming a session code that does not exist"""
+        url = reverse("quiz:session_stream", args=["NOPE00"])
+        response = await AsyncClient().get(url)
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(SESSION_EVENT_STREAM_ENABLED=True)
+    async def test_stream_sends_state_on_connect(self):
+        """Test that the first event carries the full state payload"""
+        response = await AsyncClient().get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        chunks = aiter(response.streaming_content)
+        self.assertIn(b"retry:", await anext(chunks))
+        event = (await anext(chunks)).decode()
+        await chunks.aclose()
+
+        self.assertTrue(event.startswith("id: 0\nevent: state\n"))
+        data = json.loads(event.split("data: ", 1)[1])
+        self.assertEqual(data["status"], "lobby")
+        self.assertEqual(data["game_name"], self.game.name)
+
+    @override_settings(SESSION_EVENT_STREAM_ENABLED=True)
+    async def test_stream_closes_after_completed_state(self):
+        """Test that a completed session gets one final event and the stream ends"""
+        self.session.status = GameSession.Status.COMPLETED
+        await self.session.asave()
+
+        response = await AsyncClient().get(self.url)
+        chunks = [chunk async for chunk in response.streaming_content]
+
+        self.assertEqual(len(chunks), 2)
+        self.assertIn(b'"status": "completed"', chunks[1])
+
+
+class TokenAuthCacheTest(TestCase):
+    """Test cached token resolution behind the session API decorators"""
+
+    def setUp(self):
+        cache.clear()
+        self.round = QuestionRound.objects.create(name="Round 1", round_number=1)
+        self.game = Game.objects.create(subtitle="Test Game")
+        self.session = GameSession.objects.create(
+            game=self.game,
+            admin_name="Host",
+            status=GameSession.Status.PLAYING,
+            current_round=self.round,
+        )
+        SessionRound.objects.create(
+            session=self.session, round=self.round, status=SessionRound.Status.ACTIVE
+        )
+        self.team = SessionTeam.objects.create(session=self.session, name="Team A")
+
+    def test_team_context_loads_in_one_query(self):
+        """Test that team, session, game and round come back in one query"""
+        _authenticate_team(self.session.code, self.team.token)
+
+        with self.assertNumQueries(1):
+            team = _authenticate_team(self.session.code, self.team.token)
+            self.assertEqual(team.session.game.id, self.game.id)
+            self.assertEqual(team.session.current_round.id, self.round.id)
+
+    def test_cached_token_is_bound_to_its_session(self):
+        """Test that a cached team token is not accepted for another session"""
+        other = GameSession.objects.create(game=self.game, admin_name="Other")
+        _authenticate_team(self.session.code, self.team.token)
+
+        self.assertIsNone(_authenticate_team(other.code, self.team.token))
+
+    def test_removed_team_token_rejected(self):
+        """Test that deleting a team drops its cached token"""
+        url = reverse("quiz:session_team_answers", args=[self.session.code])
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {self.team.token}"}
+        self.assertEqual(self.client.get(url, **headers).status_code, 200)
+
+        self.team.delete()
+
+        self.assertEqual(self.client.get(url, **headers).status_code, 403)
+        self.assertIsNone(
+            session_cache.resolve_token(self.session.code, self.team.token)
+        )
+
+    def test_bad_admin_token_not_cached(self):
+        """Test that a wrong admin token is rejected and never remembered"""
+        session, status = _authenticate_admin(self.session.code, "wrong")
+
+        self.assertIsNone(session)
+        self.assertEqual(status, 403)
+        self.assertIsNone(session_cache.resolve_token(self.session.code, "wrong"))
+
+    def test_completion_forgets_tokens(self):
+        """Test that ending a session drops cached resolutions for it"""
+        _authenticate_admin(self.session.code, self.session.admin_token)
+        _authenticate_team(self.session.code, self.team.token)
+
+        session_cache.forget_session_tokens(self.session)
+
+        for token in (self.session.admin_token, self.team.token):
+            self.assertIsNone(session_cache.resolve_token(self.session.code, token))
+
+
 class AdminStartGameAPITest(TestCase):
     """Test the admin_start_game endpoint"""
 
@@ -661,6 +1031,132 @@ class AdminScoreAnswerAPITest(TestCase):
         self.assertEqual(response.status_code, 400)
 
 
+class AdminScoreBatchAPITest(TestCase):
+    """Test the admin_score_batch endpoint"""
+
+    def setUp(self):
+        self.client = Client()
+        self.game = Game.objects.create(subtitle="Test Game")
+        self.session = GameSession.objects.create(
+            game=self.game, admin_name="Host", status=GameSession.Status.SCORING
+        )
+        self.round = QuestionRound.objects.create(name="Round 1", round_number=1)
+        self.q_type = QuestionType.objects.create(name="Multiple Choice")
+        self.question = Question.objects.create(
+            game=self.game,
+            question_type=self.q_type,
+            game_round=self.round,
+            text="Q1",
+            question_number=1,
+            total_points=10,
+        )
+        self.session_round = SessionRound.objects.create(
+            session=self.session, round=self.round, status=SessionRound.Status.LOCKED
+        )
+        self.teams = [
+            SessionTeam.objects.create(session=self.session, name=f"Team {i}")
+            for i in range(4)
+        ]
+        self.answers = [
+            TeamAnswer.objects.create(
+                team=team,
+                question=self.question,
+                session_round=self.session_round,
+                answer_text="Answer",
+                is_locked=True,
+            )
+            for team in self.teams
+        ]
+        self.url = reverse("quiz:session_admin_score_batch", args=[self.session.code])
+
+    def post(self, scores):
+        return self.client.post(
+            self.url,
+            data=json.dumps({"scores": scores}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {self.session.admin_token}",
+        )
+
+    def test_mark_all_correct_in_one_request(self):
+        """Test scoring every team's answer to a question at once"""
+        response = self.post(
+            [{"team_answer_id": a.id, "points": 10} for a in self.answers]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data["results"]), 4)
+        self.assertEqual(data["results"][0]["question_total"], 10)
+        for team in self.teams:
+            team.refresh_from_db()
+            self.assertEqual(team.score, 10)
+            self.assertEqual(data["team_scores"][str(team.id)], 10)
+        self.assertEqual(
+            self.session.events.filter(kind=SessionEvent.Kind.ANSWER_SCORED).count(), 4
+        )
+
+    def test_query_count_independent_of_batch_size(self):
+        """Test that a bigger batch does not cost more queries"""
+        scores = [{"team_answer_id": a.id, "points": 5} for a in self.answers]
+        self.post(scores[:1])  # warm the token cache
+
+        with CaptureQueriesContext(connection) as one:
+            self.post([{"team_answer_id": self.answers[0].id, "points": 4}])
+        with CaptureQueriesContext(connection) as four:
+            self.post(scores)
+
+        self.assertEqual(len(one.captured_queries), len(four.captured_queries))
+
+    def test_team_and_question_creates_missing_answer(self):
+        """Test that (team_id, question_id) scores a team with no answer row"""
+        self.answers[0].delete()
+
+        response = self.post(
+            [
+                {
+                    "team_id": str(self.teams[0].id),
+                    "question_id": self.question.id,
+                    "points": 3,
+                }
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        answer = TeamAnswer.objects.get(team=self.teams[0], question=self.question)
+        self.assertTrue(answer.is_locked)
+        self.assertEqual(answer.points_awarded, 3)
+
+    def test_invalid_item_rejects_whole_batch(self):
+        """Test that one over-max item leaves every answer unscored"""
+        response = self.post(
+            [
+                {"team_answer_id": self.answers[0].id, "points": 10},
+                {"team_answer_id": self.answers[1].id, "points": 11},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("scores[1]", response.json()["error"])
+        self.answers[0].refresh_from_db()
+        self.assertIsNone(self.answers[0].points_awarded)
+
+    def test_answer_from_other_session_not_found(self):
+        """Test that answers are looked up within the session only"""
+        other = GameSession.objects.create(game=self.game, admin_name="Other")
+        other_team = SessionTeam.objects.create(session=other, name="Other")
+        foreign = TeamAnswer.objects.create(
+            team=other_team, question=self.question, session_round=self.session_round
+        )
+
+        response = self.post([{"team_answer_id": foreign.id, "points": 1}])
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_empty_batch_rejected(self):
+        """Test that scores must be a non-empty list"""
+        self.assertEqual(self.post([]).status_code, 400)
+
+
 class TeamSubmitAnswerAPITest(TestCase):
     """Test the team_submit_answer endpoint"""
 
@@ -746,6 +1242,54 @@ class TeamSubmitAnswerAPITest(TestCase):
         )
 
         self.assertEqual(response.status_code, 400)
+        answer = TeamAnswer.objects.get(team=self.team, question=self.question)
+        self.assertEqual(answer.answer_text, "Answer")
+
+    def test_autosave_is_one_answer_statement(self):
+        """Test that insert and update each touch TeamAnswer once"""
+        url = reverse("quiz:session_team_answer", args=[self.session.code])
+
+        for text in ("First", "Second"):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.post(
+                    url,
+                    data=json.dumps(
+                        {"question_id": self.question.id, "answer_text": text}
+                    ),
+                    content_type="application/json",
+                    HTTP_AUTHORIZATION=f"Bearer {self.team.token}",
+                )
+            self.assertEqual(response.status_code, 200)
+            answer_queries = [
+                q for q in ctx.captured_queries if "quiz_teamanswer" in q["sql"]
+            ]
+            self.assertEqual(len(answer_queries), 1)
+
+        answer = TeamAnswer.objects.get(team=self.team, question=self.question)
+        self.assertEqual(answer.answer_text, "Second")
+        self.assertEqual(answer.session_round, self.session_round)
+        self.assertGreater(answer.updated_at, answer.submitted_at)
+
+    def test_non_string_answer_rejected(self):
+        """Test that a list or object answer_text is a 400, not a DB error"""
+        url = reverse("quiz:session_team_answer", args=[self.session.code])
+
+        for draft in (False, True):
+            response = self.client.post(
+                url,
+                data=json.dumps(
+                    {
+                        "question_id": self.question.id,
+                        "answer_text": ["a", "b"],
+                        "draft": draft,
+                    }
+                ),
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"Bearer {self.team.token}",
+            )
+            self.assertEqual(response.status_code, 400)
+
+        self.assertFalse(TeamAnswer.objects.filter(team=self.team).exists())
 
     def test_submit_answer_no_token(self):
         """Test submitting answer without team token"""
@@ -759,6 +1303,358 @@ class TeamSubmitAnswerAPITest(TestCase):
         self.assertEqual(response.status_code, 403)
 
 
+class TeamSubmitAnswersBatchAPITest(TestCase):
+    """Test the team_submit_answers_batch endpoint"""
+
+    def setUp(self):
+        cache.clear()
+        self.game = Game.objects.create(subtitle="Test Game")
+        self.session = GameSession.objects.create(
+            game=self.game, admin_name="Host", status=GameSession.Status.PLAYING
+        )
+        self.round = QuestionRound.objects.create(name="Round 1", round_number=1)
+        q_type = QuestionType.objects.create(name="Multiple Choice")
+        self.questions = [
+            Question.objects.create(
+                game=self.game,
+                question_type=q_type,
+                game_round=self.round,
+                text=f"Q{number}",
+                question_number=number,
+            )
+            for number in (1, 2, 3)
+        ]
+        self.session_round = SessionRound.objects.create(
+            session=self.session, round=self.round, status=SessionRound.Status.ACTIVE
+        )
+        session_content.store(self.session)
+        self.team = SessionTeam.objects.create(session=self.session, name="Team A")
+        self.url = reverse("quiz:session_team_answers_batch", args=[self.session.code])
+
+    def post(self, batch_id, answers):
+        # The applied marker is written when the request's answers commit
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                self.url,
+                data=json.dumps({"batch_id": batch_id, "answers": answers}),
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"Bearer {self.team.token}",
+            )
+
+    def texts(self):
+        return dict(
+            TeamAnswer.objects.filter(team=self.team).values_list(
+                "question_id", "answer_text"
+            )
+        )
+
+    def test_batch_saves_all_answers(self):
+        """Test that every queued answer is saved, last text per question winning"""
+        q1, q2, _ = self.questions
+
+        response = self.post(
+            "b1",
+            [
+                {"question_id": q1.id, "answer_text": "Old"},
+                {"question_id": q2.id, "answer_text": "Rome"},
+                {"question_id": q1.id, "answer_text": "Paris"},
+            ],
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["saved"], [q1.id, q2.id])
+        self.assertEqual(self.texts(), {q1.id: "Paris", q2.id: "Rome"})
+        self.assertEqual(
+            self.session.events.filter(kind=SessionEvent.Kind.ANSWER_SUBMITTED).count(),
+            2,
+        )
+
+    def test_retried_batch_is_not_reapplied(self):
+        """Test that a retried batch is acknowledged without writing"""
+        q1 = self.questions[0]
+        self.post("b1", [{"question_id": q1.id, "answer_text": "Old"}])
+        self.post("b2", [{"question_id": q1.id, "answer_text": "Paris"}])
+
+        response = self.post("b1", [{"question_id": q1.id, "answer_text": "Old"}])
+
+        self.assertEqual(response.json(), {"status": "duplicate", "batch_id": "b1"})
+        self.assertEqual(self.texts(), {q1.id: "Paris"})
+
+    def test_batches_from_two_devices_both_applied(self):
+        """Test that a teammate's batch isn't mistaken for a retry"""
+        q1, q2, _ = self.questions
+        self.post("phone-a-1", [{"question_id": q1.id, "answer_text": "Paris"}])
+
+        response = self.post(
+            "phone-b-1", [{"question_id": q2.id, "answer_text": "Rome"}]
+        )
+
+        self.assertEqual(response.json()["status"], "saved")
+        self.assertEqual(self.texts(), {q1.id: "Paris", q2.id: "Rome"})
+
+    def test_batch_being_applied_gets_conflict(self):
+        """Test that a retry racing the original is told to try again"""
+        q1 = self.questions[0]
+        self.assertTrue(answer_drafts.claim_batch(self.team.id, "b1"))
+
+        response = self.post("b1", [{"question_id": q1.id, "answer_text": "Paris"}])
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(self.texts(), {})
+
+    def test_abandoned_claim_lapses(self):
+        """Test that a claim whose worker died stops blocking retries"""
+        q1 = self.questions[0]
+        self.assertTrue(answer_drafts.claim_batch(self.team.id, "b1"))
+
+        later = time.time() + answer_drafts.BATCH_CLAIM_TIMEOUT + 1
+        with patch("time.time", return_value=later):
+            response = self.post("b1", [{"question_id": q1.id, "answer_text": "Paris"}])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.texts(), {q1.id: "Paris"})
+
+    def test_uncommitted_batch_is_not_marked_applied(self):
+        """Test that the applied marker waits for the answers to commit"""
+        q1 = self.questions[0]
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.post(
+                self.url,
+                data=json.dumps(
+                    {
+                        "batch_id": "b1",
+                        "answers": [{"question_id": q1.id, "answer_text": "Paris"}],
+                    }
+                ),
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"Bearer {self.team.token}",
+            )
+
+        self.assertFalse(answer_drafts.batch_applied(self.team.id, "b1"))
+        for callback in callbacks:
+            callback()
+        self.assertTrue(answer_drafts.batch_applied(self.team.id, "b1"))
+
+    def test_rejected_batch_can_be_retried(self):
+        """Test that a batch that wasn't applied doesn't keep its claim"""
+        q1 = self.questions[0]
+        SessionRound.objects.filter(id=self.session_round.id).update(
+            status=SessionRound.Status.LOCKED
+        )
+        self.assertEqual(
+            self.post(
+                "b1", [{"question_id": q1.id, "answer_text": "Paris"}]
+            ).status_code,
+            400,
+        )
+        SessionRound.objects.filter(id=self.session_round.id).update(
+            status=SessionRound.Status.ACTIVE
+        )
+
+        response = self.post("b1", [{"question_id": q1.id, "answer_text": "Paris"}])
+
+        self.assertEqual(response.json()["status"], "saved")
+        self.assertEqual(self.texts(), {q1.id: "Paris"})
+
+    def test_missing_batch_id_rejected(self):
+        response = self.post(
+            None, [{"question_id": self.questions[0].id, "answer_text": "Paris"}]
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_item_rejects_batch(self):
+        """Test that one bad item rejects the whole batch with its index"""
+        response = self.post(
+            "b1",
+            [
+                {"question_id": self.questions[0].id, "answer_text": "Paris"},
+                {"question_id": 999999, "answer_text": "Rome"},
+            ],
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("answers[1]", response.json()["error"])
+        self.assertEqual(self.texts(), {})
+
+    def test_non_string_answer_rejects_batch(self):
+        """Test that a non-string answer_text is a 400 naming the item"""
+        response = self.post(
+            "b1", [{"question_id": self.questions[0].id, "answer_text": {"a": 1}}]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("answers[0]", response.json()["error"])
+        self.assertEqual(self.texts(), {})
+
+    def test_inactive_round_rejects_batch(self):
+        """Test that answers can't be queued into a locked round"""
+        SessionRound.objects.filter(id=self.session_round.id).update(
+            status=SessionRound.Status.LOCKED
+        )
+
+        response = self.post(
+            "b1", [{"question_id": self.questions[0].id, "answer_text": "Paris"}]
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_locked_answer_skipped(self):
+        """Test that an already locked answer is reported, not overwritten"""
+        q1, q2, _ = self.questions
+        TeamAnswer.objects.create(
+            team=self.team,
+            question=q1,
+            session_round=self.session_round,
+            answer_text="Locked",
+            is_locked=True,
+        )
+
+        response = self.post(
+            "b1",
+            [
+                {"question_id": q1.id, "answer_text": "Paris"},
+                {"question_id": q2.id, "answer_text": "Rome"},
+            ],
+        )
+
+        self.assertEqual(response.json()["locked"], [q1.id])
+        self.assertEqual(self.texts(), {q1.id: "Locked", q2.id: "Rome"})
+
+    def test_batch_query_count_is_flat(self):
+        """Test that validation costs the same for one answer or three"""
+
+        def validation_queries(batch_id, questions):
+            with CaptureQueriesContext(connection) as ctx:
+                self.post(
+                    batch_id,
+                    [{"question_id": q.id, "answer_text": "x"} for q in questions],
+                )
+            # Writes vary with what changed: only the new answers move the
+            # state version and are logged.
+            return [
+                q
+                for q in ctx.captured_queries
+                if "quiz_teamanswer" not in q["sql"]
+                and "quiz_sessionevent" not in q["sql"]
+                and not q["sql"].startswith("UPDATE quiz_gamesession")
+            ]
+
+        validation_queries("b1", self.questions[:1])  # heartbeat flush
+        self.assertEqual(
+            len(validation_queries("b2", self.questions[:1])),
+            len(validation_queries("b3", self.questions)),
+        )
+
+
+class TeamGetAnswersAPITest(TestCase):
+    """Test the team_get_answers endpoint"""
+
+    def setUp(self):
+        cache.clear()
+        self.game = Game.objects.create(subtitle="Test Game")
+        self.round = QuestionRound.objects.create(name="Round 1", round_number=1)
+        self.q_type = QuestionType.objects.create(name="Multiple Open Ended")
+        self.session = GameSession.objects.create(
+            game=self.game,
+            admin_name="Host",
+            status=GameSession.Status.PLAYING,
+            current_round=self.round,
+        )
+        self.session_round = SessionRound.objects.create(
+            session=self.session, round=self.round, status=SessionRound.Status.ACTIVE
+        )
+        self.team = SessionTeam.objects.create(session=self.session, name="Team A")
+        self.url = reverse("quiz:session_team_answers", args=[self.session.code])
+        self.headers = {"HTTP_AUTHORIZATION": f"Bearer {self.team.token}"}
+        self.questions = []
+        self.add_questions(2)
+
+    def add_questions(self, count):
+        for _ in range(count):
+            number = len(self.questions) + 1
+            question = Question.objects.create(
+                game=self.game,
+                question_type=self.q_type,
+                game_round=self.round,
+                text=f"Q{number}",
+                question_number=number,
+                total_points=2,
+            )
+            parts = [
+                Answer.objects.create(
+                    question=question, text=f"A{i}", display_order=i, points=1
+                )
+                for i in (2, 1)
+            ]
+            for part, text in zip(parts, ["second", "first"]):
+                TeamAnswer.objects.create(
+                    team=self.team,
+                    question=question,
+                    answer_part=part,
+                    session_round=self.session_round,
+                    answer_text=text,
+                    points_awarded=1,
+                )
+            self.questions.append(question)
+
+    def get(self, **params):
+        return self.client.get(self.url, params, **self.headers)
+
+    def test_parts_combined_in_display_order(self):
+        """Test that per-part answers come back as one ordered JSON array"""
+        data = self.get().json()
+
+        self.assertEqual(len(data["answers"]), 2)
+        self.assertEqual(
+            json.loads(data["answers"][0]["answer_text"]), ["first", "second"]
+        )
+        self.assertEqual(data["answers"][0]["points_awarded"], 2)
+
+    def test_query_count_independent_of_question_count(self):
+        """Test that more questions in the round cost no extra queries"""
+        self.get()  # warm the token cache
+
+        with CaptureQueriesContext(connection) as two:
+            self.get()
+        self.add_questions(4)
+        session_content.store(self.session)  # the snapshot is frozen otherwise
+        with CaptureQueriesContext(connection) as six:
+            response = self.get()
+
+        self.assertEqual(len(response.json()["answers"]), 6)
+        self.assertEqual(len(two.captured_queries), len(six.captured_queries))
+
+    def test_since_returns_only_changed_questions(self):
+        """Test that ?since= skips questions whose answers have not changed"""
+        last_updated = self.get().json()["last_updated"]
+        part = TeamAnswer.objects.filter(question=self.questions[1]).first()
+        part.answer_text = "changed"
+        part.save()
+
+        data = self.get(since=last_updated).json()
+
+        self.assertEqual(
+            [a["question_id"] for a in data["answers"]], [self.questions[1].id]
+        )
+        self.assertIn("changed", data["answers"][0]["answer_text"])
+        self.assertGreater(data["last_updated"], last_updated)
+
+    def test_since_with_no_changes_is_empty(self):
+        """Test that polling with the latest last_updated returns nothing"""
+        last_updated = self.get().json()["last_updated"]
+
+        data = self.get(since=last_updated).json()
+
+        self.assertEqual(data["answers"], [])
+        self.assertEqual(data["last_updated"], last_updated)
+
+    def test_invalid_since_rejected(self):
+        """Test that an unparseable since value is a 400"""
+        self.assertEqual(self.get(since="yesterday").status_code, 400)
+
+
 class TeamGetResultsAPITest(TestCase):
     """Test the team_get_results endpoint"""
 
@@ -788,6 +1684,49 @@ class TeamGetResultsAPITest(TestCase):
         self.assertEqual(data["total_teams"], 2)
         self.assertEqual(len(data["standings"]), 2)
 
+    def test_results_query_count_independent_of_rounds(self):
+        """Test that results cost the same however many rounds are scored"""
+        url = reverse("quiz:session_team_results", args=[self.session.code])
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {self.team1.token}"}
+        self.client.get(url, **headers)  # warm the token cache
+
+        with CaptureQueriesContext(connection) as none_scored:
+            self.client.get(url, **headers)
+        for number in (1, 2, 3):
+            session_round = SessionRound.objects.create(
+                session=self.session,
+                round=QuestionRound.objects.create(
+                    name=f"Round {number}", round_number=number
+                ),
+                status=SessionRound.Status.SCORED,
+            )
+            standings.freeze_round(session_round)
+        with CaptureQueriesContext(connection) as three_scored:
+            response = self.client.get(url, **headers)
+
+        self.assertEqual(len(response.json()["rounds"]), 3)
+        self.assertEqual(
+            len(none_scored.captured_queries), len(three_scored.captured_queries)
+        )
+
+    def test_round_without_score_row_listed_with_zero(self):
+        """Test that a team joining after a round froze still sees it, at 0"""
+        session_round = SessionRound.objects.create(
+            session=self.session,
+            round=QuestionRound.objects.create(name="Round 1", round_number=1),
+            status=SessionRound.Status.SCORED,
+        )
+        standings.freeze_round(session_round)
+        late = SessionTeam.objects.create(session=self.session, name="Team C")
+        url = reverse("quiz:session_team_results", args=[self.session.code])
+
+        response = self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {late.token}")
+
+        self.assertEqual(
+            response.json()["rounds"],
+            [{"round_number": 1, "round_name": "Round 1", "score": 0}],
+        )
+
 
 class PerPartScoringTest(TestCase):
     """Tests for per-part scoring of multi-part questions"""
@@ -1130,6 +2069,24 @@ class PerPartScoringTest(TestCase):
         self.assertIn("points_awarded", part1)
         self.assertIn("max_points", part1)
 
+    def test_get_scoring_data_query_budget(self):
+        """Test that scoring data runs a fixed number of queries for any team count"""
+        for i in range(2, 6):
+            SessionTeam.objects.create(session=self.session, name=f"Team {i}")
+        lock_url = reverse("quiz:session_admin_lock", args=[self.session.code])
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {self.session.admin_token}"}
+        self.client.post(lock_url, content_type="application/json", **headers)
+        url = reverse("quiz:session_admin_scoring", args=[self.session.code])
+        session_content.store(self.session)  # as create_session does
+
+        # session (auth), teams, team answers; questions come from the snapshot
+        with self.assertNumQueries(3):
+            response = self.client.get(url, **headers)
+
+        self.assertEqual(response.status_code, 200)
+        for question in response.json()["questions"]:
+            self.assertEqual(len(question["team_answers"]), 5)
+
     def test_score_per_part_answer(self):
         """Test scoring an individual part of a multi-part question"""
         # Submit and lock round
@@ -1436,6 +2393,7 @@ class LeaderboardAPITest(TestCase):
             answer_text="Answer 2",
             points_awarded=2,
         )
+        standings.freeze_round(self.session_round1)  # as complete_round does
 
         self.session.status = GameSession.Status.LEADERBOARD
         self.session.current_round = self.round1
@@ -1485,6 +2443,46 @@ class LeaderboardAPITest(TestCase):
         self.assertEqual(data["points_remaining"], 15)
         self.assertFalse(data["is_final_round"])
 
+    def test_leaderboard_ties_share_rank(self):
+        """Test that teams on equal scores get the same rank"""
+        SessionTeam.objects.filter(id=self.team2.id).update(score=8)
+        team3 = SessionTeam.objects.create(session=self.session, name="Gamma")
+        self.session_round1.status = SessionRound.Status.SCORED
+        self.session_round1.save()
+        standings.freeze_round(self.session_round1)
+
+        url = reverse("quiz:session_leaderboard", args=[self.session.code])
+        data = self.client.get(url).json()
+
+        ranks = {t["team_name"]: t["rank"] for t in data["leaderboard"]}
+        self.assertEqual(ranks, {"Team Alpha": 1, "Team Beta": 1, team3.name: 3})
+
+    def test_leaderboard_points_come_from_snapshot(self):
+        """Test that round points edited mid-game don't change the leaderboard"""
+        session_content.store(self.session)
+        Question.objects.filter(id=self.q3.id).update(total_points=20)
+
+        url = reverse("quiz:session_leaderboard", args=[self.session.code])
+        data = self.client.get(url).json()
+
+        self.assertEqual(data["upcoming_rounds"][1]["available_points"], 15)
+        self.assertEqual(data["total_game_points"], 25)
+
+    def test_leaderboard_query_count_is_constant(self):
+        """Test that the leaderboard costs the same for any number of teams/rounds"""
+        for sr in (self.session_round1, self.session_round2):
+            sr.status = SessionRound.Status.SCORED
+            sr.save()
+            standings.freeze_round(sr)
+        for i in range(5):
+            SessionTeam.objects.create(session=self.session, name=f"Extra {i}")
+        url = reverse("quiz:session_leaderboard", args=[self.session.code])
+
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.json()["leaderboard"]), 7)
+
     def test_get_leaderboard_data_final_round(self):
         """Test leaderboard data when all rounds are complete"""
         # Score both rounds
@@ -0,0 +1,172 @@
+"""
+Tests for the async variants of the polled session endpoints
+(SESSION_ASYNC_VIEWS). Each must answer exactly like its sync view.
+"""
+
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import Http404
+from django.test import AsyncRequestFactory, RequestFactory, TestCase
+
+from quiz import session_api, session_cache, session_content
+from quiz.models import (
+    Answer,
+    Game,
+    GameSession,
+    Question,
+    QuestionRound,
+    QuestionType,
+    SessionRound,
+    SessionTeam,
+    TeamAnswer,
+)
+
+
+class AsyncPollViewsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        game = Game.objects.create(subtitle="Test Game")
+        self.round = QuestionRound.objects.create(name="Round 1", round_number=1)
+        upcoming = QuestionRound.objects.create(name="Round 2", round_number=2)
+        q_type = QuestionType.objects.create(name="Multiple Open Ended")
+        self.question = Question.objects.create(
+            game=game,
+            question_type=q_type,
+            game_round=self.round,
+            text="Name two capitals",
+            question_number=1,
+            total_points=2,
+        )
+        parts = [
+            Answer.objects.create(
+                question=self.question,
+                text=f"Part {i}",
+                answer_text=city,
+                display_order=i,
+                points=1,
+            )
+            for i, city in ((1, "Paris"), (2, "Rome"))
+        ]
+        self.later_question = Question.objects.create(
+            game=game,
+            question_type=q_type,
+            game_round=upcoming,
+            text="Later",
+            question_number=2,
+        )
+        self.session = GameSession.objects.create(
+            game=game,
+            admin_name="Host",
+            status=GameSession.Status.PLAYING,
+            current_round=self.round,
+        )
+        session_round = SessionRound.objects.create(
+            session=self.session, round=self.round, status=SessionRound.Status.ACTIVE
+        )
+        SessionRound.objects.create(session=self.session, round=upcoming)
+        self.team = SessionTeam.objects.create(
+            session=self.session, name="Team A", score=1
+        )
+        SessionTeam.objects.create(session=self.session, name="Team B")
+        for part, text in zip(parts, ["Paris", "Milan"]):
+            TeamAnswer.objects.create(
+                team=self.team,
+                question=self.question,
+                answer_part=part,
+                session_round=session_round,
+                answer_text=text,
+            )
+        session_content.store(self.session)
+
+    async def sync_get(self, view, path="/", **headers):
+        """The sync view's response, the way a WSGI worker would serve it."""
+        request = RequestFactory().get(path, headers=headers)
+        return await sync_to_async(view)(request, self.session.code)
+
+    async def async_get(self, view, path="/", **headers):
+        request = AsyncRequestFactory().get(path, headers=headers)
+        return await view(request, self.session.code)
+
+    def team_headers(self):
+        return {"Authorization": f"Bearer {self.team.token}"}
+
+    async def test_state_matches_sync(self):
+        """Test that the async poll serves the same snapshot and ETag"""
+        expected = await self.sync_get(session_api.get_session_state)
+        response = await self.async_get(session_api.aget_session_state)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["ETag"], expected["ETag"])
+        self.assertEqual(json.loads(response.content), json.loads(expected.content))
+
+    async def test_state_built_on_cache_miss(self):
+        response = await self.async_get(session_api.aget_session_state)
+
+        self.assertEqual(json.loads(response.content)["status"], "playing")
+        self.assertIsNotNone(await session_cache.aget_state(self.session.code))
+
+    async def test_state_not_modified(self):
+        response = await self.async_get(session_api.aget_session_state)
+
+        again = await self.async_get(
+            session_api.aget_session_state, If_None_Match=response["ETag"]
+        )
+
+        self.assertEqual(again.status_code, 304)
+
+    async def test_unknown_session(self):
+        request = AsyncRequestFactory().get("/")
+        with self.assertRaises(Http404):
+            await session_api.aget_session_state(request, "NOPE00")
+
+    async def test_leaderboard_matches_sync(self):
+        expected = await self.sync_get(session_api.get_leaderboard_data)
+        response = await self.async_get(session_api.aget_leaderboard_data)
+
+        data = json.loads(response.content)
+        self.assertEqual(data, json.loads(expected.content))
+        self.assertEqual(
+            [team["team_name"] for team in data["leaderboard"]], ["Team A", "Team B"]
+        )
+
+    async def test_team_answers_match_sync(self):
+        expected = await self.sync_get(
+            session_api.team_get_answers, **self.team_headers()
+        )
+        response = await self.async_get(
+            session_api.ateam_get_answers, **self.team_headers()
+        )
+
+        data = json.loads(response.content)
+        self.assertEqual(data, json.loads(expected.content))
+        self.assertEqual(data["answers"][0]["answer_text"], '["Paris", "Milan"]')
+
+    async def test_question_details_match_sync(self):
+        path = f"/?question_id={self.question.id}"
+        expected = await self.sync_get(
+            session_api.team_get_question_details, path, **self.team_headers()
+        )
+        response = await self.async_get(
+            session_api.ateam_get_question_details, path, **self.team_headers()
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), json.loads(expected.content))
+
+    async def test_future_question_not_accessible(self):
+        response = await self.async_get(
+            session_api.ateam_get_question_details,
+            f"/?question_id={self.later_question.id}",
+            **self.team_headers(),
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    async def test_invalid_team_token(self):
+        response = await self.async_get(
+            session_api.ateam_get_answers, Authorization="Bearer wrong"
+        )
+
+        self.assertEqual(response.status_code, 403)
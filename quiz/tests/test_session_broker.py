@@ -0,0 +1,47 @@
+"""
+Unit tests for quiz.session_broker.
+
+The broker is exercised directly with asyncio; publishing happens from a
+worker thread the way a sync view's on_commit callback would.
+"""
+
+import asyncio
+import threading
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from quiz import session_broker
+
+
+class WaitForChangeTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_returns_immediately_when_already_ahead(self):
+        session_broker.publish("AAAA01", 5)
+        version = asyncio.run(session_broker.wait_for_change("AAAA01", 4, timeout=1))
+        self.assertEqual(version, 5)
+
+    def test_times_out_without_change(self):
+        session_broker.publish("AAAA02", 3)
+        version = asyncio.run(session_broker.wait_for_change("AAAA02", 3, timeout=0.05))
+        self.assertIsNone(version)
+
+    def test_publish_from_another_thread_wakes_waiter(self):
+        async def wait_and_publish():
+            waiter = asyncio.create_task(
+                session_broker.wait_for_change("AAAA03", 0, timeout=5)
+            )
+            await asyncio.sleep(0.01)
+            threading.Thread(target=session_broker.publish, args=("AAAA03", 1)).start()
+            return await waiter
+
+        version = asyncio.run(wait_and_publish())
+        self.assertEqual(version, 1)
+        self.assertNotIn("AAAA03", session_broker._waiters)
+
+    def test_published_version_reads_cache(self):
+        self.assertIsNone(session_broker.published_version("AAAA04"))
+        session_broker.publish("AAAA04", 7)
+        self.assertEqual(session_broker.published_version("AAAA04"), 7)
@@ -0,0 +1,108 @@
+"""
+Tests for the per-session content snapshot in quiz.session_content.
+"""
+
+import json
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from quiz import session_content
+from quiz.models import (
+    Answer,
+    Game,
+    GameSession,
+    Question,
+    QuestionRound,
+    QuestionType,
+    SessionRound,
+    SessionTeam,
+)
+from quiz.session_api import _build_session_state
+from quiz.tests.test_utils import create_verified_user
+
+CONTENT_TABLES = ("quiz_question", "quiz_answer", "quiz_category", "quiz_questiontype")
+
+
+class SessionContentTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_verified_user()
+        self.client.login(username="testuser", password="testpass123")
+        self.game = Game.objects.create(subtitle="Test Game", is_public=True)
+        self.round = QuestionRound.objects.create(name="Round 1", round_number=1)
+        self.question = Question.objects.create(
+            game=self.game,
+            question_type=QuestionType.objects.create(name="Ranking"),
+            game_round=self.round,
+            text="Rank these",
+            question_number=1,
+            total_points=2,
+        )
+        for order in (2, 1):
+            Answer.objects.create(
+                question=self.question, text=f"Item {order}", display_order=order
+            )
+
+        response = self.client.post(
+            reverse("quiz:session_create"),
+            data=json.dumps({"game_id": self.game.id, "admin_name": "Host"}),
+            content_type="application/json",
+        )
+        self.session = GameSession.objects.get(code=response.json()["code"])
+
+    def start(self):
+        SessionTeam.objects.create(session=self.session, name="Team A")
+        self.client.post(
+            reverse("quiz:session_admin_start", args=[self.session.code]),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {self.session.admin_token}",
+        )
+
+    def test_create_session_compiles_content(self):
+        """Test that the snapshot holds rounds, ordered answers and scorer flags"""
+        content = self.session.content
+
+        self.assertEqual(content["rounds"][0]["question_ids"], [self.question.id])
+        question = content["questions"][0]
+        self.assertTrue(question["is_multi_part"])
+        self.assertEqual([a["text"] for a in question["answers"]], ["Item 1", "Item 2"])
+
+    def test_state_build_reads_no_content_tables(self):
+        """Test that building the polled state never touches question tables"""
+        self.start()
+        session = GameSession.objects.get(id=self.session.id)
+
+        with CaptureQueriesContext(connection) as ctx:
+            state = _build_session_state(session)
+
+        self.assertEqual(state["current_question"]["text"], "Rank these")
+        for query in ctx.captured_queries:
+            for table in CONTENT_TABLES:
+                self.assertNotIn(f'"{table}"', query["sql"])
+
+    def test_mid_game_edit_does_not_reach_session(self):
+        """Test that editing a question in the admin leaves running sessions alone"""
+        self.start()
+        Question.objects.filter(id=self.question.id).update(text="Edited")
+        cache.clear()  # the row copy on GameSession is the source of truth
+
+        state = self.client.get(
+            reverse("quiz:session_state", args=[self.session.code])
+        ).json()
+
+        self.assertEqual(state["current_question"]["text"], "Rank these")
+
+    def test_session_without_snapshot_compiles_on_first_use(self):
+        """Test that sessions from before snapshots get one lazily"""
+        legacy = GameSession.objects.create(game=self.game, admin_name="Host")
+        SessionRound.objects.create(session=legacy, round=self.round)
+
+        content = session_content.for_session(legacy)
+
+        self.assertEqual(content.question(self.question.id)["text"], "Rank these")
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.content["game_id"], self.game.id)
@@ -7,8 +7,11 @@ seam is one Python module.
 """
 
 import json
+from unittest.mock import patch
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from quiz.models import (
     Answer,
@@ -17,10 +20,13 @@ from quiz.models import (
     Question,
     QuestionRound,
     QuestionType,
+    SessionEvent,
     SessionRound,
     SessionTeam,
     TeamAnswer,
+    TeamRoundScore,
 )
+from quiz import session_content, session_progress, standings
 from quiz.session_director import InvalidTransition, SessionDirector
 
 
@@ -167,6 +173,28 @@ class LifecycleHappyPathTest(TestCase):
         self.assertEqual(self.session.current_round_id, self.rounds[1].id)
         self.assertEqual(result["status"], "next_round")
 
+    def test_transitions_are_logged_in_order(self):
+        self._submit_answers_for_current_round()
+        SessionDirector(self.session).lock_round()
+        self._score_all_answers_in_current_round()
+        SessionDirector(self.session).complete_round()
+        SessionDirector(self.session).show_leaderboard()
+        SessionDirector(self.session).advance()
+
+        kinds = list(self.session.events.values_list("kind", flat=True))
+        self.assertEqual(
+            kinds,
+            [SessionEvent.Kind.GAME_STARTED, SessionEvent.Kind.ROUND_LOCKED]
+            + [SessionEvent.Kind.ANSWER_SCORED] * 4
+            + [
+                SessionEvent.Kind.ROUND_COMPLETED,
+                SessionEvent.Kind.LEADERBOARD_SHOWN,
+                SessionEvent.Kind.ROUND_STARTED,
+            ],
+        )
+        seqs = list(self.session.events.values_list("seq", flat=True))
+        self.assertEqual(seqs, list(range(1, len(kinds) + 1)))
+
     def test_advance_after_final_round_completes_game(self):
         # Round 1
         self._submit_answers_for_current_round()
@@ -187,7 +215,8 @@ class LifecycleHappyPathTest(TestCase):
         self.assertEqual(self.session.status, GameSession.Status.COMPLETED)
         self.assertIsNotNone(self.session.completed_at)
         self.assertEqual(result["status"], "game_complete")
-        self.assertEqual(len(result["standings"]), 2)
+        # Every team scored the same, so they share first place.
+        self.assertEqual([team["rank"] for team in result["standings"]], [1, 1])
 
 
 # ----------------------------------------------------------------------------
@@ -302,6 +331,263 @@ class AcceptsAnswersForRoundTest(TestCase):
         self.assertEqual(reason, "Round not active for answers")
 
 
+# ----------------------------------------------------------------------------
+# lock_round query budget
+# ----------------------------------------------------------------------------
+
+
+class LockRoundQueryCountTest(TestCase):
+    """lock_round runs a fixed number of queries whatever the team count."""
+
+    def _lock_queries(self, num_teams):
+        session, rounds, teams = _build_session(
+            num_rounds=1, questions_per_round=3, num_teams=num_teams
+        )
+        ranking = Question.objects.create(
+            game=session.game,
+            question_type=QuestionType.objects.create(name="Ranking"),
+            question_number=99,
+            text="Rank",
+            total_points=3,
+            game_round=rounds[0],
+        )
+        for i in range(1, 4):
+            Answer.objects.create(
+                question=ranking, display_order=i, correct_rank=i, points=1
+            )
+        SessionDirector(session).start()
+        session.refresh_from_db()
+        sr = session.session_rounds.get(round=rounds[0])
+        # Half the teams answer everything, the rest nothing.
+        for team in teams[::2]:
+            for question in session.game.questions.all():
+                text = json.dumps([1, 3, 2]) if question == ranking else "x"
+                TeamAnswer.objects.create(
+                    team=team, question=question, session_round=sr, answer_text=text
+                )
+
+        with CaptureQueriesContext(connection) as ctx:
+            SessionDirector(session).lock_round()
+
+        parts = TeamAnswer.objects.filter(
+            team=teams[0], question=ranking, answer_part__isnull=False
+        ).order_by("answer_part__display_order")
+        self.assertEqual([p.points_awarded for p in parts], [1, 0, 0])
+        self.assertEqual(
+            TeamAnswer.objects.filter(session_round=sr).count(),
+            num_teams * 3 + num_teams * 3,  # 3 single-answer + 3 ranking parts
+        )
+        return len(ctx.captured_queries)
+
+    def test_query_count_independent_of_team_count(self):
+        self.assertEqual(self._lock_queries(2), self._lock_queries(8))
+
+
+class LockRoundRaceTest(TestCase):
+    """Submits that land while lock_round is running are kept and locked."""
+
+    def setUp(self):
+        self.session, rounds, self.teams = _build_session(
+            num_rounds=1, questions_per_round=1, num_teams=2
+        )
+        SessionDirector(self.session).start()
+        self.session.refresh_from_db()
+        self.question = self.session.game.questions.get()
+        self.session_round = self.session.session_rounds.get()
+        TeamAnswer.objects.create(
+            team=self.teams[0],
+            question=self.question,
+            session_round=self.session_round,
+            answer_text="Paris",
+        )
+
+    def lock_with_submit_during_scoring(self, submit):
+        """lock_round, running `submit` after the round's rows are fetched."""
+        from quiz import session_director
+
+        real = session_director.scorer_for_type
+        pending = [submit]
+
+        class Scorer:
+            def __init__(self, name):
+                self.scorer = real(name)
+
+            def score_submissions(self, *args):
+                if pending:
+                    pending.pop()()
+                return self.scorer.score_submissions(*args)
+
+        with patch.object(session_director, "scorer_for_type", Scorer):
+            SessionDirector(self.session).lock_round()
+
+    def test_edit_after_fetch_is_not_overwritten(self):
+        """Test that lock_round writes only the lock, not the fetched text"""
+        self.lock_with_submit_during_scoring(
+            lambda: TeamAnswer.objects.filter(team=self.teams[0]).update(
+                answer_text="Paris, France"
+            )
+        )
+
+        answer = TeamAnswer.objects.get(team=self.teams[0])
+        self.assertEqual(answer.answer_text, "Paris, France")
+        self.assertTrue(answer.is_locked)
+
+    def test_first_submit_after_fetch_is_locked(self):
+        """Test that a racing first submit takes the placeholder's place"""
+        self.lock_with_submit_during_scoring(
+            lambda: TeamAnswer.objects.create(
+                team=self.teams[1],
+                question=self.question,
+                session_round=self.session_round,
+                answer_text="Rome",
+            )
+        )
+
+        answer = TeamAnswer.objects.get(team=self.teams[1])
+        self.assertEqual(answer.answer_text, "Rome")
+        self.assertTrue(answer.is_locked)
+        self.assertIsNone(answer.points_awarded)
+        self.assertEqual(session_progress.unscored(self.session, [self.question.id]), 2)
+
+    def test_first_multi_part_submit_after_fetch_is_split(self):
+        """Test that a racing multi-part submit is split like the others"""
+        self.question.question_type = QuestionType.objects.create(
+            name="Multiple Open Ended"
+        )
+        self.question.save()
+        parts = [
+            Answer.objects.create(
+                question=self.question, answer_text=city, display_order=i, points=1
+            )
+            for i, city in enumerate(["Paris", "Rome"], start=1)
+        ]
+        session_content.store(self.session)
+
+        self.lock_with_submit_during_scoring(
+            lambda: TeamAnswer.submit_text(
+                self.teams[1].id,
+                self.question.id,
+                self.session_round.id,
+                json.dumps(["Paris", "Rome"]),
+            )
+        )
+
+        rows = TeamAnswer.objects.filter(team=self.teams[1]).order_by(
+            "answer_part__display_order"
+        )
+        self.assertEqual(
+            [(a.answer_part_id, a.answer_text) for a in rows],
+            [(parts[0].id, "Paris"), (parts[1].id, "Rome")],
+        )
+        self.assertTrue(all(a.is_locked and a.points_awarded is None for a in rows))
+        self.assertEqual(session_progress.unscored(self.session, [self.question.id]), 4)
+
+        director = SessionDirector(self.session)
+        for answer in TeamAnswer.objects.filter(question=self.question):
+            director.score_answer(answer, 1)
+        self.assertEqual(director.complete_round()["status"], "reviewing")
+
+
+# ----------------------------------------------------------------------------
+# Running score totals
+# ----------------------------------------------------------------------------
+
+
+class ScoreDeltaTest(TestCase):
+    """score_answer moves team and round totals by the points difference."""
+
+    def setUp(self):
+        self.session, self.rounds, self.teams = _build_session(num_rounds=2)
+        self.team = self.teams[0]
+        self.session_rounds = list(self.session.session_rounds.all())
+        questions = list(self.session.game.questions.order_by("question_number"))
+        self.answers = [
+            TeamAnswer.objects.create(
+                team=self.team,
+                question=question,
+                session_round=self.session_rounds[i // 2],
+                is_locked=True,
+            )
+            for i, question in enumerate(questions)
+        ]
+
+    def _round_points(self, session_round):
+        return TeamRoundScore.objects.get(
+            team=self.team, session_round=session_round
+        ).points
+
+    def test_rescore_applies_difference(self):
+        director = SessionDirector(self.session)
+        director.score_answer(self.answers[0], 7)
+        director.score_answer(self.answers[2], 5)
+        result = director.score_answer(self.answers[0], 4)
+
+        self.assertEqual(result["team_score"], 9)
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.score, 9)
+        self.assertEqual(self._round_points(self.session_rounds[0]), 4)
+        self.assertEqual(self._round_points(self.session_rounds[1]), 5)
+
+    def test_score_answer_does_not_reaggregate(self):
+        director = SessionDirector(self.session)
+        director.score_answer(self.answers[0], 1)
+
+        with CaptureQueriesContext(connection) as first:
+            director.score_answer(self.answers[1], 2)
+        director.score_answer(self.answers[2], 3)
+        with CaptureQueriesContext(connection) as later:
+            director.score_answer(self.answers[3], 4)
+
+        self.assertEqual(len(first.captured_queries), len(later.captured_queries))
+        self.assertFalse(
+            any(
+                "SUM" in q["sql"] and "quiz_sessionteam" in q["sql"]
+                for q in later.captured_queries
+            )
+        )
+
+    def test_score_answers_batch_updates_totals(self):
+        SessionDirector(self.session).score_answers(
+            [(self.answers[0], 2), (self.answers[1], 3), (self.answers[2], 10)]
+        )
+
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.score, 15)
+        self.assertEqual(self._round_points(self.session_rounds[0]), 5)
+        self.assertEqual(self._round_points(self.session_rounds[1]), 10)
+
+    def test_complete_round_freezes_round_scores(self):
+        director = SessionDirector(self.session)
+        director.score_answers([(self.answers[0], 7), (self.answers[1], 2)])
+        self.session.status = GameSession.Status.SCORING
+        self.session.current_round = self.rounds[0]
+        self.session.save()
+
+        director.complete_round()
+
+        rows = TeamRoundScore.objects.filter(session_round=self.session_rounds[0])
+        self.assertEqual(
+            {(r.team_id, r.points, r.max_points, r.frozen) for r in rows},
+            {(self.team.id, 9, 20, True), (self.teams[1].id, 0, 20, True)},
+        )
+
+    def test_repair_fixes_drifted_totals(self):
+        SessionDirector(self.session).score_answer(self.answers[0], 6)
+        # An edit that bypasses the director, as the Django admin does.
+        TeamAnswer.objects.filter(id=self.answers[2].id).update(points_awarded=8)
+        SessionTeam.objects.filter(id=self.teams[1].id).update(score=99)
+
+        count = standings.repair(GameSession.objects.filter(id=self.session.id))
+
+        self.assertEqual(count, 2)
+        self.team.refresh_from_db()
+        self.teams[1].refresh_from_db()
+        self.assertEqual(self.team.score, 14)
+        self.assertEqual(self.teams[1].score, 0)
+        self.assertEqual(self._round_points(self.session_rounds[0]), 6)
+        self.assertEqual(self._round_points(self.session_rounds[1]), 8)
+
+
 # ----------------------------------------------------------------------------
 # Integration: lock_round + scorer for Ranking
 # ----------------------------------------------------------------------------
@@ -351,9 +637,119 @@ class LockRoundWithRankingTest(TestCase):
         for pa in parts:
             self.assertEqual(pa.points_awarded, 1)
 
+        # Auto-scored points reach the running totals at lock time.
+        team.refresh_from_db()
+        self.assertEqual(team.score, 3)
+        self.assertEqual(
+            TeamRoundScore.objects.get(team=team, session_round=sr).points, 3
+        )
+
         # The combined (pre-split) TeamAnswer is gone.
         self.assertFalse(
             TeamAnswer.objects.filter(
                 team=team, question=q, answer_part__isnull=True
             ).exists()
         )
+
+
+class LockRoundWithEstimationTest(TestCase):
+    def test_estimation_scored_across_teams_at_lock(self):
+        """Test that lock_round ranks every team's guess against the others"""
+        game = Game.objects.create(subtitle="G")
+        rnd = QuestionRound.objects.create(name="R1", round_number=1)
+        q = Question.objects.create(
+            game=game,
+            question_type=QuestionType.objects.create(name="Estimation"),
+            question_number=1,
+            text="How tall is Everest in metres?",
+            total_points=2,
+            game_round=rnd,
+        )
+        Answer.objects.create(question=q, answer_text="8849")
+        session = GameSession.objects.create(game=game, admin_name="A")
+        SessionRound.objects.create(session=session, round=rnd)
+        teams = [
+            SessionTeam.objects.create(session=session, name=f"T{i}") for i in range(4)
+        ]
+        SessionDirector(session).start()
+        session.refresh_from_db()
+        sr = session.session_rounds.get(round=rnd)
+        for team, guess in zip(teams, ["9,000", "8000", "10k"]):
+            TeamAnswer.objects.create(
+                team=team, question=q, session_round=sr, answer_text=guess
+            )
+
+        SessionDirector(session).lock_round()
+
+        points = {
+            a.team_id: a.points_awarded for a in TeamAnswer.objects.filter(question=q)
+        }
+        self.assertEqual(
+            [points[team.id] for team in teams], [2, 1, 0, 0]
+        )  # closest, within 10%, neither, no answer
+        self.assertEqual(
+            [t.score for t in SessionTeam.objects.order_by("id")], [2, 1, 0, 0]
+        )
+
+
+class ContentEditedMidGameTest(TestCase):
+    """Edits made in the admin after start don't reach the running session."""
+
+    def setUp(self):
+        game = Game.objects.create(subtitle="G")
+        self.round = QuestionRound.objects.create(name="R1", round_number=1)
+        open_ended = QuestionType.objects.create(name="Multiple Open Ended")
+        self.question = Question.objects.create(
+            game=game,
+            question_type=open_ended,
+            question_number=2,
+            text="Name two capitals",
+            total_points=2,
+            game_round=self.round,
+        )
+        for i, city in enumerate(["Paris", "Rome"], start=1):
+            Answer.objects.create(
+                question=self.question, answer_text=city, display_order=i, points=1
+            )
+        self.session = GameSession.objects.create(game=game, admin_name="A")
+        self.session_round = SessionRound.objects.create(
+            session=self.session, round=self.round
+        )
+        self.team = SessionTeam.objects.create(session=self.session, name="T1")
+        SessionDirector(self.session).start()
+        self.session.refresh_from_db()
+
+        # Mid-game edits: a third part and an earlier question in the round
+        Answer.objects.create(
+            question=self.question, answer_text="Madrid", display_order=3, points=1
+        )
+        Question.objects.create(
+            game=game,
+            question_type=open_ended,
+            question_number=1,
+            text="Added late",
+            total_points=5,
+            game_round=self.round,
+        )
+
+    def test_round_runs_on_the_snapshot(self):
+        TeamAnswer.objects.create(
+            team=self.team,
+            question=self.question,
+            session_round=self.session_round,
+            answer_text=json.dumps(["Paris", "Rome"]),
+        )
+
+        SessionDirector(self.session).lock_round()
+        parts = TeamAnswer.objects.filter(team=self.team, question=self.question)
+        self.assertEqual(parts.count(), 2)
+
+        SessionDirector(self.session).score_answers([(part, 1) for part in parts])
+        result = SessionDirector(self.session).complete_round()
+
+        self.assertEqual(result["status"], "reviewing")
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.current_question_id, self.question.id)
+        self.assertEqual(
+            TeamRoundScore.objects.get(session_round=self.session_round).max_points, 2
+        )
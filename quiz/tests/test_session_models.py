@@ -13,6 +13,7 @@ from quiz.models import (
     QuestionType,
     QuestionRound,
     GameSession,
+    SessionEvent,
     SessionTeam,
     SessionRound,
     TeamAnswer,
@@ -95,6 +96,61 @@ class GameSessionModelTest(TestCase):
         self.assertEqual(session.status, GameSession.Status.COMPLETED)
         self.assertIsNone(session.status_before_pause)
 
+    def test_pause_stale_pauses_only_live_sessions_with_stale_host(self):
+        """Test the set-based pause used by the admin-timeout sweeper"""
+        stale = timezone.now() - timedelta(minutes=5)
+        playing = GameSession.objects.create(
+            game=self.game, status=GameSession.Status.PLAYING
+        )
+        lobby = GameSession.objects.create(
+            game=self.game, status=GameSession.Status.LOBBY
+        )
+        fresh = GameSession.objects.create(
+            game=self.game, status=GameSession.Status.PLAYING
+        )
+        GameSession.objects.filter(id__in=[playing.id, lobby.id]).update(
+            admin_last_seen=stale
+        )
+
+        paused = GameSession.pause_stale(timezone.now() - timedelta(seconds=30))
+
+        self.assertEqual(paused, [playing.code])
+        playing.refresh_from_db()
+        self.assertEqual(playing.status, GameSession.Status.PAUSED)
+        self.assertEqual(playing.status_before_pause, GameSession.Status.PLAYING)
+        self.assertEqual(playing.state_version, 1)
+        event = playing.events.get()
+        self.assertEqual((event.seq, event.kind), (1, SessionEvent.Kind.PAUSED))
+        lobby.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertEqual(lobby.status, GameSession.Status.LOBBY)
+        self.assertEqual(fresh.status, GameSession.Status.PLAYING)
+
+    def test_save_bumps_state_version(self):
+        """Test that full saves bump the state version and heartbeats do not"""
+        session = GameSession.objects.create(game=self.game, admin_name="Host")
+        self.assertEqual(session.state_version, 0)
+
+        session.status = GameSession.Status.PLAYING
+        session.save()
+        self.assertEqual(session.state_version, 1)
+
+        session.admin_last_seen = timezone.now()
+        session.save(update_fields=["admin_last_seen"])
+        session.refresh_from_db()
+        self.assertEqual(session.state_version, 1)
+
+    def test_stale_copy_cannot_rewind_state_version(self):
+        """Test that saving a stale instance still moves the version forward"""
+        session = GameSession.objects.create(game=self.game, admin_name="Host")
+        stale = GameSession.objects.get(pk=session.pk)
+
+        session.bump_state_version()
+        session.bump_state_version()
+        stale.save()
+
+        self.assertEqual(stale.state_version, 3)
+
     def test_session_ordering(self):
         """Test that sessions are ordered by creation date descending"""
         session1 = GameSession.objects.create(game=self.game, admin_name="Host 1")
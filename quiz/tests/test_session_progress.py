@@ -0,0 +1,134 @@
+"""
+Tests for the cached submission/scoring counters in quiz.session_progress.
+"""
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from quiz import session_content, session_progress
+from quiz.models import (
+    Game,
+    GameSession,
+    Question,
+    QuestionRound,
+    QuestionType,
+    SessionRound,
+    SessionTeam,
+    TeamAnswer,
+)
+from quiz.session_api import _build_session_state
+from quiz.session_director import InvalidTransition, SessionDirector
+
+
+class SessionProgressTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.game = Game.objects.create(subtitle="Test Game")
+        self.round = QuestionRound.objects.create(name="Round 1", round_number=1)
+        q_type = QuestionType.objects.create(name="Multiple Choice")
+        self.questions = [
+            Question.objects.create(
+                game=self.game,
+                question_type=q_type,
+                game_round=self.round,
+                text=f"Q{number}",
+                question_number=number,
+                total_points=5,
+            )
+            for number in (1, 2)
+        ]
+        self.session = GameSession.objects.create(game=self.game, admin_name="Host")
+        SessionRound.objects.create(session=self.session, round=self.round)
+        session_content.store(self.session)
+        self.teams = [
+            SessionTeam.objects.create(session=self.session, name=f"Team {i}")
+            for i in (1, 2)
+        ]
+        SessionDirector(self.session).start()
+        self.session.refresh_from_db()
+
+    def submit(self, team, question, text):
+        return self.client.post(
+            reverse("quiz:session_team_answer", args=[self.session.code]),
+            data={"question_id": question.id, "answer_text": text},
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {team.token}",
+        )
+
+    def progress(self):
+        return session_progress.submissions(
+            self.session,
+            [q.id for q in self.questions],
+            self.questions[0].id,
+            [t.id for t in self.teams],
+        )
+
+    def test_submissions_counted_once_per_team(self):
+        """Test that re-submitting doesn't count twice and clearing uncounts"""
+        self.submit(self.teams[0], self.questions[0], "Paris")
+        self.submit(self.teams[0], self.questions[0], "Lyon")
+        self.submit(self.teams[1], self.questions[0], "Rome")
+        self.submit(self.teams[1], self.questions[0], "")
+
+        counts, answered = self.progress()
+
+        self.assertEqual(counts, {self.questions[0].id: 1, self.questions[1].id: 0})
+        self.assertEqual(answered, {self.teams[0].id})
+
+    def test_state_build_skips_answer_counts(self):
+        """Test that a warm poll build doesn't count TeamAnswer rows"""
+        self.submit(self.teams[0], self.questions[0], "Paris")
+        self.progress()  # warm
+
+        with CaptureQueriesContext(connection) as ctx:
+            state = _build_session_state(self.session)
+
+        self.assertEqual(state["round_progress"][0]["submitted_count"], 1)
+        self.assertTrue(state["teams"][0]["has_answered_current"])
+        self.assertFalse(
+            any('"quiz_teamanswer"' in q["sql"] for q in ctx.captured_queries)
+        )
+
+    def test_cold_cache_rebuilds_from_db(self):
+        """Test that lost counters are recomputed from the answers"""
+        self.submit(self.teams[0], self.questions[1], "Paris")
+        cache.clear()
+
+        counts, _ = self.progress()
+
+        self.assertEqual(counts[self.questions[1].id], 1)
+
+    def test_lock_and_scoring_move_unscored(self):
+        """Test that lock sets unscored counts and scoring works them down"""
+        self.submit(self.teams[0], self.questions[0], "Paris")
+        director = SessionDirector(self.session)
+        director.lock_round()
+        question_ids = [q.id for q in self.questions]
+
+        self.assertEqual(session_progress.unscored(self.session, question_ids), 1)
+
+        director.score_answer(TeamAnswer.objects.get(answer_text="Paris"), 5)
+        self.assertEqual(session_progress.unscored(self.session, question_ids), 0)
+
+    def test_drifted_counter_does_not_block_completion(self):
+        """Test that complete_round double-checks a refusal against the DB"""
+        director = SessionDirector(self.session)
+        director.lock_round()
+        session_progress.set_unscored(self.session.code, {self.questions[0].id: 3})
+
+        result = director.complete_round()
+
+        self.assertEqual(result["status"], "reviewing")
+
+    def test_counter_at_zero_does_not_skip_unscored_answers(self):
+        """Test that complete_round checks the DB even when the counter says 0"""
+        self.submit(self.teams[0], self.questions[0], "Paris")
+        director = SessionDirector(self.session)
+        director.lock_round()
+        session_progress.set_unscored(self.session.code, {self.questions[0].id: 0})
+
+        with self.assertRaisesMessage(InvalidTransition, "1 answers still need"):
+            director.complete_round()
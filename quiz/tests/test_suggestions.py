@@ -0,0 +1,203 @@
+"""
+Tests for fuzzy point suggestions on free-text answers (quiz.suggestions).
+"""
+
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from quiz import session_content, suggestions
+from quiz.models import (
+    Answer,
+    Game,
+    GameSession,
+    Question,
+    QuestionRound,
+    QuestionType,
+    SessionRound,
+    SessionTeam,
+    TeamAnswer,
+)
+
+
+class AlternatesTest(SimpleTestCase):
+    def test_parenthesized_and_slashed_forms(self):
+        """Test that each listed alternative is accepted on its own"""
+        self.assertEqual(
+            suggestions.alternates("Heptagon (or Septagon)"),
+            ["heptagon or septagon", "heptagon", "septagon"],
+        )
+        self.assertEqual(
+            suggestions.alternates("Plastic wrap/Saran wrap"),
+            ["plastic wrap saran wrap", "plastic wrap", "saran wrap"],
+        )
+
+    def test_numbers_are_not_matched(self):
+        self.assertEqual(suggestions.alternates("1969"), [])
+        self.assertEqual(suggestions.alternates(None), [])
+
+
+class SimilarityTest(SimpleTestCase):
+    def test_one_matrix_for_all_answers(self):
+        """Test that every answer is compared with every reference"""
+        scores = suggestions.similarity(["paris", "pariss", "lyon"], ["paris", "rome"])
+
+        self.assertEqual(scores.shape, (3, 2))
+        self.assertEqual(scores[0, 0], 1.0)
+        self.assertGreater(scores[1, 0], 0.9)
+        self.assertEqual(scores[2, 0], 0.0)
+
+
+class ScoringSuggestionAPITest(TestCase):
+    def setUp(self):
+        self.game = Game.objects.create(subtitle="Test Game")
+        self.round = QuestionRound.objects.create(name="Round 1", round_number=1)
+        self.question = Question.objects.create(
+            game=self.game,
+            question_type=QuestionType.objects.create(name="Single Answer"),
+            game_round=self.round,
+            text="Capital of France?",
+            question_number=1,
+            total_points=2,
+        )
+        Answer.objects.create(question=self.question, answer_text="Paris", points=2)
+        self.session = GameSession.objects.create(
+            game=self.game,
+            admin_name="Host",
+            status=GameSession.Status.SCORING,
+            current_round=self.round,
+        )
+        self.session_round = SessionRound.objects.create(
+            session=self.session, round=self.round, status=SessionRound.Status.LOCKED
+        )
+        session_content.store(self.session)
+
+    def answer(self, text, question=None, **kwargs):
+        return TeamAnswer.objects.create(
+            team=SessionTeam.objects.create(session=self.session, name=text or "-"),
+            question=question or self.question,
+            session_round=self.session_round,
+            answer_text=text,
+            is_locked=True,
+            **kwargs,
+        )
+
+    def scoring_data(self, query=""):
+        response = self.client.get(
+            reverse("quiz:session_admin_scoring", args=[self.session.code]) + query,
+            HTTP_AUTHORIZATION=f"Bearer {self.session.admin_token}",
+        )
+        return {
+            a["answer_text"]: (a["suggested_points"], a["suggestion_confidence"])
+            for a in response.json()["questions"][0]["team_answers"]
+        }
+
+    def test_suggestions_in_scoring_payload(self):
+        """Test that clear matches and misses are pre-scored, the rest left open"""
+        for text in ("Paris", "Pariss", "Paris France", "Lyon", ""):
+            self.answer(text)
+
+        self.assertEqual(
+            self.scoring_data(),
+            {
+                "Paris": (2, "high"),
+                "Pariss": (2, "high"),
+                "Paris France": (None, "ambiguous"),
+                "Lyon": (0, "high"),
+                "": (0, "high"),
+            },
+        )
+
+    @override_settings(SCORING_SUGGESTION_THRESHOLDS={"accept": 0.6})
+    def test_thresholds_are_configurable(self):
+        self.answer("Paris France")
+
+        self.assertEqual(self.scoring_data()["Paris France"], (2, "high"))
+
+    def test_no_suggestion_for_ranking(self):
+        """Test that auto-scored question types get no suggestions"""
+        self.question.question_type = QuestionType.objects.create(name="Ranking")
+        self.question.save()
+        session_content.store(self.session)
+        question = session_content.for_session(self.session).question(self.question.id)
+
+        self.assertEqual(suggestions.suggest(question, [self.answer("Paris")]), {})
+
+    def test_parts_match_their_own_answer(self):
+        """Test that a part answer is compared with its part only"""
+        question = Question.objects.create(
+            game=self.game,
+            question_type=QuestionType.objects.create(name="Multiple Open Ended"),
+            game_round=self.round,
+            text="Name the two capitals",
+            question_number=2,
+            total_points=2,
+        )
+        france = Answer.objects.create(
+            question=question, answer_text="Paris", points=1, display_order=1
+        )
+        Answer.objects.create(
+            question=question, answer_text="Rome", points=1, display_order=2
+        )
+        team_answer = self.answer("Rome", question=question, answer_part=france)
+        session_content.store(self.session)
+
+        suggested = suggestions.suggest(
+            session_content.for_session(self.session).question(question.id),
+            [team_answer],
+        )
+
+        self.assertEqual(suggested[team_answer.id]["suggested_points"], 0)
+
+    def test_each_part_compared_with_its_own_forms_only(self):
+        """Test that one pass scores the question, masked to each part's forms"""
+        question = Question.objects.create(
+            game=self.game,
+            question_type=QuestionType.objects.create(name="Multiple Open Ended"),
+            game_round=self.round,
+            text="Name the two capitals",
+            question_number=2,
+            total_points=2,
+        )
+        parts = [
+            Answer.objects.create(
+                question=question, answer_text=city, points=1, display_order=i
+            )
+            for i, city in enumerate(["Paris", "Rome"], 1)
+        ]
+        team_answers = [
+            self.answer(text, question=question, answer_part=part)
+            for text, part in (("Paris", parts[0]), ("Rome", parts[1]))
+        ]
+        session_content.store(self.session)
+
+        with patch.object(
+            suggestions, "similarity", wraps=suggestions.similarity
+        ) as similarity:
+            suggested = suggestions.suggest(
+                session_content.for_session(self.session).question(question.id),
+                team_answers,
+            )
+
+        self.assertEqual(
+            [call.args for call in similarity.call_args_list],
+            [(["paris", "rome"], ["paris", "rome"])],
+        )
+        self.assertEqual(
+            [suggested[a.id]["suggested_points"] for a in team_answers], [1, 1]
+        )
+
+    def test_clusters_carry_suggestion(self):
+        for text in ("Paris", "paris"):
+            self.answer(text)
+
+        response = self.client.get(
+            reverse("quiz:session_admin_scoring", args=[self.session.code])
+            + "?group=clusters",
+            HTTP_AUTHORIZATION=f"Bearer {self.session.admin_token}",
+        )
+
+        cluster = response.json()["questions"][0]["clusters"][0]
+        self.assertEqual(cluster["suggested_points"], 2)
+        self.assertEqual(cluster["suggestion_confidence"], "high")
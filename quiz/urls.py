@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path, include
 from . import views, session_api, session_views
 from rest_framework.routers import DefaultRouter
@@ -5,6 +6,12 @@ from .api import GameViewSet, QuestionViewSet
 
 app_name = "quiz"
 
+
+def poll_view(sync_view, async_view):
+    """The async variant of a polled endpoint when SESSION_ASYNC_VIEWS is on."""
+    return async_view if settings.SESSION_ASYNC_VIEWS else sync_view
+
+
 router = DefaultRouter()
 router.register(r"games", GameViewSet, basename="game")
 router.register(r"questions", QuestionViewSet, basename="question")
@@ -72,9 +79,19 @@ urlpatterns = [
     ),
     path(
         "api/sessions/<str:code>/state/",
-        session_api.get_session_state,
+        poll_view(session_api.get_session_state, session_api.aget_session_state),
         name="session_state",
     ),
+    path(
+        "api/sessions/<str:code>/events/",
+        session_api.get_session_events,
+        name="session_events",
+    ),
+    path(
+        "api/sessions/<str:code>/stream/",
+        session_api.session_event_stream,
+        name="session_stream",
+    ),
     path(
         "api/sessions/<str:code>/validate/",
         session_api.validate_session_access,
@@ -116,6 +133,16 @@ urlpatterns = [
         session_api.admin_score_answer,
         name="session_admin_score",
     ),
+    path(
+        "api/sessions/<str:code>/admin/score-batch/",
+        session_api.admin_score_batch,
+        name="session_admin_score_batch",
+    ),
+    path(
+        "api/sessions/<str:code>/admin/score-cluster/",
+        session_api.admin_score_cluster,
+        name="session_admin_score_cluster",
+    ),
     path(
         "api/sessions/<str:code>/admin/complete-round/",
         session_api.admin_complete_round,
@@ -133,7 +160,7 @@ urlpatterns = [
     ),
     path(
         "api/sessions/<str:code>/leaderboard/",
-        session_api.get_leaderboard_data,
+        poll_view(session_api.get_leaderboard_data, session_api.aget_leaderboard_data),
         name="session_leaderboard",
     ),
     # Session API - Team
@@ -142,14 +169,22 @@ urlpatterns = [
         session_api.team_submit_answer,
         name="session_team_answer",
     ),
+    path(
+        "api/sessions/<str:code>/team/answers-batch/",
+        session_api.team_submit_answers_batch,
+        name="session_team_answers_batch",
+    ),
     path(
         "api/sessions/<str:code>/team/answers/",
-        session_api.team_get_answers,
+        poll_view(session_api.team_get_answers, session_api.ateam_get_answers),
         name="session_team_answers",
     ),
     path(
         "api/sessions/<str:code>/team/question/",
-        session_api.team_get_question_details,
+        poll_view(
+            session_api.team_get_question_details,
+            session_api.ateam_get_question_details,
+        ),
         name="session_team_question",
     ),
     path(